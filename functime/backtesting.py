@@ -1,7 +1,10 @@
-from typing import Any, Callable, Mapping, Optional, Tuple
+import os
+import tempfile
+from typing import Any, Callable, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import polars as pl
+from joblib import Parallel, delayed
 
 from functime.base import Forecaster
 from functime.forecasting._reduction import make_direct_reduction, make_reduction
@@ -102,57 +105,140 @@ def _merge_autoreg_residuals(
     return y_resids
 
 
+def _load_frame(df: Optional[Union[pl.DataFrame, str]]) -> Optional[pl.DataFrame]:
+    # Frames shared with worker processes are memory-mapped from Arrow IPC files
+    if isinstance(df, str):
+        return pl.read_ipc(df, memory_map=True)
+    return df
+
+
+def _share_frames(
+    splits: Mapping[int, Tuple[pl.DataFrame, pl.DataFrame]], name: str, tmp_dir: str
+) -> Mapping[int, Tuple[str, str]]:
+    paths = {}
+    for i, split in splits.items():
+        split_paths = []
+        for df, fold in zip(split, ["train", "test"]):
+            path = os.path.join(tmp_dir, f"{name}_{fold}_{i}.arrow")
+            # NOTE: IPC files must be uncompressed to be memory-mapped
+            df.lazy().collect().write_ipc(path, compression="uncompressed")
+            split_paths.append(path)
+        paths[i] = tuple(split_paths)
+    return paths
+
+
+def _backtest_split(
+    forecaster: Forecaster,
+    split: int,
+    y_train: Union[pl.DataFrame, str],
+    y_test: Union[pl.DataFrame, str],
+    X_train: Optional[Union[pl.DataFrame, str]] = None,
+    X_test: Optional[Union[pl.DataFrame, str]] = None,
+    residualize: bool = True,
+) -> Tuple[int, pl.DataFrame, Optional[pl.DataFrame]]:
+    # Worker processes do not inherit the global string cache
+    pl.enable_string_cache(True)
+    y_train, y_test, X_train, X_test = (
+        _load_frame(df) for df in (y_train, y_test, X_train, X_test)
+    )
+    entity_col = y_train.columns[0]
+    fh = int(
+        y_test.lazy()
+        .select(pl.count() / pl.col(entity_col).n_unique())
+        .collect(streaming=True)
+        .item()
+    )
+    # Forecast
+    forecaster = forecaster.fit(y=y_train, X=X_train)
+    y_pred = forecaster.predict(fh=fh, X=X_test)
+    # Coerce split column names back into original names
+    y_pred = y_pred.select(y_pred.columns[:3]).with_columns(
+        pl.lit(split).alias("split")
+    )
+    y_resid = None
+    if residualize:
+        # Residuals
+        y_resid = _residualize_autoreg(
+            y_train=y_train,
+            X_train=X_train,
+            strategy=forecaster.state.strategy,
+            lags=forecaster.lags,
+            max_horizons=forecaster.max_horizons,
+            artifacts=forecaster.state.artifacts,
+        )
+        y_resid = y_resid.with_columns(pl.lit(split).alias("split"))
+    return split, y_pred, y_resid
+
+
 def backtest(
     forecaster: Forecaster,
     y: pl.DataFrame,
     cv: Callable[[pl.DataFrame], Mapping[int, pl.DataFrame]],
     X: Optional[pl.DataFrame] = None,
     residualize: bool = True,
+    n_jobs: int = 1,
 ) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    """Backtest forecaster over CV splits, then refit forecaster on the full data.
+
+    Parameters
+    ----------
+    forecaster : Forecaster
+        Forecaster to backtest.
+    y : pl.DataFrame
+        Panel target variable.
+    cv : Callable[[pl.DataFrame], Mapping[int, pl.DataFrame]]
+        Splitter that returns (train, test) splits keyed by split number.
+    X : Optional[pl.DataFrame]
+        Panel exogenous features.
+    residualize : bool
+        If True, also return in-sample residuals for every split.
+    n_jobs : int
+        Number of splits backtested in parallel on a process pool. Defaults to 1.
+        -1 means using all processors. Splits are shared with worker processes
+        as memory-mapped Arrow IPC files instead of being pickled.
+
+    Returns
+    -------
+    y_preds : pl.DataFrame
+        Predictions for every split.
+    y_resids : pl.DataFrame
+        Residuals for every split. Only returned if `residualize` is True.
+    """
     pl.enable_string_cache(True)
-    entity_col = y.columns[0]
     y_splits = cv(y)
     X_splits = X if X is None else cv(X)
-    y_preds = []
-    y_resids = []
-    for i in range(len(y_splits)):
-        y_train, y_test = y_splits[i]
-        fh = int(
-            y_test.lazy()
-            .select(pl.count() / pl.col(entity_col).n_unique())
-            .collect(streaming=True)
-            .item()
-        )
-        X_train, X_test = X_splits[i] if X is not None else None, None
-        # Forecast
-        forecaster = forecaster.fit(y=y_train, X=X_train)
-        y_pred = forecaster.predict(fh=fh, X=X_test)
-        # Coerce split column names back into original names
-        y_pred = y_pred.select(y_pred.columns[:3]).with_columns(
-            pl.lit(i).alias("split")
-        )
-        # Append results
-        y_preds.append(y_pred)
-        if residualize:
-            # Residuals
-            y_resid = _residualize_autoreg(
-                y_train=y_train,
-                X_train=X_train,
-                strategy=forecaster.state["strategy"],
-                lags=forecaster.lags,
-                max_horizons=forecaster.max_horizons,
-                artifacts=forecaster.state["artifacts"],
+    n_splits = len(y_splits)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if n_jobs != 1:
+            y_splits = _share_frames(y_splits, name="y", tmp_dir=tmp_dir)
+            if X is not None:
+                X_splits = _share_frames(X_splits, name="X", tmp_dir=tmp_dir)
+        results = Parallel(n_jobs=n_jobs, return_as="generator_unordered")(
+            delayed(_backtest_split)(
+                forecaster=forecaster,
+                split=i,
+                y_train=y_splits[i][0],
+                y_test=y_splits[i][1],
+                X_train=X_splits[i][0] if X is not None else None,
+                X_test=X_splits[i][1] if X is not None else None,
+                residualize=residualize,
             )
-            y_resid = y_resid.with_columns(pl.lit(i).alias("split"))
-            y_resids.append(y_resid)
+            for i in range(n_splits)
+        )
+        y_preds = {}
+        y_resids = {}
+        # Gather results as splits complete
+        for i, y_pred, y_resid in results:
+            y_preds[i] = y_pred
+            y_resids[i] = y_resid
 
-    y_preds = pl.concat(y_preds)
+    y_preds = pl.concat([y_preds[i] for i in range(n_splits)])
     full_model = forecaster.fit(y=y, X=X)
     if residualize:
         y_resids = _merge_autoreg_residuals(
             y=y,
             X=X,
-            y_resids=pl.concat(y_resids),
+            y_resids=pl.concat([y_resids[i] for i in range(n_splits)]),
             strategy=full_model.state.strategy,
             lags=forecaster.lags,
             max_horizons=forecaster.max_horizons,
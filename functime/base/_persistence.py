@@ -0,0 +1,148 @@
+"""
+Save and load fitted models with frames and boosters stored in their native formats.
+
+A saved model is a directory with one pickle of the model object and one file per
+artifact. Every `pl.DataFrame` (e.g. `y_lag`, `__cutoffs`, entity indexes) is written
+as an uncompressed Arrow IPC file, so that it can be memory-mapped on load. LightGBM,
+XGBoost and CatBoost boosters are written with their own `save_model`. Everything
+else (e.g. scikit-learn estimators) stays in the pickle.
+"""
+
+import os
+import shutil
+import sys
+from typing import Any, Optional, Tuple, Type
+
+import cloudpickle
+import polars as pl
+
+MODEL_FILENAME = "model.pkl"
+ARTIFACTS_DIRNAME = "artifacts"
+
+
+def _booster_format(obj: Any) -> Optional[str]:
+    # NOTE: Only check backends that are already imported
+    lightgbm = sys.modules.get("lightgbm")
+    if lightgbm is not None and isinstance(obj, lightgbm.Booster):
+        return "lightgbm"
+    xgboost = sys.modules.get("xgboost")
+    if xgboost is not None and isinstance(obj, xgboost.Booster):
+        return "xgboost"
+    catboost = sys.modules.get("catboost")
+    if catboost is not None and isinstance(obj, catboost.CatBoost):
+        return "catboost"
+    return None
+
+
+def _save_booster(booster: Any, fmt: str, path: str) -> None:
+    if fmt == "catboost":
+        booster.save_model(path, format="cbm")
+    else:
+        booster.save_model(path)
+
+
+def _load_booster(fmt: str, path: str, cls: Optional[Type] = None) -> Any:
+    if fmt == "lightgbm":
+        from lightgbm import Booster
+
+        return Booster(model_file=path)
+    if fmt == "xgboost":
+        from xgboost import Booster
+
+        booster = Booster()
+        booster.load_model(path)
+        return booster
+    if fmt == "catboost":
+        # NOTE: Load into the saved subclass (e.g. `CatBoostRegressor`), whose
+        # `predict` differs from the base `CatBoost` (e.g. exponent of Poisson models)
+        return cls().load_model(path)
+    raise ValueError(f"Unsupported booster format: {fmt}")
+
+
+_EXTENSIONS = {
+    "frame": "arrow",
+    "lightgbm": "txt",
+    "xgboost": "ubj",
+    "catboost": "cbm",
+}
+
+
+class _ArtifactPickler(cloudpickle.CloudPickler):
+    def __init__(self, file, artifacts_dir: str):
+        super().__init__(file)
+        self.artifacts_dir = artifacts_dir
+        self.n_artifacts = 0
+
+    def _artifact_filename(self, fmt: str) -> str:
+        filename = f"{self.n_artifacts}.{_EXTENSIONS[fmt]}"
+        self.n_artifacts += 1
+        return filename
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple]:
+        if isinstance(obj, pl.DataFrame):
+            filename = self._artifact_filename("frame")
+            path = os.path.join(self.artifacts_dir, filename)
+            # NOTE: IPC files must be uncompressed to be memory-mapped
+            obj.write_ipc(path, compression="uncompressed")
+            return "frame", filename
+        fmt = _booster_format(obj)
+        if fmt is not None:
+            filename = self._artifact_filename(fmt)
+            _save_booster(obj, fmt, os.path.join(self.artifacts_dir, filename))
+            if fmt == "catboost":
+                return fmt, filename, type(obj)
+            return fmt, filename
+        return None
+
+
+class _ArtifactUnpickler(cloudpickle.pickle.Unpickler):
+    def __init__(self, file, artifacts_dir: str, mmap: bool):
+        super().__init__(file)
+        self.artifacts_dir = artifacts_dir
+        self.mmap = mmap
+
+    def persistent_load(self, pid: Tuple) -> Any:
+        fmt, filename, *cls = pid
+        path = os.path.join(self.artifacts_dir, filename)
+        if fmt == "frame":
+            return pl.read_ipc(path, memory_map=self.mmap, rechunk=False)
+        return _load_booster(fmt, path, *cls)
+
+
+def save_model(model: Any, path: str) -> None:
+    """Save `model` into directory `path`, writing frames and boosters natively.
+
+    Parameters
+    ----------
+    model : Any
+        Fitted model.
+    path : str
+        Output directory. Created if it does not exist. Artifacts of a model
+        previously saved into `path` are removed.
+    """
+    artifacts_dir = os.path.join(path, ARTIFACTS_DIRNAME)
+    # Artifacts are numbered per save, so stale files would never be overwritten
+    shutil.rmtree(artifacts_dir, ignore_errors=True)
+    os.makedirs(artifacts_dir)
+    with open(os.path.join(path, MODEL_FILENAME), "wb") as f:
+        _ArtifactPickler(f, artifacts_dir=artifacts_dir).dump(model)
+
+
+def load_model(path: str, mmap: bool = True) -> Any:
+    """Load model saved with `save_model` from directory `path`.
+
+    Parameters
+    ----------
+    path : str
+        Directory the model was saved into.
+    mmap : bool
+        If True, memory-map frame artifacts instead of reading them into memory.
+
+    Returns
+    -------
+    model : Any
+        Fitted model.
+    """
+    artifacts_dir = os.path.join(path, ARTIFACTS_DIRNAME)
+    with open(os.path.join(path, MODEL_FILENAME), "rb") as f:
+        return _ArtifactUnpickler(f, artifacts_dir=artifacts_dir, mmap=mmap).load()
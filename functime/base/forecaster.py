@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Callable, List, Optional, Tuple, TypeVar, Union
 
 import polars as pl
@@ -13,6 +13,7 @@ P = ParamSpec("P")
 R = Tuple[TypeVar("fit", bound=Callable), TypeVar("predict", bound=Callable)]
 
 FORECAST_STRATEGIES = Optional[Literal["direct", "recursive", "naive"]]
+PREDICT_ENGINES = Literal["numpy", "polars"]
 DF_TYPE = Union[pl.LazyFrame, pl.DataFrame]
 
 
@@ -38,22 +39,48 @@ class Forecaster(Model):
     strategy : Optional[str]
         Forecasting strategy. Currently supports "recursive", "direct",
         and "ensemble" of both recursive and direct strategies.
+    engine : str
+        Recursive prediction engine. "numpy" (default) rolls a dense lag matrix
+        in place every horizon step. "polars" rebuilds the lagged list columns
+        every step. Both engines return identical forecasts.
+    direct_n_jobs : int
+        Number of horizon models fitted in parallel if `strategy` equals "direct"
+        or "ensemble". Defaults to 1. -1 means using all processors.
+    memory_budget : Optional[int]
+        If set, `y` and `X` (e.g. `pl.scan_parquet`) are never collected at once.
+        Lagged features are built per batch of entities of at most `memory_budget`
+        bytes and streamed into the regressor's incremental dataset builder.
+        Only supported by `lightgbm`, `xgboost`, and the linear forecasters.
     **kwargs : Mapping[str, Any]
         Additional keyword arguments passed into underlying sklearn-compatible estimator.
     """
 
+    # Whether `_fit` streams lagged features per batch if `memory_budget` is set
+    _supports_batches: bool = False
+    memory_budget: Optional[int] = None
+
     def __init__(
         self,
         freq: Union[str, None],
         lags: int,
         max_horizons: Optional[int] = None,
         strategy: FORECAST_STRATEGIES = None,
+        engine: PREDICT_ENGINES = "numpy",
+        direct_n_jobs: int = 1,
+        memory_budget: Optional[int] = None,
         **kwargs,
     ):
+        if memory_budget is not None and not self._supports_batches:
+            raise ValueError(
+                f"`memory_budget` is not supported by `{self.__class__.__name__}`"
+            )
         self.freq = freq
         self.lags = lags
         self.max_horizons = max_horizons
         self.strategy = strategy
+        self.engine = engine
+        self.direct_n_jobs = direct_n_jobs
+        self.memory_budget = memory_budget
         self.kwargs = kwargs
         super().__init__()
 
@@ -72,10 +99,14 @@ class Forecaster(Model):
         return f"{self.__class__.__name__}(strategy={self.strategy})"
 
     def fit(self, y: DF_TYPE, X: Optional[DF_TYPE] = None):
-        y: pl.LazyFrame = self._set_string_cache(y.lazy().collect()).lazy()
+        # NOTE: Out-of-core fit only collects `y` and `X` per batch of entities
+        out_of_core = self.memory_budget is not None
+        y = y.lazy() if out_of_core else y.lazy().collect()
+        y = self._set_entity_index(y).lazy()
         if X is not None:
             if X.columns[0] == y.columns[0]:
-                X = self._enforce_string_cache(X.lazy().collect())
+                X = X.lazy() if out_of_core else X.lazy().collect()
+                X = self._encode_entities(X)
             X = X.lazy()
         artifacts = self._fit(y=y, X=X)
         cutoffs = y.groupby(y.columns[0]).agg(pl.col(y.columns[1]).max().alias("low"))
@@ -115,7 +146,7 @@ class Forecaster(Model):
             has_time = X.columns[1] == state.time
 
             if has_entity:
-                X = self._enforce_string_cache(X.lazy().collect()).lazy()
+                X = self._encode_entities(X.lazy().collect()).lazy()
 
             if has_entity and not has_time:
                 X = future_ranges.lazy().join(X, on=entity, how="left")
@@ -128,7 +159,7 @@ class Forecaster(Model):
             # Raises: ComputeError: cannot construct Categorical
             # from these categories, at least on of them is out of bounds
             X = X.select(pl.all().exclude(time)).lazy()
-        y_pred_vals = predict_autoreg(self.state, fh=fh, X=X)
+        y_pred_vals = predict_autoreg(self.state, fh=fh, X=X, engine=self.engine)
         y_pred_vals = y_pred_vals.rename(
             {x: y for x, y in zip(y_pred_vals.columns, [entity, target])}
         )
@@ -137,13 +168,113 @@ class Forecaster(Model):
             .join(y_pred_vals.lazy(), on=entity)
             # Explode from wide arrs to long form
             .explode(pl.all().exclude(entity))
-            .pipe(self._reset_string_cache)
+            .pipe(self._decode_entities)
             # NOTE: Cannot use streaming here...
             # Causes change error "cannot append series, data types don't match
             .collect()
         )
         return y_pred
 
+    def update(self, y: DF_TYPE, X: Optional[DF_TYPE] = None, warm_start: bool = False):
+        """Append new observations to the fitted state without refitting.
+
+        Only the new observations (and the last `lags` observations per entity)
+        are reduced into lagged features, i.e. the cost scales with the number
+        of new rows rather than the full history.
+
+        Parameters
+        ----------
+        y : DF_TYPE
+            New observations of previously fitted entities.
+            Every observation must be strictly after its entity's last fitted time.
+        X : Optional[DF_TYPE]
+            Exogenous features of the new observations.
+            Required if `warm_start` is True and the forecaster was fit with `X`.
+        warm_start : bool
+            If True, continue training the fitted regressor(s) on the new observations
+            (e.g. boost extra trees for LightGBM, XGBoost, CatBoost).
+
+        Returns
+        -------
+        self : Forecaster
+            Forecaster with updated state.
+        """
+        from functime.forecasting._ar import update_autoreg
+
+        state = self.state
+        entity, time = state.entity, state.time
+        y = self._encode_entities(y.lazy().collect(), unseen="raise")
+        cutoffs: pl.DataFrame = state.artifacts["__cutoffs"]
+        n_stale = (
+            y.join(cutoffs, on=entity, how="left")
+            .filter(pl.col(time) <= pl.col("low"))
+            .height
+        )
+        if n_stale > 0:
+            raise ValueError(
+                f"`y` contains {n_stale} observations at or before the fitted cutoffs."
+            )
+        if X is not None:
+            X = X.lazy().collect()
+            if X.columns[0] == entity:
+                X = self._encode_entities(X)
+        elif warm_start and state.features:
+            raise ValueError(
+                "`X` must be provided to warm start on exogenous features."
+            )
+        artifacts = update_autoreg(
+            state, y=y, X=X, warm_start=warm_start, freq=self.freq
+        )
+        artifacts["__cutoffs"] = (
+            pl.concat([cutoffs, y.select([entity, pl.col(time).alias("low")])])
+            .groupby(entity)
+            .agg(pl.col("low").max())
+        )
+        self.state = replace(state, artifacts=artifacts)
+        return self
+
+    def save(self, path: str) -> None:
+        """Save fitted forecaster into directory `path`.
+
+        Frame artifacts (e.g. `y_lag`, cutoffs) are written as uncompressed Arrow IPC
+        files and LightGBM / XGBoost / CatBoost boosters in their native formats.
+
+        Parameters
+        ----------
+        path : str
+            Output directory. Created if it does not exist.
+        """
+        from functime.base._persistence import save_model
+
+        save_model(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "Forecaster":
+        """Load forecaster saved with `save` from directory `path`.
+
+        Parameters
+        ----------
+        path : str
+            Directory the forecaster was saved into.
+        mmap : bool
+            If True (default), memory-map frame artifacts instead of reading them
+            into memory.
+
+        Returns
+        -------
+        forecaster : Forecaster
+            Fitted forecaster.
+        """
+        from functime.base._persistence import load_model
+
+        forecaster = load_model(path, mmap=mmap)
+        if not isinstance(forecaster, cls):
+            raise TypeError(
+                f"Expected {cls.__name__}, but {path} contains"
+                f" {forecaster.__class__.__name__}"
+            )
+        return forecaster
+
     def backtest(
         self,
         y: DF_TYPE,
@@ -153,6 +284,7 @@ class Forecaster(Model):
         n_splits: int = 5,
         window_size: int = 10,
         strategy: Literal["expanding", "sliding"] = "expanding",
+        n_jobs: int = 1,
     ):
         from functime.backtesting import backtest
         from functime.cross_validation import (
@@ -179,6 +311,7 @@ class Forecaster(Model):
             X=X,
             cv=cv,
             residualize=True,
+            n_jobs=n_jobs,
         )
         return y_preds, y_resids
 
@@ -195,6 +328,7 @@ class Forecaster(Model):
         window_size: int = 10,
         strategy: Literal["expanding", "sliding"] = "expanding",
         return_results: bool = False,
+        n_jobs: int = 1,
     ) -> pl.DataFrame:
         from functime.conformal import conformalize
 
@@ -207,6 +341,7 @@ class Forecaster(Model):
             n_splits=n_splits,
             window_size=window_size,
             strategy=strategy,
+            n_jobs=n_jobs,
         )
         y_pred = pl.concat(
             [
@@ -3,11 +3,7 @@ from typing import Callable, Union
 
 import polars as pl
 
-from functime.base.model import (
-    _enforce_string_cache,
-    _reset_string_cache,
-    _set_string_cache,
-)
+from functime.base.model import EntityIndex
 
 
 # Simple wrapper to collect y_true, y_pred if lazy
@@ -26,30 +22,25 @@ def metric(score: Callable):
         if isinstance(y_pred, pl.LazyFrame):
             y_pred = y_pred.collect(streaming=True)
 
-        y_true, entity_col_dtype, string_cache, inv_string_cache = y_true.pipe(
-            _set_string_cache
-        )
-        y_pred = y_pred.pipe(_enforce_string_cache, string_cache=string_cache)
+        entity_index = EntityIndex.from_df(y_true)
+        y_true = entity_index.encode(y_true)
+        y_pred = entity_index.encode(y_pred)
         # Coerce columnn names and dtypes
         cols = y_true.columns
         y_pred = y_pred.rename({x: y for x, y in zip(y_pred.columns, cols)}).select(
             [pl.col(col).cast(dtype) for col, dtype in y_true.schema.items()]
         )
 
-        if "y_train" in kwargs:
+        if kwargs.get("y_train") is not None:
             y_train = (
                 kwargs["y_train"]
                 .lazy()
                 .collect(streaming=True)
-                .pipe(_enforce_string_cache, string_cache=string_cache)
+                .pipe(entity_index.encode)
             )
             kwargs["y_train"] = y_train
 
-        scores = score(y_true, y_pred, *args, **kwargs).pipe(
-            _reset_string_cache,
-            inv_string_cache=inv_string_cache,
-            return_dtype=entity_col_dtype,
-        )
+        scores = score(y_true, y_pred, *args, **kwargs).pipe(entity_index.decode)
         return scores
 
     return _score
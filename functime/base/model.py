@@ -1,42 +1,107 @@
 from dataclasses import dataclass
-from typing import Any, Mapping, Protocol, Union
+from typing import Any, Mapping, Optional, Protocol, Union
 
 import polars as pl
+from typing_extensions import Literal
+
+
+class EntityIndex:
+    """Dictionary encoding of entities into contiguous Int32 codes.
+
+    Unique entities are kept once, sorted, in a single-column `pl.DataFrame`
+    (persisted with the model as an Arrow IPC file). The code of an entity is its
+    position in the sorted entities. Encoding and decoding are vectorized hash joins
+    against the index: no Python mapping is built or applied per call.
+
+    Parameters
+    ----------
+    entities : pl.Series
+        Entity column. Categorical entities are indexed by their string values.
+    """
+
+    CODE_COL = "__code"
+
+    def __init__(self, entities: pl.Series):
+        self.dtype = entities.dtype
+        if self.dtype == pl.Categorical:
+            entities = entities.cast(pl.Utf8)
+        self.entities = entities.unique().sort().to_frame()
+
+    @classmethod
+    def from_df(cls, df: Union[pl.DataFrame, pl.LazyFrame]) -> "EntityIndex":
+        # NOTE: Only the entity column is collected if `df` is lazy (e.g. Parquet scan)
+        entity_col = df.columns[0]
+        entities = (
+            df.lazy()
+            .select(pl.col(entity_col).unique())
+            .collect()
+            .get_column(entity_col)
+        )
+        return cls(entities)
+
+    def __len__(self) -> int:
+        return self.entities.height
+
+    def _codes(self, entity_col: str, dtype: pl.DataType) -> pl.DataFrame:
+        # Entity -> code lookup table, keyed by `entity_col` with `dtype`
+        return self.entities.select(
+            [
+                pl.col(self.entities.columns[0]).cast(dtype).alias(entity_col),
+                pl.arange(0, len(self), dtype=pl.Int32).alias(self.CODE_COL),
+            ]
+        )
+
+    def encode(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        unseen: Literal["null", "raise"] = "null",
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """Replace the entity (first) column of `df` with its codes.
+
+        Unseen entities are encoded as null if `unseen` is "null", i.e. their rows
+        lose their identity and also decode to null.
+        If `unseen` is "raise", a `ValueError` is raised (`df` is collected to check).
+        """
+        entity_col = df.columns[0]
+        if df.schema[entity_col] == pl.Categorical:
+            # Reset categorical to string type
+            df = df.with_columns(pl.col(entity_col).cast(pl.Utf8))
+        codes = self._codes(entity_col, dtype=df.schema[entity_col])
+        if isinstance(df, pl.LazyFrame):
+            codes = codes.lazy()
+        df_new = df.join(codes, on=entity_col, how="left").select(
+            [pl.col(self.CODE_COL).alias(entity_col), *df.columns[1:]]
+        )
+        if unseen == "raise":
+            n_unseen = (
+                df_new.lazy()
+                .select(pl.col(entity_col).null_count())
+                .collect()
+                .get_column(entity_col)[0]
+            )
+            if n_unseen > 0:
+                raise ValueError(
+                    f"`{entity_col}` contains {n_unseen} rows of unseen entities."
+                )
+        return df_new
 
-
-def _set_string_cache(df: pl.DataFrame):
-    entity_col = df.columns[0]
-    entities = df.get_column(entity_col).unique()
-    string_cache = {entity: i for i, entity in enumerate(entities)}
-    entity_col_dtype = df.schema[entity_col]
-    if entity_col_dtype == pl.Categorical:
-        # Reset categorical to string type
-        df = df.with_columns(pl.col(entity_col).cast(pl.Utf8))
-    df_new = df.with_columns(
-        pl.col(entity_col).map_dict(string_cache, return_dtype=pl.Int32)
-    )
-    inv_string_cache = {i: entity for entity, i in string_cache.items()}
-    return df_new, entity_col_dtype, string_cache, inv_string_cache
-
-
-def _enforce_string_cache(
-    df: pl.DataFrame, string_cache: Mapping[Union[int, str], int]
-) -> pl.DataFrame:
-    entity_col = df.columns[0]
-    if df.schema[entity_col] == pl.Categorical:
-        # Reset categorical to string type
-        df = df.with_columns(pl.col(entity_col).cast(pl.Utf8))
-    return df.with_columns(
-        pl.col(entity_col).map_dict(string_cache, return_dtype=pl.Int32)
-    )
-
-
-def _reset_string_cache(
-    df: pl.DataFrame, inv_string_cache: Mapping[int, Union[int, str]], return_dtype
-) -> pl.DataFrame:
-    return df.with_columns(
-        pl.col(df.columns[0]).map_dict(inv_string_cache, return_dtype=return_dtype)
-    )
+    def decode(
+        self, df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """Replace the entity codes (first column) of `df` with the entities."""
+        entity_col = df.columns[0]
+        values = pl.col(self.entities.columns[0]).cast(self.dtype)
+        entities = self.entities.select(
+            [
+                pl.arange(0, len(self), dtype=pl.Int32).alias(entity_col),
+                values.alias(self.CODE_COL),
+            ]
+        )
+        if isinstance(df, pl.LazyFrame):
+            entities = entities.lazy()
+        return df.join(entities, on=entity_col, how="left").select(
+            [pl.col(self.CODE_COL).alias(entity_col), *df.columns[1:]]
+        )
 
 
 class Regressor(Protocol):
@@ -72,19 +137,22 @@ class Model:
 
     def __init__(self):
         self.state = None
-        self.entity_col_dtype = None
-        self.string_cache = {}
-        self.inv_string_cache = {}
-
-    def _set_string_cache(self, df: pl.DataFrame) -> pl.DataFrame:
-        df_new, entity_col_dtype, string_cache, inv_string_cache = _set_string_cache(df)
-        self.entity_col_dtype = entity_col_dtype
-        self.string_cache = string_cache
-        self.inv_string_cache = inv_string_cache
-        return df_new
-
-    def _enforce_string_cache(self, df: pl.DataFrame) -> pl.DataFrame:
-        return _enforce_string_cache(df, self.string_cache)
-
-    def _reset_string_cache(self, df: pl.DataFrame) -> pl.DataFrame:
-        return _reset_string_cache(df, self.inv_string_cache, self.entity_col_dtype)
+        self.entity_index: Optional[EntityIndex] = None
+
+    def _set_entity_index(
+        self, df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        self.entity_index = EntityIndex.from_df(df)
+        return self.entity_index.encode(df)
+
+    def _encode_entities(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        unseen: Literal["null", "raise"] = "null",
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        return self.entity_index.encode(df, unseen=unseen)
+
+    def _decode_entities(
+        self, df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        return self.entity_index.decode(df)
@@ -1,6 +1,7 @@
 import inspect
+from contextvars import ContextVar
 from functools import cached_property, wraps
-from typing import Callable, Tuple, TypeVar, Union
+from typing import Callable, Sequence, Tuple, TypeVar, Union
 
 import polars as pl
 from typing_extensions import ParamSpec
@@ -12,6 +13,16 @@ R = TypeVar("R")
 
 DF_TYPE = Union[pl.LazyFrame, pl.DataFrame]
 
+# Set while a `Pipeline` builds its plan over a panel it already sorted
+_PRESORTED: ContextVar[bool] = ContextVar("presorted", default=False)
+
+
+def sort_panel(X: pl.LazyFrame) -> pl.LazyFrame:
+    """Sort panel by entity and time, unless already sorted by a `Pipeline`."""
+    if _PRESORTED.get():
+        return X
+    return X.sort(X.columns[:2])
+
 
 class Transformer:
     """A transformer."""
@@ -50,6 +61,27 @@ class Transformer:
     def is_invertible(self):
         return isinstance(self.func, Tuple)
 
+    @cached_property
+    def is_stateful(self):
+        # Stateful transformers return `(transform, invert, transform_new)`
+        return self.is_invertible and len(self.func) > 2
+
+    def fit(self, X: DF_TYPE) -> "Transformer":
+        """Learn the state (e.g. per-entity statistics) of the transformer from `X`.
+
+        Parameters
+        ----------
+        X : DF_TYPE
+            Panel DataFrame.
+
+        Returns
+        -------
+        self : Transformer
+            Fitted transformer, use `transform_new` to apply its state to new data.
+        """
+        self.transform(X)
+        return self
+
     def transform(self, X: DF_TYPE) -> pl.LazyFrame:
         X = X.lazy()
         transform = self.func[0] if self.is_invertible else self.func
@@ -65,8 +97,29 @@ class Transformer:
         return invert(state=self.state, X=X.lazy())
 
     def transform_new(self, X: DF_TYPE) -> pl.LazyFrame:
-        transform = self.func[2]
-        X_new = transform(state=self.state, X=X.lazy())
+        """Transform new data `X` with the state learned by `fit`.
+
+        Statistics are not recomputed over `X`: stateful transformers apply their
+        per-entity tables (e.g. means, lambdas) to `X` with a single join.
+        Stateless transformers transform `X` as is.
+
+        Parameters
+        ----------
+        X : DF_TYPE
+            Panel DataFrame of new observations.
+
+        Returns
+        -------
+        X_new : pl.LazyFrame
+            Transformed panel LazyFrame.
+        """
+        if not self.is_stateful:
+            transform = self.func[0] if self.is_invertible else self.func
+            return transform(X.lazy())["X_new"]
+        if self.state is None:
+            raise ValueError("Transformer must be fitted before `transform_new`.")
+        transform_new = self.func[2]
+        X_new = transform_new(state=self.state, X=X.lazy())
         return X_new
 
 
@@ -76,3 +129,63 @@ def transformer(model: Callable[P, R]):
         return Transformer(model, *args, **kwargs)
 
     return _transformer
+
+
+class Pipeline:
+    """Transformers composed into a single lazy query plan.
+
+    The panel is sorted by entity and time (and the entity column flagged as sorted)
+    once up front: transformers in the pipeline skip their own sorts, so the whole
+    chain runs as one Polars query. Transformers must preserve row order.
+
+    Parameters
+    ----------
+    transformers : Sequence[Transformer]
+        Transformers applied in order.
+    """
+
+    def __init__(self, transformers: Sequence[Transformer]):
+        self.transformers = list(transformers)
+
+    def __call__(self, X: DF_TYPE):
+        return self.transform(X)
+
+    def _chain(
+        self, X: DF_TYPE, step: Callable[[Transformer, pl.LazyFrame], pl.LazyFrame]
+    ) -> pl.LazyFrame:
+        X = X.lazy()
+        entity_col, time_col = X.columns[:2]
+        X = X.sort([entity_col, time_col]).with_columns(pl.col(entity_col).set_sorted())
+        token = _PRESORTED.set(True)
+        try:
+            for transformer in self.transformers:
+                X = step(transformer, X)
+        finally:
+            _PRESORTED.reset(token)
+        return X
+
+    def fit(self, X: DF_TYPE) -> "Pipeline":
+        self.transform(X)
+        return self
+
+    def transform(self, X: DF_TYPE) -> pl.LazyFrame:
+        return self._chain(X, lambda transformer, X: transformer.transform(X))
+
+    def transform_new(self, X: DF_TYPE) -> pl.LazyFrame:
+        return self._chain(X, lambda transformer, X: transformer.transform_new(X))
+
+    def invert(self, X: DF_TYPE) -> pl.LazyFrame:
+        """Invert the invertible transformers in reverse order, skipping the others."""
+        X = X.lazy()
+        for transformer in reversed(self.transformers):
+            if transformer.is_invertible:
+                X = transformer.invert(X)
+        return X
+
+    def explain(self, X: DF_TYPE, optimized: bool = True) -> str:
+        """Fit the pipeline on `X` and return its fused query plan.
+
+        Stateful transformers (e.g. `scale`) collect their statistics while fitting,
+        which are joined into the plan as in-memory tables.
+        """
+        return self.transform(X).explain(optimized=optimized)
@@ -1,46 +1,90 @@
 import tempfile
-from datetime import datetime
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Tuple
 
-import dask.array as da
 import numpy as np
 import polars as pl
-import zarr
-
-
-def df_to_ndarray(df: pl.DataFrame, n_groups: Optional[int] = None) -> np.ndarray:
-    """Zero-copy spill-to-disk Polars DataFrame to numpy ndarray."""
-    columns = df.columns
-    df = df.select(pl.all().cast(pl.Float32))  # Defensive type cast
-
-    chunks = (df.shape[0], 1)  # Chunk columnar
-    if n_groups:
-        chunks = (n_groups, df.shape[1])  # Chunk by group
-
-    with tempfile.TemporaryDirectory() as tempdir:
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-        file_path = f"{tempdir}/{timestamp}.zarr"
-        X = zarr.open_array(
-            store=file_path,
-            mode="w",
-            shape=df.shape,
-            chunks=chunks,
-            dtype=np.float32,
-            chunk_store=f"{file_path}/chunks",
-        )
-        for i, col in enumerate(columns):
-            series = df.get_column(col)
-            x = series.to_numpy(zero_copy_only=True)
-            X[:, i] = x
-        X = da.from_zarr(X).compute()
-    return X
+from typing_extensions import Literal
+
+_SPILL: ContextVar[Tuple[Optional[int], Optional[str]]] = ContextVar(
+    "_SPILL", default=(None, None)
+)
+
+
+@contextmanager
+def spill_to_disk(max_memory: int, spill_dir: Optional[str] = None):
+    """Spill matrices converted by `df_to_ndarray` above `max_memory` bytes to disk.
 
+    Applies to every conversion within the context, including the features of
+    each forecaster `fit` and `predict`. Worker threads must run in a copy of the
+    caller's context (`contextvars.copy_context().run`) to inherit the budget.
 
-if __name__ == "__main__":
+    Parameters
+    ----------
+    max_memory : int
+        RAM budget in bytes per matrix.
+    spill_dir : Optional[str]
+        Directory of the memory-mapped temporary files. Defaults to the system temp directory.
+    """
+    token = _SPILL.set((max_memory, spill_dir))
+    try:
+        yield
+    finally:
+        _SPILL.reset(token)
 
-    from timeit import default_timer
 
-    df = pl.DataFrame({f"x{i}": pl.arange(0, 1_000_000, eager=True) for i in range(48)})
-    start = default_timer()
-    X = df_to_ndarray(df)
-    print(default_timer() - start)  # 1 second
+def df_to_ndarray(
+    df: pl.DataFrame,
+    dtype: np.dtype = np.float32,
+    order: Literal["C", "F"] = "F",
+    max_memory: Optional[int] = None,
+    spill_dir: Optional[str] = None,
+) -> np.ndarray:
+    """Convert Polars DataFrame into a contiguous numpy ndarray.
+
+    Each column is read straight from its Arrow buffer (zero-copy where possible)
+    and written once into a preallocated matrix. Null values are returned as NaN.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        DataFrame of numeric and / or boolean columns.
+    dtype : np.dtype
+        Data type of the returned array. Defaults to `np.float32`.
+    order : str
+        Memory layout of the returned array: "F" (column-major, default) or "C" (row-major).
+    max_memory : Optional[int]
+        RAM budget in bytes. If the matrix exceeds `max_memory`, it is spilled into
+        a memory-mapped temporary file instead of being allocated in RAM.
+        Defaults to the budget of the enclosing `spill_to_disk` context, if any
+        (otherwise never spill).
+    spill_dir : Optional[str]
+        Directory of the memory-mapped temporary file. Defaults to the directory of
+        the enclosing `spill_to_disk` context, if any, or the system temp directory.
+
+    Returns
+    -------
+    X : np.ndarray
+        Array of shape (n_rows, n_columns).
+    """
+    spill_memory, spill_dir_default = _SPILL.get()
+    max_memory = spill_memory if max_memory is None else max_memory
+    spill_dir = spill_dir_default if spill_dir is None else spill_dir
+    shape = df.shape
+    dtype = np.dtype(dtype)
+    nbytes = shape[0] * shape[1] * dtype.itemsize
+    if max_memory is not None and nbytes > max_memory:
+        # NOTE: File is unlinked on creation and freed once X is garbage collected
+        X = np.memmap(
+            tempfile.TemporaryFile(dir=spill_dir),
+            mode="w+",
+            dtype=dtype,
+            shape=shape,
+            order=order,
+        )
+    else:
+        X = np.empty(shape, dtype=dtype, order=order)
+    for i, series in enumerate(df.get_columns()):
+        X[:, i] = series.to_numpy()
+    return X
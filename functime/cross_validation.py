@@ -1,8 +1,41 @@
-from typing import Mapping, Optional, Tuple
+from typing import List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import polars as pl
 
+_ROW_COL = "__row"
+_LENGTH_COL = "__length"
+
+
+def _index_panel(X: pl.LazyFrame, eager: bool = False) -> pl.LazyFrame:
+    # Sort once and store each row's offset within its entity and the entity length.
+    # Every fold is then a filter on row offsets over the same sorted frame.
+    # The indexed panel is only materialized (once, shared by all folds) if `eager`.
+    entity_col, time_col = X.columns[:2]
+    X_indexed = X.sort([entity_col, time_col]).with_columns(
+        [
+            pl.col(entity_col).set_sorted(),
+            # NOTE: Signed offsets so that window starts before the first row
+            # do not wrap around
+            pl.col(time_col).cumcount().over(entity_col).cast(pl.Int32).alias(_ROW_COL),
+            pl.col(time_col).count().over(entity_col).cast(pl.Int32).alias(_LENGTH_COL),
+        ]
+    )
+    if eager:
+        X_indexed = X_indexed.collect().lazy()
+    return X_indexed
+
+
+def _take_rows(
+    X: pl.LazyFrame,
+    columns: List[str],
+    start: Union[int, pl.Expr],
+    end: Union[int, pl.Expr],
+) -> pl.LazyFrame:
+    # Rows [start, end) of every entity, counting from each entity's first row
+    offset = pl.col(_ROW_COL)
+    return X.filter((offset >= start) & (offset < end)).select(columns)
+
 
 def train_test_split(
     test_size: int, eager: bool = False
@@ -24,16 +57,11 @@ def train_test_split(
 
     def split(X: pl.LazyFrame) -> pl.LazyFrame:
         X = X.lazy()  # Defensive
-        entity_col = X.columns[0]
-        train_split = (
-            X.groupby(entity_col)
-            .agg(pl.all().slice(0, pl.count() - test_size))
-            .explode(pl.all().exclude(entity_col))
-        )
-        test_split = (
-            X.groupby(entity_col)
-            .agg(pl.all().slice(-1 * test_size, test_size))
-            .explode(pl.all().exclude(entity_col))
+        X_indexed = _index_panel(X, eager=eager)
+        cutoff = pl.col(_LENGTH_COL) - test_size
+        train_split = _take_rows(X_indexed, X.columns, start=0, end=cutoff)
+        test_split = _take_rows(
+            X_indexed, X.columns, start=cutoff, end=cutoff + test_size
         )
         if eager:
             train_split, test_split = pl.collect_all([train_split, test_split])
@@ -48,31 +76,26 @@ def _window_split(
     n_splits: int,
     step_size: int,
     window_size: Optional[int] = None,
+    eager: bool = False,
 ) -> Mapping[int, Tuple[pl.LazyFrame, pl.LazyFrame]]:
     X = X.lazy()  # Defensive
     backward_steps = np.arange(1, n_splits) * step_size + test_size
     cutoffs = np.flip(np.concatenate([np.array([test_size]), backward_steps]))
-    entity_col = X.columns[0]
-    if window_size:
-        # Sliding window CV
-        train_exprs = [
-            pl.all().slice(pl.count() - cutoff - window_size, window_size)
-            for cutoff in cutoffs
-        ]
-    else:
-        # Expanding window CV
-        train_exprs = [pl.all().slice(0, pl.count() - cutoff) for cutoff in cutoffs]
-
-    test_exprs = [pl.all().slice(-cutoffs[i], test_size) for i in range(n_splits)]
-    train_test_exprs = zip(train_exprs, test_exprs)
+    X_indexed = _index_panel(X, eager=eager)
     splits = {}
-    for i, train_test_expr in enumerate(train_test_exprs):
-        train_expr, test_expr = train_test_expr
-        train_split = (
-            X.groupby(entity_col).agg(train_expr).explode(pl.all().exclude(entity_col))
+    for i, cutoff in enumerate(cutoffs):
+        test_start = pl.col(_LENGTH_COL) - int(cutoff)
+        if window_size:
+            # Sliding window CV
+            train_start = test_start - window_size
+        else:
+            # Expanding window CV
+            train_start = 0
+        train_split = _take_rows(
+            X_indexed, X.columns, start=train_start, end=test_start
         )
-        test_split = (
-            X.groupby(entity_col).agg(test_expr).explode(pl.all().exclude(entity_col))
+        test_split = _take_rows(
+            X_indexed, X.columns, start=test_start, end=test_start + test_size
         )
         splits[i] = train_split, test_split
     return splits
@@ -114,7 +137,7 @@ def expanding_window_split(
     """
 
     def split(X: pl.LazyFrame) -> pl.LazyFrame:
-        splits = _window_split(X, test_size, n_splits, step_size)
+        splits = _window_split(X, test_size, n_splits, step_size, eager=eager)
         if eager:
             splits = {i: pl.collect_all(s) for i, s in splits.items()}
         return splits
@@ -163,7 +186,9 @@ def sliding_window_split(
     """
 
     def split(X: pl.LazyFrame) -> pl.LazyFrame:
-        splits = _window_split(X, test_size, n_splits, step_size, window_size)
+        splits = _window_split(
+            X, test_size, n_splits, step_size, window_size, eager=eager
+        )
         if eager:
             splits = {i: pl.collect_all(s) for i, s in splits.items()}
         return splits
@@ -1,18 +1,49 @@
-from .automl import (
-    auto_elastic_net,
-    auto_knn,
-    auto_lasso,
-    auto_lightgbm,
-    auto_linear_model,
-    auto_ridge,
-)
-from .catboost import catboost
-from .censored import censored_model, zero_inflated_model
-from .knn import knn
-from .lance import ann
-from .lightgbm import flaml_lightgbm, lightgbm
-from .linear import elastic_net, lasso, linear_model, ridge
-from .xgboost import xgboost
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .automl import (
+        auto_elastic_net,
+        auto_knn,
+        auto_lasso,
+        auto_lightgbm,
+        auto_linear_model,
+        auto_ridge,
+    )
+    from .catboost import catboost
+    from .censored import censored_model, zero_inflated_model
+    from .knn import knn
+    from .lance import ann
+    from .lightgbm import flaml_lightgbm, lightgbm
+    from .linear import elastic_net, lasso, linear_model, ridge
+    from .sharded import sharded_model
+    from .xgboost import xgboost
+
+# Forecasters are imported from their backend module on first access,
+# so that e.g. `linear_model` does not import lance, LightGBM or FLAML.
+_FORECASTER_MODULES = {
+    "ann": ".lance",
+    "auto_elastic_net": ".automl",
+    "auto_knn": ".automl",
+    "auto_lasso": ".automl",
+    "auto_lightgbm": ".automl",
+    "auto_linear_model": ".automl",
+    "auto_ridge": ".automl",
+    "catboost": ".catboost",
+    "censored_model": ".censored",
+    "elastic_net": ".linear",
+    "flaml_lightgbm": ".lightgbm",
+    "knn": ".knn",
+    "lasso": ".linear",
+    "lightgbm": ".lightgbm",
+    "linear_model": ".linear",
+    "ridge": ".linear",
+    "sharded_model": ".sharded",
+    "xgboost": ".xgboost",
+    "zero_inflated_model": ".censored",
+}
 
 __all__ = [
     "ann",
@@ -31,6 +62,31 @@ __all__ = [
     "lightgbm",
     "linear_model",
     "ridge",
+    "sharded_model",
     "xgboost",
     "zero_inflated_model",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _FORECASTER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    forecaster = getattr(import_module(_FORECASTER_MODULES[name], __name__), name)
+    globals()[name] = forecaster
+    return forecaster
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
+
+
+class _ForecastingModule(ModuleType):
+    def __setattr__(self, name, value):
+        # NOTE: Importing a backend submodule (e.g. `.lightgbm`) binds it onto this
+        # package, which would shadow the forecaster of the same name
+        if name in _FORECASTER_MODULES and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ForecastingModule
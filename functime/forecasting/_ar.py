@@ -1,23 +1,58 @@
 import logging
-from typing import Any, Callable, List, Mapping, Optional, Union
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, Union
 
 import numpy as np
 import polars as pl
-from tqdm import trange
+from joblib import Parallel, delayed
+from tqdm import tqdm
 from typing_extensions import Literal
 
+from functime.conversion import df_to_ndarray
 from functime.cross_validation import expanding_window_split
 from functime.forecasting._evaluate import evaluate
 from functime.forecasting._reduction import (
+    ReductionBatches,
+    XyBatches,
     make_direct_reduction,
     make_reduction,
     make_y_lag,
+    shared_reduction,
+    y_lag_matrix,
+    y_lag_width,
 )
+from functime.offsets import _strip_freq_alias
 
-try:
+if TYPE_CHECKING:
     from flaml.tune.sample import Domain
-except ImportError:
-    pass
+
+
+RegressBatches = Callable[[XyBatches, List[List[str]]], List[Any]]
+
+
+def _fit_batches(
+    regress_batches: RegressBatches,
+    batches: ReductionBatches,
+    lags: int,
+    target_col: str,
+    horizon_cols: List[List[str]],
+) -> Mapping[str, Any]:
+    # 1. Fit from reductions streamed one batch of entities at a time
+    feature_cols = list(dict.fromkeys(col for cols in horizon_cols for col in cols))
+    fitted_models = regress_batches(
+        batches.split(target_col=target_col, feature_cols=feature_cols),
+        horizon_cols=horizon_cols,
+    )
+    # 2. Collect artifacts per batch
+    y_lags = []
+    for i in range(len(batches)):
+        y_batch, _ = batches.collect(i)
+        y_lags.append(make_y_lag(y_batch, lags=lags).collect())
+    artifacts = {
+        "regressors": fitted_models,
+        "y_lag": pl.concat(y_lags),
+    }
+    return artifacts
 
 
 def fit_recursive(
@@ -25,9 +60,26 @@ def fit_recursive(
     lags: int,
     y: pl.LazyFrame,
     X: Optional[pl.LazyFrame] = None,
+    memory_budget: Optional[int] = None,
+    regress_batches: Optional[RegressBatches] = None,
 ) -> Mapping[str, Any]:
-    # 1. Impose AR structure
     target_col = y.columns[-1]
+    if memory_budget is not None:
+        batches = ReductionBatches(lags=lags, y=y, X=X, memory_budget=memory_budget)
+        feature_cols = X.columns[2:] if X is not None else []
+        horizon_cols = _horizon_cols(
+            target_col, lags=lags, max_horizons=1, feature_cols=feature_cols
+        )
+        artifacts = _fit_batches(
+            regress_batches,
+            batches=batches,
+            lags=lags,
+            target_col=target_col,
+            horizon_cols=horizon_cols,
+        )
+        (artifacts["regressor"],) = artifacts.pop("regressors")
+        return artifacts
+    # 1. Impose AR structure
     X_y_final = make_reduction(lags=lags, y=y, X=X).lazy()
     X_final, y_final = pl.collect_all(
         [
@@ -38,7 +90,7 @@ def fit_recursive(
     # 2. Fit
     fitted_model = regress(X=X_final, y=y_final)
     # 3. Collect artifacts
-    y_lag = make_y_lag(X_y_final, target_col=y.columns[-1], lags=lags)
+    y_lag = make_y_lag(y, lags=lags)
     artifacts = {
         "regressor": fitted_model,
         "y_lag": y_lag.collect(streaming=True),
@@ -46,29 +98,70 @@ def fit_recursive(
     return artifacts
 
 
+def _horizon_cols(
+    target_col: str, lags: int, max_horizons: int, feature_cols: List[str]
+) -> List[List[str]]:
+    return [
+        [*(f"{target_col}__lag_{j}" for j in range(i, lags + i)), *feature_cols]
+        for i in range(1, max_horizons + 1)
+    ]
+
+
 def fit_direct(
     regress: Callable[[pl.LazyFrame, pl.LazyFrame], Any],
     lags: int,
     max_horizons: int,
     y: pl.LazyFrame,
     X: Optional[pl.LazyFrame] = None,
+    n_jobs: int = 1,
+    regress_horizons: Optional[
+        Callable[[pl.DataFrame, pl.DataFrame, List[List[str]]], List[Any]]
+    ] = None,
+    memory_budget: Optional[int] = None,
+    regress_batches: Optional[RegressBatches] = None,
 ) -> Mapping[str, Any]:
     idx_cols = y.columns[:2]
     target_col = y.columns[-1]
     feature_cols = X.columns[2:] if X is not None else []
+    if memory_budget is not None:
+        batches = ReductionBatches(
+            lags=lags + max_horizons, y=y, X=X, memory_budget=memory_budget
+        )
+        return _fit_batches(
+            regress_batches,
+            batches=batches,
+            lags=lags + max_horizons,
+            target_col=target_col,
+            horizon_cols=_horizon_cols(
+                target_col,
+                lags=lags,
+                max_horizons=max_horizons,
+                feature_cols=feature_cols,
+            ),
+        )
     # 1. Impose AR structure
     X_y_final = make_direct_reduction(lags=lags, max_horizons=max_horizons, y=y, X=X)
+    y_final = X_y_final.select([*idx_cols, target_col])
+    horizon_cols = _horizon_cols(
+        target_col, lags=lags, max_horizons=max_horizons, feature_cols=feature_cols
+    )
     # 2. Fit
-    fitted_models = []
-    for i in trange(1, max_horizons + 1, desc="Fitting direct forecasters:"):
-        selected_lags = range(i, lags + i)
-        lag_cols = [f"{target_col}__lag_{j}" for j in selected_lags]
+    if regress_horizons is not None:
+        # Multi-output: every horizon is solved from one pass over the reduction
+        lag_cols = [f"{target_col}__lag_{j}" for j in range(1, lags + max_horizons)]
         X_final = X_y_final.select([*idx_cols, *lag_cols, *feature_cols])
-        y_final = X_y_final.select([*idx_cols, target_col])
-        fitted_model = regress(X=X_final, y=y_final)
-        fitted_models.append(fitted_model)
+        fitted_models = regress_horizons(
+            X=X_final, y=y_final, horizon_cols=horizon_cols
+        )
+    else:
+        # NOTE: Threads by default since regressors release the GIL.
+        # Use `joblib.parallel_backend("loky")` to fit on a process pool instead.
+        fitted_models = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(regress)(X=X_y_final.select([*idx_cols, *cols]), y=y_final)
+            for cols in tqdm(horizon_cols, desc="Fitting direct forecasters:")
+        )
     # 3. Collect artifacts
-    y_lag = make_y_lag(X_y_final, target_col=y.columns[-1], lags=lags + max_horizons)
+    y_lag = make_y_lag(y, lags=lags + max_horizons)
     artifacts = {
         "regressors": fitted_models,
         "y_lag": y_lag.collect(streaming=True),
@@ -83,6 +176,12 @@ def fit_autoreg(
     X: Optional[Union[pl.DataFrame, pl.LazyFrame]] = None,
     max_horizons: Optional[int] = None,
     strategy: Optional[Literal["direct", "recursive", "naive"]] = None,
+    n_jobs: int = 1,
+    regress_horizons: Optional[
+        Callable[[pl.DataFrame, pl.DataFrame, List[List[str]]], List[Any]]
+    ] = None,
+    memory_budget: Optional[int] = None,
+    regress_batches: Optional[RegressBatches] = None,
 ) -> Mapping[str, Any]:
     y = y.lazy()
     X = X.lazy() if X is not None else X
@@ -92,18 +191,31 @@ def fit_autoreg(
             "If `strategy` is set as 'direct' or 'ensemble', then `max_horizons` must be set"
             " in the forecaster's kwargs upon initialization."
         )
+    if memory_budget is not None and regress_batches is None:
+        raise ValueError("`memory_budget` is not supported by this regressor.")
+    batches_kwargs = {
+        "memory_budget": memory_budget,
+        "regress_batches": regress_batches,
+    }
+    direct_kwargs = {
+        "regress": regress,
+        "lags": lags,
+        "max_horizons": max_horizons,
+        "y": y,
+        "X": X,
+        "n_jobs": n_jobs,
+        "regress_horizons": regress_horizons,
+        **batches_kwargs,
+    }
+    recursive_kwargs = {"regress": regress, "lags": lags, "y": y, "X": X}
     if strategy == "recursive":
-        artifacts = fit_recursive(regress=regress, lags=lags, y=y, X=X)
+        artifacts = fit_recursive(**recursive_kwargs, **batches_kwargs)
     elif strategy == "direct":
-        artifacts = fit_direct(
-            regress=regress, lags=lags, max_horizons=max_horizons, y=y, X=X
-        )
+        artifacts = fit_direct(**direct_kwargs)
     elif strategy == "ensemble":
         artifacts = {
-            "recursive": fit_recursive(regress=regress, lags=lags, y=y, X=X),
-            "direct": fit_direct(
-                regress=regress, lags=lags, max_horizons=max_horizons, y=y, X=X
-            ),
+            "recursive": fit_recursive(**recursive_kwargs, **batches_kwargs),
+            "direct": fit_direct(**direct_kwargs),
         }
     else:
         raise ValueError(f"Cannot recognize `strategy` '{strategy}'")
@@ -122,7 +234,7 @@ def fit_cv(  # noqa: Ruff too complex
     step_size: int = 1,
     n_splits: int = 5,
     time_budget: int = 5,
-    search_space: Optional[Mapping[str, Domain]] = None,
+    search_space: Optional[Mapping[str, "Domain"]] = None,
     points_to_evaluate: Optional[List[Mapping[str, Any]]] = None,
     low_cost_partial_config: Optional[Mapping[str, Any]] = None,
     num_samples: int = -1,
@@ -130,6 +242,7 @@ def fit_cv(  # noqa: Ruff too complex
         Callable[[pl.LazyFrame, bool, bool], Union[pl.LazyFrame, pl.DataFrame]]
     ] = None,
     X: Optional[pl.LazyFrame] = None,
+    n_jobs: int = 1,
     **kwargs,
 ) -> Mapping[str, Any]:
     # Set defaults
@@ -144,29 +257,38 @@ def fit_cv(  # noqa: Ruff too complex
     # Test each lag
     best_lags = None
     best_params = None
-    scores_path = []
     lags_path = list(range(min_lags, max_lags + 1))
-    scores_path = []
-    for lags in lags_path:
-        score = evaluate(
-            **{
-                "lags": lags,
-                "n_splits": n_splits,
-                "time_budget": time_budget,
-                "points_to_evaluate": points_to_evaluate,
-                "num_samples": num_samples,
-                "low_cost_partial_config": low_cost_partial_config,
-                "search_space": search_space,
-                "test_size": test_size,
-                "max_horizons": max_horizons,
-                "strategy": strategy,
-                "freq": freq,
-                "forecaster_cls": forecaster_cls,
-                "y_splits": y_splits,
-                "X_splits": X_splits,
-            },
-        )
-        scores_path.append(score)
+    evaluate_kwargs = {
+        "n_splits": n_splits,
+        "time_budget": time_budget,
+        "points_to_evaluate": points_to_evaluate,
+        "num_samples": num_samples,
+        "low_cost_partial_config": low_cost_partial_config,
+        "search_space": search_space,
+        "test_size": test_size,
+        "max_horizons": max_horizons,
+        "strategy": strategy,
+        "freq": freq,
+        "forecaster_cls": forecaster_cls,
+        "y_splits": y_splits,
+        "X_splits": X_splits,
+    }
+    # Lagged features are computed once per split and sliced for every lag count
+    with shared_reduction(max_lags=max_lags + (max_horizons or 0)):
+        if search_space is None:
+            # NOTE: Each thread runs in a copy of the current context to share reductions
+            context = copy_context()
+            scores_path = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(context.copy().run)(evaluate, lags=lags, **evaluate_kwargs)
+                for lags in lags_path
+            )
+        else:
+            # NOTE: FLAML's tuner keeps global state, hence lag counts are tuned
+            # in sequence and CV splits are evaluated concurrently instead
+            scores_path = [
+                evaluate(lags=lags, n_jobs=n_jobs, **evaluate_kwargs)
+                for lags in lags_path
+            ]
     best_idx = np.argmin(scores_path)
     best_score = scores_path[best_idx]
     best_lags = lags_path[best_idx]
@@ -198,11 +320,201 @@ def fit_cv(  # noqa: Ruff too complex
     return artifacts
 
 
+def _append_observations(
+    y_lag: pl.DataFrame, y: pl.DataFrame, freq: Optional[str]
+) -> pl.DataFrame:
+    # Rebuild the observations held in the `y_lag` buffer, timestamped backwards
+    # from each entity's last time at `freq` (the reduction only needs their order)
+    entity_col, time_col, target_col = y_lag.columns
+    width = y_lag_width(y_lag)
+    last_time = pl.col(time_col)
+    if freq is None or freq.endswith("i"):
+        step = 1 if freq is None else int(freq[:-1])
+        times = pl.arange(
+            last_time - (width - 1) * step, last_time + 1, step=step, eager=False
+        )
+    else:
+        offset_n, offset_alias = _strip_freq_alias(freq)
+        dtype = y_lag.schema[time_col]
+        times = pl.date_range(
+            last_time.dt.offset_by(f"-{(width - 1) * offset_n}{offset_alias}"),
+            last_time,
+            interval=freq,
+            closed="both",
+            time_unit=getattr(dtype, "time_unit", None),
+            eager=False,
+        )
+    y_hist = y_lag.with_columns(times.alias(time_col)).explode([time_col, target_col])
+    y_hist = y_hist.select(
+        [
+            pl.col(col).cast(dtype)
+            for col, dtype in y.select(y_lag.columns).schema.items()
+        ]
+    )
+    return pl.concat([y_hist, y.select(y_lag.columns)])
+
+
+def _warm_start(regressor: Any, X: pl.DataFrame, y: pl.DataFrame) -> Any:
+    update = getattr(regressor, "update", None)
+    if update is None:
+        raise ValueError(
+            f"`warm_start` is not supported by `{regressor.__class__.__name__}`"
+        )
+    return update(X=X, y=y)
+
+
+def update_recursive(
+    artifacts: Mapping[str, Any],
+    y: pl.DataFrame,
+    X: Optional[pl.DataFrame] = None,
+    warm_start: bool = False,
+    freq: Optional[str] = None,
+) -> Mapping[str, Any]:
+    idx_cols = y.columns[:2]
+    target_col = y.columns[-1]
+    lags = y_lag_width(artifacts["y_lag"])
+    # 1. Impose AR structure on new observations only
+    y_hist = _append_observations(artifacts["y_lag"], y, freq=freq)
+    X_y_new = make_reduction(lags=lags, y=y_hist, X=X)
+    # 2. Continue training
+    regressor = artifacts["regressor"]
+    if warm_start and len(X_y_new) > 0:
+        regressor = _warm_start(
+            regressor,
+            X=X_y_new.select(pl.all().exclude(target_col)),
+            y=X_y_new.select([*idx_cols, target_col]),
+        )
+    # 3. Update artifacts
+    artifacts = {
+        **artifacts,
+        "regressor": regressor,
+        "y_lag": make_y_lag(y_hist, lags=lags).collect(),
+    }
+    return artifacts
+
+
+def update_direct(
+    artifacts: Mapping[str, Any],
+    y: pl.DataFrame,
+    X: Optional[pl.DataFrame] = None,
+    warm_start: bool = False,
+    freq: Optional[str] = None,
+) -> Mapping[str, Any]:
+    idx_cols = y.columns[:2]
+    target_col = y.columns[-1]
+    feature_cols = X.columns[2:] if X is not None else []
+    regressors = artifacts["regressors"]
+    max_horizons = len(regressors)
+    lags = y_lag_width(artifacts["y_lag"]) - max_horizons
+    # 1. Impose AR structure on new observations only
+    y_hist = _append_observations(artifacts["y_lag"], y, freq=freq)
+    X_y_new = make_direct_reduction(lags=lags, max_horizons=max_horizons, y=y_hist, X=X)
+    # 2. Continue training
+    if warm_start and len(X_y_new) > 0:
+        y_new = X_y_new.select([*idx_cols, target_col])
+        horizon_cols = _horizon_cols(
+            target_col, lags=lags, max_horizons=max_horizons, feature_cols=feature_cols
+        )
+        regressors = [
+            _warm_start(regressor, X=X_y_new.select([*idx_cols, *cols]), y=y_new)
+            for regressor, cols in zip(regressors, horizon_cols)
+        ]
+    # 3. Update artifacts
+    artifacts = {
+        **artifacts,
+        "regressors": regressors,
+        "y_lag": make_y_lag(y_hist, lags=lags + max_horizons).collect(),
+    }
+    return artifacts
+
+
+def update_autoreg(
+    state,
+    y: pl.DataFrame,
+    X: Optional[pl.DataFrame] = None,
+    warm_start: bool = False,
+    freq: Optional[str] = None,
+) -> Mapping[str, Any]:
+    artifacts = state.artifacts
+    if "y_lag" not in artifacts.get("recursive", artifacts):
+        raise ValueError(
+            "Fitted state has no observation history, refit the forecaster to update it."
+        )
+    update_kwargs = {"y": y, "X": X, "warm_start": warm_start, "freq": freq}
+    strategy = state.strategy
+    if strategy == "recursive":
+        artifacts = update_recursive(artifacts, **update_kwargs)
+    elif strategy == "direct":
+        artifacts = update_direct(artifacts, **update_kwargs)
+    elif strategy == "ensemble":
+        artifacts = {
+            **artifacts,
+            "recursive": update_recursive(artifacts["recursive"], **update_kwargs),
+            "direct": update_direct(artifacts["direct"], **update_kwargs),
+        }
+    else:
+        raise ValueError(f"Cannot recognize `strategy` '{strategy}'")
+    return artifacts
+
+
 # NOTE: REMEMBER exogenous X DOES NOT HAVE TIME_COL
 # (values are aggregated into list before being passed into predict)
 
 
-def predict_recursive(
+def _make_x_steps(
+    X: Optional[pl.DataFrame], entities: pl.Series, fh: int
+) -> Optional[pl.DataFrame]:
+    """Align exogenous features to `entities` for every horizon step at once.
+
+    Returns a step-major frame with `fh * len(entities)` rows, where rows
+    `[i * len(entities), (i + 1) * len(entities))` hold the features of step `i`
+    in the order of `entities`. Each step is then a zero-copy slice.
+    """
+    if X is None:
+        return None
+    entity_col = X.columns[0]
+    step_col, order_col = "__step", "__order"
+    X_steps = (
+        entities.to_frame(entity_col)
+        .with_row_count(order_col)
+        .join(
+            X.with_columns(
+                pl.col(entity_col).cumcount().over(entity_col).alias(step_col)
+            ),
+            on=entity_col,
+            how="left",
+        )
+        .filter(pl.col(step_col).is_null() | (pl.col(step_col) < fh))
+    )
+    n_steps = X_steps.groupby(entity_col).agg(pl.col(step_col).count())
+    n_invalid = n_steps.filter(pl.col(step_col) < fh).height
+    if n_invalid > 0:
+        raise ValueError(
+            f"`X` must contain features for every forecast horizon step (`fh={fh}`),"
+            f" but {n_invalid} entities are missing or have fewer than {fh} rows."
+        )
+    X_steps = X_steps.sort([step_col, order_col]).select(X.columns[1:])
+    return X_steps
+
+
+def _get_x_slice(X_steps: pl.DataFrame, n_entities: int, i: int) -> List[pl.Series]:
+    return X_steps.slice(i * n_entities, n_entities).get_columns()
+
+
+def _x_steps_numpy(X_steps: Optional[pl.DataFrame]) -> Optional[np.ndarray]:
+    # Step-major matrix of exogenous features, None unless every feature is numeric
+    # and non-null (categoricals and missing values need the regressor's frame path)
+    if X_steps is None:
+        return None
+    if any(dtype not in pl.NUMERIC_DTYPES for dtype in X_steps.dtypes):
+        return None
+    if sum(X_steps.null_count().row(0)) > 0:
+        return None
+    dtype = np.result_type(*[series.to_numpy().dtype for series in X_steps])
+    return df_to_ndarray(X_steps, dtype=dtype, order="C")
+
+
+def _predict_recursive_polars(
     state,
     fh: int,
     X: Optional[pl.DataFrame] = None,
@@ -211,21 +523,28 @@ def predict_recursive(
     if "recursive" in artifacts.keys():
         artifacts = state.artifacts["recursive"]
     regressor = artifacts["regressor"]
-    entity_col = state.entity
+    entity_col, time_col, target_col = state.entity, state.time, state.target
     y_lag: pl.DataFrame = artifacts["y_lag"].sort(entity_col)
-    X = X.sort(entity_col) if X is not None else X
-    lag_cols = y_lag.columns[2:]
-    lead_col = lag_cols[0]
+    lags = y_lag_width(y_lag)
+
+    n_entities = len(y_lag)
+    X_steps = _make_x_steps(X, entities=y_lag.get_column(entity_col), fh=fh)
 
     def _get_x_y_slice(y_lag: pl.DataFrame, i: int):
+        # Derive lagged features from the most recent values of the history
         x_y_slice = y_lag.select(
-            [entity_col, pl.all().exclude(entity_col).list.get(-1)]
+            [
+                entity_col,
+                time_col,
+                *[
+                    pl.col(target_col).list.get(-j).alias(f"{target_col}__lag_{j}")
+                    for j in range(1, lags + 1)
+                ],
+            ]
         )
-        if X is not None:
-            x = X.groupby(entity_col, maintain_order=True).agg(
-                pl.all().exclude(entity_col).take(i)
-            )
-            x_y_slice = x_y_slice.join(x, on=entity_col, how="left")
+        if X_steps is not None:
+            x = _get_x_slice(X_steps, n_entities=n_entities, i=i)
+            x_y_slice = x_y_slice.hstack(x)
         return x_y_slice
 
     is_censored = getattr(regressor, "is_censored", False)
@@ -239,15 +558,14 @@ def predict_recursive(
         if is_censored:
             y_pred_i, weights_i = y_pred_i
             weights[i] = weights_i
-        # 3. Update AR structure
-        y_shifted = [
-            pl.col(lag_cols[i]).alias(lag_cols[i + 1])
-            for i in range(0, len(lag_cols) - 1)
-        ]
-        y_new = pl.col(lead_col).list.concat(pl.Series(y_pred_i))
-        y_lag = y_lag.with_columns([y_new, *y_shifted])
-
-    pred_cols = [entity_col, pl.col(lead_col).list.tail(fh).alias(state.target)]
+        # 3. Append prediction to history
+        y_lag = y_lag.with_columns(pl.col(target_col).list.concat(pl.Series(y_pred_i)))
+
+    # NOTE: Forecasts are Float64 whatever the dtype of the history buffer
+    pred_cols = [
+        entity_col,
+        pl.col(target_col).list.tail(fh).cast(pl.List(pl.Float64)),
+    ]
     y_pred = y_lag.select(pred_cols)
 
     if is_censored:
@@ -259,6 +577,106 @@ def predict_recursive(
     return y_pred
 
 
+def _predict_recursive_numpy(
+    state,
+    fh: int,
+    X: Optional[pl.DataFrame] = None,
+) -> pl.DataFrame:
+    artifacts = state.artifacts
+    if "recursive" in artifacts.keys():
+        artifacts = state.artifacts["recursive"]
+    regressor = artifacts["regressor"]
+    entity_col, time_col = state.entity, state.time
+    y_lag: pl.DataFrame = artifacts["y_lag"].sort(entity_col)
+    lags = y_lag_width(y_lag)
+    lag_cols = [f"{state.target}__lag_{j}" for j in range(1, lags + 1)]
+    n_entities = len(y_lag)
+    X_steps = _make_x_steps(X, entities=y_lag.get_column(entity_col), fh=fh)
+
+    # 1. Materialize AR state once: column j holds `{target}__lag_{j+1}`
+    # NOTE: Same supertype semantics as `list.concat` in the Polars engine
+    # i.e. the buffer is upcast if the regressor returns a wider dtype
+    idx = y_lag.select([entity_col, time_col])
+    y_lag_arr = y_lag_matrix(y_lag, lags=lags)
+    dtype = np.result_type(y_lag_arr.dtype, np.float32)
+    # NOTE: Forecasts are Float64 whatever the dtype of the history buffer
+    y_pred = np.empty((n_entities, fh))
+
+    is_censored = getattr(regressor, "is_censored", False)
+    weights = np.zeros((fh, n_entities)) if is_censored else None
+    # Numeric exogenous features are copied into a preallocated matrix after the
+    # lags at every step, otherwise each step is predicted from a frame
+    predict_numpy = getattr(regressor, "predict_numpy", None)
+    X_steps_arr = _x_steps_numpy(X_steps)
+    if X_steps is not None and X_steps_arr is None:
+        predict_numpy = None
+    feature_names = lag_cols if X_steps is None else [*lag_cols, *X_steps.columns]
+    x_arr = None
+
+    for i in range(fh):
+        # 2. Predict given the preallocated lag matrix
+        if predict_numpy is not None and X_steps is None:
+            y_pred_i = predict_numpy(y_lag_arr, feature_names=feature_names, idx=idx)
+        elif predict_numpy is not None:
+            # NOTE: Reallocated only if the lag buffer is upcast after the first step
+            x_dtype = np.result_type(y_lag_arr.dtype, X_steps_arr.dtype)
+            if x_arr is None or x_arr.dtype != x_dtype:
+                x_arr = np.empty((n_entities, len(feature_names)), dtype=x_dtype)
+            x_arr[:, :lags] = y_lag_arr
+            x_arr[:, lags:] = X_steps_arr[i * n_entities : (i + 1) * n_entities]
+            y_pred_i = predict_numpy(x_arr, feature_names=feature_names, idx=idx)
+        else:
+            x_y_slice = idx.hstack(
+                [pl.Series(col, y_lag_arr[:, j]) for j, col in enumerate(lag_cols)]
+            )
+            if X_steps is not None:
+                x_y_slice = x_y_slice.hstack(
+                    _get_x_slice(X_steps, n_entities=n_entities, i=i)
+                )
+            y_pred_i = regressor.predict(x_y_slice)
+        if is_censored:
+            y_pred_i, weights_i = y_pred_i
+            weights[i] = weights_i
+        y_pred_i = np.asarray(y_pred_i)
+        if i == 0:
+            dtype = np.result_type(dtype, y_pred_i.dtype)
+            y_lag_arr = y_lag_arr.astype(dtype, order="F", copy=False)
+        y_pred[:, i] = y_pred_i
+        # 3. Roll AR structure in place
+        y_lag_arr[:, 1:] = y_lag_arr[:, :-1]
+        y_lag_arr[:, 0] = y_pred_i
+
+    y_pred = (
+        pl.DataFrame(y_pred)
+        .select(pl.concat_list(pl.all()).alias(state.target))
+        .with_columns(y_lag.get_column(entity_col))
+        .select([entity_col, state.target])
+    )
+
+    if is_censored:
+        weights = pl.DataFrame(np.stack(weights, axis=1).astype(np.float32)).select(
+            pl.concat_list(pl.all()).alias("threshold_proba")
+        )
+        y_pred = pl.concat([y_pred, weights], how="horizontal")
+
+    return y_pred
+
+
+def predict_recursive(
+    state,
+    fh: int,
+    X: Optional[pl.DataFrame] = None,
+    engine: Literal["numpy", "polars"] = "numpy",
+) -> pl.DataFrame:
+    if engine == "numpy":
+        y_pred = _predict_recursive_numpy(state=state, fh=fh, X=X)
+    elif engine == "polars":
+        y_pred = _predict_recursive_polars(state=state, fh=fh, X=X)
+    else:
+        raise ValueError(f"Cannot recognize `engine` '{engine}'")
+    return y_pred
+
+
 # NOTE: REMEMBER exogenous X DOES NOT HAVE TIME_COL
 # (values are aggregated into list before being passed into predict)
 
@@ -267,7 +685,6 @@ def predict_direct(state, fh: int, X: Optional[pl.DataFrame] = None) -> pl.DataF
     entity_col = state.entity
     time_col = state.time
     target_col = state.target
-    X_feature_cols = X.columns[1:] if X is not None else []
     artifacts = state.artifacts
     if "direct" in artifacts.keys():
         artifacts = state.artifacts["direct"]
@@ -281,25 +698,42 @@ def predict_direct(state, fh: int, X: Optional[pl.DataFrame] = None) -> pl.DataF
         )
 
     y_lag: pl.DataFrame = artifacts["y_lag"].sort(entity_col)
-    X = X.sort(entity_col) if X is not None else X
-    lags = (y_lag.width - 1) - max_horizons
+    lags = y_lag_width(y_lag) - max_horizons
 
     n_entities = len(y_lag)
+    X_steps = _make_x_steps(X, entities=y_lag.get_column(entity_col), fh=fh)
+    idx = y_lag.select([entity_col, time_col])
+    # Every horizon is predicted from the most recent `lags` values
+    y_lag_arr = y_lag_matrix(y_lag, lags=lags)
     y_pred = np.empty((n_entities, fh))
     is_censored = getattr(regressors[0], "predict_proba", None)
     weights = np.zeros((fh, n_entities)) if is_censored else None
 
+    X_steps_arr = _x_steps_numpy(X_steps)
+    x_arr = None
+
     for i in range(fh):
-        selected_lags = range(i + 1, lags + i)
-        lag_cols = [pl.col(f"{target_col}__lag_{j}").list.get(i) for j in selected_lags]
-        x = y_lag.select([entity_col, pl.col(time_col).list.get(i), *lag_cols])
-        if X is not None:
-            x_slice = X.groupby(entity_col, maintain_order=True).agg(
-                pl.col(X_feature_cols).take(i)
-            )
-            x = x.join(x_slice, on=entity_col, how="left")
+        # Horizon `i + 1` regresses on lags `i + 1`...`i + lags`
+        lag_cols = [f"{target_col}__lag_{i + j + 1}" for j in range(lags)]
         # Predict
-        y_pred_i = regressors[i].predict(x)
+        predict_numpy = getattr(regressors[i], "predict_numpy", None)
+        if predict_numpy is not None and X_steps is None:
+            y_pred_i = predict_numpy(y_lag_arr, feature_names=lag_cols, idx=idx)
+        elif predict_numpy is not None and X_steps_arr is not None:
+            if x_arr is None:
+                x_dtype = np.result_type(y_lag_arr.dtype, X_steps_arr.dtype)
+                x_arr = np.empty((n_entities, lags + X_steps.width), dtype=x_dtype)
+                x_arr[:, :lags] = y_lag_arr
+            x_arr[:, lags:] = X_steps_arr[i * n_entities : (i + 1) * n_entities]
+            feature_names = [*lag_cols, *X_steps.columns]
+            y_pred_i = predict_numpy(x_arr, feature_names=feature_names, idx=idx)
+        else:
+            x = idx.hstack(
+                [pl.Series(col, y_lag_arr[:, j]) for j, col in enumerate(lag_cols)]
+            )
+            if X_steps is not None:
+                x = x.hstack(_get_x_slice(X_steps, n_entities=n_entities, i=i))
+            y_pred_i = regressors[i].predict(x)
         # Censored forecast adjustment
         if is_censored:
             y_pred_i, weights_i = y_pred_i
@@ -313,7 +747,7 @@ def predict_direct(state, fh: int, X: Optional[pl.DataFrame] = None) -> pl.DataF
         .select([entity_col, target_col])
     )
     if is_censored:
-        weights = pl.DataFrame(np.stack(weights, axis=1).astype()).select(
+        weights = pl.DataFrame(np.stack(weights, axis=1).astype(np.float32)).select(
             pl.concat_list(pl.all()).alias("threshold_proba")
         )
         y_pred = pl.concat([y_pred, weights], how="horizontal")
@@ -329,6 +763,7 @@ def predict_autoreg(
     state,
     fh: int,
     X: Optional[Union[pl.DataFrame, pl.LazyFrame]] = None,
+    engine: Literal["numpy", "polars"] = "numpy",
 ) -> pl.DataFrame:
     strategy = state.strategy
     predict_kwargs = {
@@ -337,12 +772,12 @@ def predict_autoreg(
         "X": X.lazy().collect() if X is not None else None,
     }
     if strategy == "recursive":
-        y_pred = predict_recursive(**predict_kwargs)
+        y_pred = predict_recursive(**predict_kwargs, engine=engine)
     elif strategy == "direct":
         y_pred = predict_direct(**predict_kwargs)
     elif strategy == "ensemble":
         target_col = state.target
-        y_pred_rec = predict_recursive(**predict_kwargs).rename(
+        y_pred_rec = predict_recursive(**predict_kwargs, engine=engine).rename(
             {target_col: "recursive"}
         )
         y_pred_dir = predict_direct(**predict_kwargs).rename({target_col: "direct"})
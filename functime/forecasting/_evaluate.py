@@ -1,17 +1,15 @@
 import logging
+from contextvars import copy_context
 from functools import partial
-from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, Tuple, Union
 
 import polars as pl
+from joblib import Parallel, delayed
 
 from functime.metrics import mae
 
-try:
-    import flaml
-    from flaml import CFO
+if TYPE_CHECKING:
     from flaml.tune.sample import Domain
-except ImportError:
-    pass
 
 
 def evaluate_window(
@@ -71,26 +69,31 @@ def evaluate_windows(
     forecaster_cls: Callable,
     y_splits: Mapping[int, Tuple[pl.DataFrame, pl.DataFrame]],
     X_splits: Optional[Mapping[int, Tuple[pl.DataFrame, pl.DataFrame]]],
+    n_jobs: int = 1,
 ):
     # Get average mae across splits
-    results = []
-    for i in range(n_splits):
-        y_train, y_test = y_splits[i]
-        X_train, X_test = X_splits[i] if X_splits is not None else None, None
-        result = evaluate_window(
-            y_train=y_train,
-            y_test=y_test,
-            X_train=X_train,
-            X_test=X_test,
-            config=config,
-            lags=lags,
-            test_size=test_size,
-            max_horizons=max_horizons,
-            strategy=strategy,
-            freq=freq,
-            forecaster_cls=forecaster_cls,
+    window_kwargs = {
+        "config": config,
+        "lags": lags,
+        "test_size": test_size,
+        "max_horizons": max_horizons,
+        "strategy": strategy,
+        "freq": freq,
+        "forecaster_cls": forecaster_cls,
+    }
+    # NOTE: Each thread runs in a copy of the current context to share reductions
+    context = copy_context()
+    results = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(context.copy().run)(
+            evaluate_window,
+            y_train=y_splits[i][0],
+            y_test=y_splits[i][1],
+            X_train=X_splits[i][0] if X_splits is not None else None,
+            X_test=X_splits[i][1] if X_splits is not None else None,
+            **window_kwargs,
         )
-        results.append(result)
+        for i in range(n_splits)
+    )
     scores = [res["score"] for res in results]
     score = None
     if len(scores) > 0:
@@ -115,7 +118,8 @@ def evaluate(
     forecaster_cls: Callable,
     y_splits: Mapping[int, Tuple[pl.DataFrame, pl.DataFrame]],
     X_splits: Optional[Mapping[int, Tuple[pl.DataFrame, pl.DataFrame]]],
-    search_space: Optional[Mapping[str, Domain]] = None,
+    search_space: Optional[Mapping[str, "Domain"]] = None,
+    n_jobs: int = 1,
 ):
     params = None
     if search_space is None:
@@ -130,9 +134,13 @@ def evaluate(
             forecaster_cls=forecaster_cls,
             y_splits=y_splits,
             X_splits=X_splits,
+            n_jobs=n_jobs,
         )
         score = result["mae"]
     else:
+        import flaml
+        from flaml import CFO
+
         tuner = flaml.tune.run(
             partial(
                 evaluate_windows,
@@ -145,6 +153,7 @@ def evaluate(
                 forecaster_cls=forecaster_cls,
                 y_splits=y_splits,
                 X_splits=X_splits,
+                n_jobs=n_jobs,
             ),
             config=search_space,
             metric="mae",
@@ -1,9 +1,12 @@
-from typing import Optional
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, List, Optional, Tuple
 
+import numpy as np
 import polars as pl
 
-from functime.preprocessing import lag
-
 
 def _join_X_y(y: pl.LazyFrame, X: pl.LazyFrame) -> pl.LazyFrame:
     on = set(y.columns[:2]) & set(X.columns[:2])
@@ -16,17 +19,135 @@ def _join_X_y(y: pl.LazyFrame, X: pl.LazyFrame) -> pl.LazyFrame:
     return X_y
 
 
-def make_reduction(
-    lags: int, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None
-) -> pl.DataFrame:
-    idx_cols = y.columns[:2]
-    # Defensive lazy
-    y = y.lazy()
-    X = X.lazy() if X is not None else X
+def _fingerprint(df: pl.DataFrame) -> Tuple:
+    return tuple(df.schema.items()), df.height, df.hash_rows(seed=0).sum()
+
+
+class _SharedReduction:
+    """Lagged features 1...`max_lags` per distinct (y, X), built at most once."""
+
+    _ROW_COL = "__row"
+
+    def __init__(self, max_lags: int):
+        self.max_lags = max_lags
+        self._frames = {}
+        self._artifacts = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _build(self, y: pl.DataFrame, X: Optional[pl.DataFrame]) -> pl.DataFrame:
+        entity_col, time_col = y.columns[:2]
+        value_cols = y.columns[2:]
+        X_y = (
+            y.lazy()
+            .sort([entity_col, time_col])
+            .with_columns(
+                [
+                    pl.col(value_cols).shift(j).over(entity_col).suffix(f"__lag_{j}")
+                    for j in range(1, self.max_lags + 1)
+                ]
+                + [pl.col(time_col).cumcount().over(entity_col).alias(self._ROW_COL)]
+            )
+        )
+        if X is not None:
+            X_y = _join_X_y(X_y, X.lazy())
+        return X_y.collect()
+
+    def reduce(
+        self, lags: int, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None
+    ) -> pl.DataFrame:
+        y = y.collect()
+        X = X.collect() if X is not None else X
+        key = (_fingerprint(y), _fingerprint(X) if X is not None else None)
+        with self._key_lock(key):
+            if key not in self._frames:
+                self._frames[key] = self._build(y, X)
+        X_y = self._frames[key]
+        value_cols = y.columns[2:]
+        lag_cols = [f"{col}__lag_{j}" for j in range(1, lags + 1) for col in value_cols]
+        n_cols = y.width + self.max_lags * len(value_cols) + 1
+        # Rows before the `lags`-th observation per entity have null lags
+        X_y_final = X_y.filter(pl.col(self._ROW_COL) >= lags).select(
+            [*y.columns, *lag_cols, *X_y.columns[n_cols:]]
+        )
+        return X_y_final
+
+    def memoize(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._key_lock(key):
+            if key not in self._artifacts:
+                self._artifacts[key] = build()
+        return self._artifacts[key]
+
+
+_SHARED_REDUCTION: ContextVar[Optional[_SharedReduction]] = ContextVar(
+    "_SHARED_REDUCTION", default=None
+)
+
+
+@contextmanager
+def shared_reduction(max_lags: int):
+    """Share one set of lagged features across reductions within the context.
+
+    The first reduction per distinct `y` (and `X`) computes lags 1...`max_lags`.
+    Every later reduction with `lags <= max_lags` slices the lag column prefix
+    and drops the first `lags` rows per entity, i.e. equivalent to `make_reduction`.
+    Worker threads must run in a copy of the caller's context
+    (`contextvars.copy_context().run`) to share the cache.
+
+    Parameters
+    ----------
+    max_lags : int
+        Maximum number of lags computed per reduction.
+    """
+    token = _SHARED_REDUCTION.set(_SharedReduction(max_lags=max_lags))
+    try:
+        yield
+    finally:
+        _SHARED_REDUCTION.reset(token)
+
+
+def shared_key(*dfs: pl.DataFrame) -> Optional[Tuple]:
+    """Fingerprint of `dfs` to key a `shared_artifact`, None outside the context."""
+    if _SHARED_REDUCTION.get() is None:
+        return None
+    return tuple(_fingerprint(df) for df in dfs)
+
+
+def shared_artifact(key: Optional[Hashable], build: Callable[[], Any]) -> Any:
+    """Build an artifact derived from a reduction (e.g. a binned dataset) at most once.
+
+    Within the `shared_reduction` context, `build()` runs once per distinct `key`
+    (see `shared_key`). Outside of it, or if `key` is None, `build()` always runs.
+    """
+    shared = _SHARED_REDUCTION.get()
+    if shared is None or key is None:
+        return build()
+    return shared.memoize(key, build)
+
+
+def _reduce(lags: int, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
+    shared = _SHARED_REDUCTION.get()
+    if shared is not None and lags <= shared.max_lags:
+        return shared.reduce(lags=lags, y=y, X=X)
+    entity_col, time_col = y.columns[:2]
+    value_cols = y.columns[2:]
     # Get lags
-    y_lag = y.pipe(lag(lags=list(range(1, lags + 1))))
-    X_y = y_lag.join(y, on=idx_cols, how="inner").select(
-        [*y.columns, *y_lag.columns[2:]]
+    # NOTE: Lags are added to the sorted panel instead of joined back onto `y`
+    # (projection pushdown on that join drops the target column in polars 0.18).
+    # Shifts only cross entities in the first `lags` rows per entity, which are dropped
+    X_y = (
+        y.sort([entity_col, time_col])
+        .with_columns(
+            [
+                pl.col(value_cols).shift(j).suffix(f"__lag_{j}")
+                for j in range(1, lags + 1)
+            ]
+        )
+        .filter(pl.col(entity_col) == pl.col(entity_col).shift(lags))
     )
     # Exogenous features
     if X is not None:
@@ -37,36 +158,169 @@ def make_reduction(
     return X_y_final
 
 
+def make_reduction(
+    lags: int, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None
+) -> pl.DataFrame:
+    # Defensive lazy
+    y = y.lazy()
+    X = X.lazy() if X is not None else X
+    return _reduce(lags=lags, y=y, X=X)
+
+
 def make_direct_reduction(
     lags: int, max_horizons: int, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None
 ) -> pl.DataFrame:
-    idx_cols = y.columns[:2]
     # Defensive lazy
     y = y.lazy()
     X = X.lazy() if X is not None else X
-    # Get lags
-    y_lag = y.pipe(lag(lags=list(range(1, lags + max_horizons + 1))))
-    X_y = y_lag.join(y, on=idx_cols, how="inner").select(
-        [*y.columns, *y_lag.columns[2:]]
-    )
-    # Drop nulls in lagged columns
-    if X is not None:
-        X_y = _join_X_y(X_y, X)
-    # NOTE: Cannot use streaming...
-    # Raises error: pyo3_runtime.PanicException: internal error: entered unreachable code
-    X_y_final = X_y.collect()
-    return X_y_final
+    return _reduce(lags=lags + max_horizons, y=y, X=X)
+
+
+class ReductionBatches(Sequence):
+    """Lagged features of `y` (and `X`) reduced per batch of entities.
+
+    Entities are assigned in order to contiguous batches by their cumulative
+    number of observations, such that the lagged features of every batch take
+    roughly at most `memory_budget` bytes (8 bytes per value). An entity is never split
+    across batches. Batch `i` is only scanned and reduced when accessed.
+
+    Parameters
+    ----------
+    lags : int
+        Number of lagged target variables.
+    y : pl.LazyFrame
+        Panel LazyFrame of the target (e.g. `pl.scan_parquet`).
+    X : Optional[pl.LazyFrame]
+        Panel LazyFrame of exogenous features.
+    memory_budget : int
+        Maximum size in bytes of the lagged features of one batch.
+    """
+
+    def __init__(
+        self,
+        lags: int,
+        y: pl.LazyFrame,
+        X: Optional[pl.LazyFrame] = None,
+        memory_budget: int = 2**30,
+    ):
+        entity_col = y.columns[0]
+        n_cols = len(y.columns) * (lags + 1) - 2 * lags
+        if X is not None:
+            n_cols += len(X.columns) - 2
+            # Exogenous features without entities are shared across batches
+            if X.columns[0] != entity_col:
+                X = X.collect()
+        max_rows = max(memory_budget // (8 * n_cols), 1)
+        batches = (
+            y.groupby(entity_col)
+            .agg(pl.count().alias("n_obs"))
+            .collect(streaming=True)
+            .sort(entity_col)
+            .select(
+                [
+                    entity_col,
+                    ((pl.col("n_obs").cumsum() - pl.col("n_obs")) // max_rows).alias(
+                        "batch"
+                    ),
+                ]
+            )
+        )
+        self.lags = lags
+        self.y = y
+        self.X = X
+        self.entities: List[pl.Series] = [
+            df.get_column(entity_col)
+            for df in batches.partition_by("batch", maintain_order=True)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.entities)
 
+    def collect(self, i: int) -> Tuple[pl.DataFrame, Optional[pl.DataFrame]]:
+        """Observations `y` (and `X`) of the entities in batch `i`."""
+        entity_col = self.y.columns[0]
+        is_batch = pl.col(entity_col).is_in(self.entities[i])
+        y = self.y.filter(is_batch).collect(streaming=True)
+        X = self.X
+        if isinstance(X, pl.LazyFrame):
+            X = X.filter(is_batch).collect(streaming=True)
+        return y, X
 
-def make_y_lag(X_y: pl.DataFrame, target_col: str, lags: int):
-    # NOTE: We should probably do a defensive sort on time before concat_list
-    entity_col, time_col = X_y.columns[:2]
+    def __getitem__(self, i: int) -> pl.DataFrame:
+        y, X = self.collect(i)
+        return make_reduction(lags=self.lags, y=y, X=X)
+
+    def split(self, target_col: str, feature_cols: List[str]) -> "XyBatches":
+        """Features `feature_cols` and target `target_col` of every batch."""
+        return XyBatches(self, target_col=target_col, feature_cols=feature_cols)
+
+
+class XyBatches(Sequence):
+    """Pairs of features `X` and target `y` per batch of `ReductionBatches`."""
+
+    def __init__(
+        self, batches: ReductionBatches, target_col: str, feature_cols: List[str]
+    ):
+        self.batches = batches
+        self.target_col = target_col
+        self.feature_cols = feature_cols
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+    def __getitem__(self, i: int) -> Tuple[pl.DataFrame, pl.DataFrame]:
+        X_y = self.batches[i]
+        idx_cols = X_y.columns[:2]
+        X = X_y.select([*idx_cols, *self.feature_cols])
+        y = X_y.select([*idx_cols, self.target_col])
+        return X, y
+
+    def select(self, feature_cols: List[str]) -> "XyBatches":
+        return XyBatches(
+            self.batches, target_col=self.target_col, feature_cols=feature_cols
+        )
+
+
+def make_y_lag(y: pl.LazyFrame, lags: int) -> pl.LazyFrame:
+    """Compact target history per entity, from which lagged features are derived.
+
+    Returns one row per entity with its last timestamp and a fixed-width
+    Float32 list of its most recent `lags` target values (oldest first),
+    i.e. `{target}__lag_{j}` of the next observation is the `j`-th last value.
+    Entities with fewer than `lags` observations are dropped.
+    """
+    entity_col, time_col = y.columns[:2]
+    target_col = y.columns[-1]
+    count_col = "__count"
     y_lag = (
-        X_y.lazy()
-        .select([entity_col, time_col, pl.col(rf"^{target_col}__lag_(\d+)$")])
+        y.lazy()
         .groupby(entity_col)
-        .agg(pl.all().tail(lags))
+        .agg(
+            [
+                pl.col(time_col).max(),
+                pl.col(target_col).sort_by(time_col).tail(lags).cast(pl.Float32),
+                pl.count().alias(count_col),
+            ]
+        )
+        .filter(pl.col(count_col) >= lags)
+        .drop(count_col)
         .collect(streaming=True)
         .lazy()
     )
     return y_lag
+
+
+def y_lag_width(y_lag: pl.DataFrame) -> int:
+    """Number of target values held per entity by `make_y_lag`."""
+    return y_lag.get_column(y_lag.columns[-1]).list.lengths().max()
+
+
+def y_lag_matrix(y_lag: pl.DataFrame, lags: int) -> np.ndarray:
+    """Column-major lag matrix of shape (n_entities, lags) from `make_y_lag` history.
+
+    Column `j` holds `{target}__lag_{j + 1}`, i.e. the most recent value first.
+    """
+    values = y_lag.get_column(y_lag.columns[-1]).explode().to_numpy()
+    width = y_lag_width(y_lag)
+    y_hist = values.reshape(len(y_lag), width)
+    return np.asfortranarray(y_hist[:, : -lags - 1 : -1])
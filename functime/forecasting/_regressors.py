@@ -2,26 +2,60 @@
 Fit-predict regressors with special needs.
 """
 
-from typing import Callable, Optional, Union
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Callable, List, Mapping, Optional, Union
 
 import numpy as np
+import pandas as pd
 import polars as pl
-import sklearn
+import pyarrow as pa
+from joblib import Parallel, delayed
 from typing_extensions import Literal
 
 from functime.conversion import df_to_ndarray
 from functime.preprocessing import PL_NUMERIC_COLS
 
+if TYPE_CHECKING:
+    from functime.forecasting._reduction import XyBatches
 
-def _X_to_numpy(X: pl.DataFrame) -> np.ndarray:
+
+def _X_to_numpy(X: pl.DataFrame, order: Literal["C", "F"] = "F") -> np.ndarray:
+    # NOTE: Spills to disk above the budget of the enclosing `spill_to_disk` context
     X_arr = (
         X.select(pl.col(X.columns[2:]).cast(pl.Float32))
         .fill_null(strategy="mean")
-        .pipe(df_to_ndarray)
+        .pipe(df_to_ndarray, order=order)
     )
     return X_arr
 
 
+def _X_to_arrow(X: pl.DataFrame) -> pa.Table:
+    # Categoricals stay dictionary-encoded and nulls stay missing (i.e. no imputation)
+    X_arrow = X.select(pl.col(X.columns[2:])).to_arrow()
+    # NOTE: Polars exports categoricals with uint32 indices, which pandas rejects
+    schema = pa.schema(
+        [
+            field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+            if pa.types.is_dictionary(field.type)
+            else field
+            for field in X_arrow.schema
+        ]
+    )
+    return X_arrow.cast(schema)
+
+
+def _X_to_pandas(
+    X: pl.DataFrame, categories: Optional[Mapping[str, pd.Index]] = None
+) -> pd.DataFrame:
+    # NOTE: Split blocks to convert every Arrow column on its own (zero-copy for
+    # numeric columns without nulls) instead of consolidating into one dense matrix
+    X_df = _X_to_arrow(X).to_pandas(split_blocks=True)
+    for col, cats in (categories or {}).items():
+        # Fix category codes to those seen in fit, unseen categories are missing
+        X_df[col] = X_df[col].cat.set_categories(cats)
+    return X_df
+
+
 def _y_to_numpy(y: pl.DataFrame) -> np.ndarray:
     return (
         y.get_column(y.columns[-1])
@@ -31,61 +65,257 @@ def _y_to_numpy(y: pl.DataFrame) -> np.ndarray:
     )
 
 
+class NumpyBatches(Sequence):
+    """Row-major feature matrices of `XyBatches`, converted one batch at a time.
+
+    Only the most recently accessed batch is kept in memory, i.e. batches should be
+    accessed in order (e.g. LightGBM `Sequence`, XGBoost `DataIter`).
+    """
+
+    def __init__(
+        self,
+        batches: "XyBatches",
+        preproc: Callable[[pl.DataFrame], pl.DataFrame],
+        lengths: List[int],
+        feature_names: List[str],
+        categorical_names: List[str],
+    ):
+        self.batches = batches
+        self.preproc = preproc
+        self.lengths = lengths
+        self.feature_names = feature_names
+        self.categorical_names = categorical_names
+        self._cache = (None, None)
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        j, X_arr = self._cache
+        if j != i:
+            # Release the previous batch before converting the next one
+            self._cache = (None, None)
+            X, _ = self.batches[i]
+            X_arr = _X_to_numpy(self.preproc(X), order="C")
+            self._cache = (i, X_arr)
+        return X_arr
+
+
 class GradientBoostedTreeRegressor:
+    """Gradient boosted trees fitted on features coerced into `fit_dtype`.
+
+    - "numpy": dense Float32 matrix, categoricals as physical codes and nulls
+    filled with column means.
+    - "arrow": `pa.Table` with categoricals as dictionary columns and nulls kept.
+    - "pandas": `pd.DataFrame` converted column by column from Arrow, with
+    categoricals as `pd.Categorical` and nulls kept as missing values.
+
+    Columnar dtypes leave categoricals and missing values to the booster's native
+    handling. Categories seen in fit are fixed so that predictions use the same codes.
+    Predictions are returned by the booster's `predict_method` (e.g. XGBoost's
+    `inplace_predict`, which skips building a `DMatrix` per call).
+    """
+
     def __init__(
         self,
         regress,
         weight_transform: Optional[Callable] = None,
-        fit_dtype: Literal["numpy", "arrow"] = None,
-        predict_dtype: Union[Literal["numpy", "arrow"], Callable] = None,
+        fit_dtype: Literal["numpy", "arrow", "pandas"] = None,
+        predict_dtype: Union[Literal["numpy", "arrow", "pandas"], Callable] = None,
+        regress_batches: Optional[Callable] = None,
+        predict_wrapper: Optional[Callable] = None,
+        predict_method: str = "predict",
     ):
         self.regress = regress
+        self.regress_batches = regress_batches
         self.regressor = None
         self.weight_transform = weight_transform
         self.fit_dtype = fit_dtype or "numpy"
         self.predict_dtype = predict_dtype or "numpy"
+        self.predict_wrapper = predict_wrapper
+        self.predict_method = predict_method
+        self.categories = None
         self.label_to_cat = {}
 
-    def _preproc_X(self, X: pl.DataFrame) -> pl.DataFrame:
+    @staticmethod
+    def _preproc_X(X: pl.DataFrame, columnar: bool = False) -> pl.DataFrame:
         entity_col = X.columns[0]
-        X_new = X.with_columns(
-            pl.col([pl.Categorical, pl.Boolean]).exclude(entity_col).to_physical()
-        )
+        if columnar:
+            X_new = X.with_columns(pl.col(pl.Boolean).exclude(entity_col).cast(pl.Int8))
+        else:
+            X_new = X.with_columns(
+                pl.col([pl.Categorical, pl.Boolean]).exclude(entity_col).to_physical()
+            )
         return X_new
 
+    def _coerce_X(self, X: pl.DataFrame, dtype: str):
+        X = self._preproc_X(X, columnar=dtype != "numpy")
+        if dtype == "numpy":
+            X_coerced = _X_to_numpy(X)
+        elif dtype == "arrow":
+            X_coerced = _X_to_arrow(X)
+        elif dtype == "pandas":
+            X_coerced = _X_to_pandas(X, categories=self.categories)
+            if self.categories is None:
+                self.categories = {
+                    col: X_coerced[col].cat.categories
+                    for col in X_coerced.select_dtypes("category").columns
+                }
+        else:
+            raise ValueError(f"dtype not supported: {dtype}")
+        return X_coerced
+
     def fit(self, X: pl.DataFrame, y: pl.DataFrame):
+        self.regressor = self._train(X=X, y=y)
+        return self
+
+    def fit_batches(self, batches: "XyBatches"):
+        """Fit on batches of features and target without concatenating the features.
+
+        Every batch is reduced once to collect the target (and sample weights).
+        Features are then streamed into `regress_batches` as `NumpyBatches`.
+        """
+        feature_names = None
+        labels, weights, lengths = [], [], []
+        for X, y in batches:
+            if feature_names is None:
+                feature_names = X.columns[2:]
+                categorical_names = X.select(
+                    pl.col(pl.Categorical).exclude(X.columns[:2])
+                ).columns
+            lengths.append(len(y))
+            labels.append(_y_to_numpy(y))
+            if self.weight_transform is not None:
+                weights.append(np.asarray(y.pipe(self.weight_transform)))
+        X_batches = NumpyBatches(
+            batches,
+            preproc=self._preproc_X,
+            lengths=lengths,
+            feature_names=feature_names,
+            categorical_names=categorical_names,
+        )
+        self.regressor = self.regress_batches(
+            X=X_batches,
+            y=np.concatenate(labels),
+            sample_weight=np.concatenate(weights) if weights else None,
+        )
+        return self
+
+    def update(self, X: pl.DataFrame, y: pl.DataFrame):
+        if self.regress is None:
+            raise ValueError("`warm_start` is not supported if fitted out-of-core")
+        # Continue boosting from the fitted model i.e. append trees
+        self.regressor = self._train(X=X, y=y, init_model=self.regressor)
+        return self
+
+    def fit_coerced(self, X_coerced, y: pl.DataFrame):
+        """Fit on features already coerced into `fit_dtype` (see `fit_horizons`)."""
+        self.regressor = self._train_coerced(X_coerced=X_coerced, y=y)
+        return self
+
+    def _train(self, X: pl.DataFrame, y: pl.DataFrame, **kwargs):
+        if self.fit_dtype not in ["numpy", "arrow", "pandas"]:
+            raise ValueError(f"`fit_dtype` not supported: {self.fit_dtype}")
+        X_coerced = self._coerce_X(X, dtype=self.fit_dtype)
+        return self._train_coerced(X_coerced=X_coerced, y=y, **kwargs)
+
+    def _train_coerced(self, X_coerced, y: pl.DataFrame, **kwargs):
 
         weight_transform = self.weight_transform
         sample_weight = None
         if weight_transform is not None:
             sample_weight = y.pipe(weight_transform)
 
-        X = self._preproc_X(X)
-
-        if self.fit_dtype == "numpy":
-            X_coerced = _X_to_numpy(X)
-            y_coerced = _y_to_numpy(X)
-        elif self.fit_dtype == "arrow":
-            X_coerced = X.to_arrow()
-            y_coerced = y.to_arrow()
-        else:
-            raise ValueError(f"`fit_dtype` not supported: {self.fit_dtype}")
+        y_coerced = _y_to_numpy(y)
 
-        self.regressor = self.regress(
-            X=X_coerced, y=y_coerced, sample_weight=sample_weight
+        return self.regress(
+            X=X_coerced, y=y_coerced, sample_weight=sample_weight, **kwargs
         )
-        return self
+
+    def _predict(self, X_coerced) -> np.ndarray:
+        if self.predict_wrapper is not None:
+            X_coerced = self.predict_wrapper(X_coerced)
+        y_pred = getattr(self.regressor, self.predict_method)(X_coerced)
+        return y_pred
 
     def predict(self, X: pl.DataFrame) -> np.ndarray:
-        X = self._preproc_X(X)
+        if isinstance(self.predict_dtype, Callable):
+            X_coerced = self.predict_dtype(self._preproc_X(X))
+        else:
+            X_coerced = self._coerce_X(X, dtype=self.predict_dtype)
+        return self._predict(X_coerced)
+
+    def predict_numpy(
+        self,
+        X: np.ndarray,
+        feature_names: List[str],
+        idx: Optional[pl.DataFrame] = None,
+    ) -> np.ndarray:
+        """Predict from a dense matrix of numeric features (e.g. lagged targets).
+
+        Callable `predict_dtype` fall back to `predict` on a frame of `idx`
+        (entity and time columns) and the features.
+        """
+        if isinstance(self.predict_dtype, Callable):
+            X_features = [
+                pl.Series(col, X[:, j]) for j, col in enumerate(feature_names)
+            ]
+            return self.predict(idx.hstack(X_features))
         if self.predict_dtype == "numpy":
-            X_coerced = _X_to_numpy(X)
+            X_coerced = X
+        elif self.predict_dtype == "pandas":
+            X_coerced = pd.DataFrame(X, columns=feature_names, copy=False)
         elif self.predict_dtype == "arrow":
-            X_coerced = X.to_arrow
-        elif isinstance(self.predict_dtype, Callable):
-            X_coerced = self.predict_dtype(X)
-        y_pred = self.regressor.predict(X_coerced)
-        return y_pred
+            X_coerced = pa.Table.from_arrays(list(X.T), names=feature_names)
+        else:
+            raise ValueError(f"`predict_dtype` not supported: {self.predict_dtype}")
+        return self._predict(X_coerced)
+
+
+def _select_coerced(X_coerced, positions: List[int]):
+    # Column slice of coerced features, without converting them again
+    if isinstance(X_coerced, np.ndarray):
+        return np.asfortranarray(X_coerced[:, positions])
+    if isinstance(X_coerced, pa.Table):
+        return X_coerced.select(positions)
+    return X_coerced.iloc[:, positions].copy(deep=False)
+
+
+def fit_horizons(
+    make_regressor: Callable[[pl.DataFrame], GradientBoostedTreeRegressor],
+    X: pl.DataFrame,
+    y: pl.DataFrame,
+    horizon_cols: List[List[str]],
+    n_jobs: int = 1,
+) -> List[GradientBoostedTreeRegressor]:
+    """Fit one regressor per direct horizon on column slices of `X` coerced once.
+
+    `X` holds the features of every horizon (e.g. lags `1`...`lags + max_horizons - 1`),
+    which overlap between horizons. `make_regressor` returns an unfitted regressor
+    for the features of one horizon.
+    """
+    idx_cols = X.columns[:2]
+    feature_cols = X.columns[2:]
+    regressors = [make_regressor(X.select([*idx_cols, *cols])) for cols in horizon_cols]
+    # NOTE: Regressors of every horizon share `fit_dtype`
+    regressor = regressors[0]
+    X_coerced = regressor._coerce_X(X, dtype=regressor.fit_dtype)
+    categories = regressor.categories
+
+    def fit(regressor: GradientBoostedTreeRegressor, cols: List[str]):
+        if categories is not None:
+            # Fix the categories of this horizon's features only
+            regressor.categories = {
+                col: cats for col, cats in categories.items() if col in cols
+            }
+        positions = [feature_cols.index(col) for col in cols]
+        return regressor.fit_coerced(_select_coerced(X_coerced, positions), y=y)
+
+    # NOTE: Threads by default since regressors release the GIL.
+    return Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(fit)(regressor, cols)
+        for regressor, cols in zip(regressors, horizon_cols)
+    )
 
 
 class StandardizedSklearnRegressor:
@@ -93,7 +323,8 @@ class StandardizedSklearnRegressor:
         self.estimator = estimator
         self.pipeline = None
 
-    def _preproc_X(self, X: pl.DataFrame):
+    @staticmethod
+    def _preproc_X(X: pl.DataFrame):
         entity_col, time_col = X.columns[:2]
         X_new = X.select(
             [
@@ -107,6 +338,7 @@ class StandardizedSklearnRegressor:
         return X_new
 
     def fit(self, X: pl.DataFrame, y: pl.DataFrame):
+        from sklearn import config_context
         from sklearn.compose import ColumnTransformer
         from sklearn.pipeline import Pipeline
         from sklearn.preprocessing import MaxAbsScaler, OneHotEncoder
@@ -145,17 +377,382 @@ class StandardizedSklearnRegressor:
 
         # Fit pipeline
         pipeline = Pipeline(steps=steps)
-        with sklearn.config_context(assume_finite=True):
+        with config_context(assume_finite=True):
             self.pipeline = pipeline.fit(X=_X_to_numpy(X), y=_y_to_numpy(y))
         return self
 
     def predict(self, X: pl.DataFrame) -> np.ndarray:
+        from sklearn import config_context
+
         # Defensive reordering X and cast boolean to 0, 1
         X = self._preproc_X(X)
-        with sklearn.config_context(assume_finite=True):
+        with config_context(assume_finite=True):
             y_pred = self.pipeline.predict(_X_to_numpy(X))
         return y_pred
 
+    def predict_numpy(
+        self,
+        X: np.ndarray,
+        feature_names: List[str],
+        idx: Optional[pl.DataFrame] = None,
+    ) -> np.ndarray:
+        """Predict from a dense matrix of numeric features (e.g. lagged targets)."""
+        from sklearn import config_context
+
+        with config_context(assume_finite=True):
+            y_pred = self.pipeline.predict(X)
+        return y_pred
+
+
+class LinearHorizonRegressor:
+    """Standardized linear regressor for a single direct forecast horizon.
+
+    Fitted by `fit_linear_horizons`. Predictions match a `StandardizedSklearnRegressor`
+    with the same coefficients: numeric columns are max-abs scaled, categorical columns
+    one-hot encoded (if more than one), and boolean columns passed through (if more than one).
+    """
+
+    def __init__(
+        self,
+        coef: np.ndarray,
+        intercept: float,
+        scale: np.ndarray,
+        n_categorical: int = 0,
+        encoder=None,
+        passthrough_boolean: bool = False,
+    ):
+        self.coef = coef
+        self.intercept = intercept
+        self.scale = scale
+        self.n_categorical = n_categorical
+        self.encoder = encoder
+        self.passthrough_boolean = passthrough_boolean
+
+    def predict(self, X: pl.DataFrame) -> np.ndarray:
+        # Defensive reordering X and cast boolean to 0, 1
+        X = StandardizedSklearnRegressor._preproc_X(X)
+        return self.predict_numpy(_X_to_numpy(X), feature_names=X.columns[2:])
+
+    def predict_numpy(
+        self,
+        X: np.ndarray,
+        feature_names: List[str],
+        idx: Optional[pl.DataFrame] = None,
+    ) -> np.ndarray:
+        """Predict from features ordered numeric, categorical, then boolean."""
+        X_arr = X
+        n_numeric = len(self.scale)
+        n_features = n_numeric + self.n_categorical
+        X_blocks = [X_arr[:, :n_numeric] / self.scale]
+        if self.encoder is not None:
+            X_blocks.append(self.encoder.transform(X_arr[:, n_numeric:n_features]))
+        if self.passthrough_boolean:
+            X_blocks.append(X_arr[:, n_features:])
+        return np.hstack(X_blocks) @ self.coef + self.intercept
+
+
+def _solve_linear_horizons(
+    gram: np.ndarray,
+    Xy: np.ndarray,
+    y: np.ndarray,
+    n_samples: int,
+    X_offset: Optional[np.ndarray],
+    y_offset: Optional[float],
+    scale: np.ndarray,
+    numeric_cols: List[str],
+    horizon_cols: List[List[str]],
+    n_categorical: int,
+    encoder,
+    passthrough_boolean: bool,
+    alpha: float,
+    l1_ratio: float,
+    positive: bool,
+    tol: float,
+    max_iter: int,
+) -> List[LinearHorizonRegressor]:
+    # Solve each horizon from the (centered) Gram sub-matrix of its own features.
+    # NOTE: `y` is only read through its squared norm i.e. the duality gap
+    from scipy import linalg
+    from sklearn.linear_model import enet_path
+
+    regressors = []
+    numeric_pos = {col: j for j, col in enumerate(numeric_cols)}
+    # Categorical and boolean features are shared across every horizon
+    shared_idx = np.arange(len(numeric_cols), gram.shape[0])
+    for cols in horizon_cols:
+        numeric_idx = [numeric_pos[col] for col in cols if col in numeric_pos]
+        idx = np.concatenate([numeric_idx, shared_idx]).astype(int)
+        gram_h = np.ascontiguousarray(gram[np.ix_(idx, idx)])
+        Xy_h = np.ascontiguousarray(Xy[idx])
+        if l1_ratio > 0:
+            # NOTE: Only the shape and dtype of X are read if `check_input=False`
+            _, coefs, _ = enet_path(
+                np.broadcast_to(np.zeros((), dtype=np.float64), (n_samples, len(idx))),
+                y,
+                l1_ratio=l1_ratio,
+                alphas=[alpha],
+                precompute=gram_h,
+                Xy=Xy_h,
+                positive=positive,
+                check_input=False,
+                tol=tol,
+                max_iter=max_iter,
+            )
+            coef = coefs[:, 0]
+        elif alpha > 0:
+            gram_h[np.diag_indices_from(gram_h)] += alpha
+            coef = linalg.solve(gram_h, Xy_h, assume_a="pos")
+        else:
+            coef = linalg.lstsq(gram_h, Xy_h)[0]
+        intercept = y_offset - X_offset[idx] @ coef if X_offset is not None else 0.0
+        regressor = LinearHorizonRegressor(
+            coef=coef,
+            intercept=intercept,
+            scale=scale[numeric_idx],
+            n_categorical=n_categorical,
+            encoder=encoder,
+            passthrough_boolean=passthrough_boolean,
+        )
+        regressors.append(regressor)
+    return regressors
+
+
+def fit_linear_horizons(
+    X: pl.DataFrame,
+    y: pl.DataFrame,
+    horizon_cols: List[List[str]],
+    alpha: float = 0.0,
+    l1_ratio: float = 0.0,
+    fit_intercept: bool = True,
+    positive: bool = False,
+    tol: float = 0.001,
+    max_iter: int = 10000,
+) -> List[LinearHorizonRegressor]:
+    """Fit one standardized linear regressor per direct forecast horizon.
+
+    `X` contains the union of every horizon's feature columns. `X` is converted,
+    scaled, and reduced into a Gram matrix once. Each horizon is then solved
+    from the Gram sub-matrix of its own feature columns: least squares if `alpha` is 0,
+    ridge if `l1_ratio` is 0, and coordinate descent (lasso / elastic net) otherwise.
+
+    Parameters
+    ----------
+    X : pl.DataFrame
+        Panel DataFrame of features with entity and time columns.
+    y : pl.DataFrame
+        Panel DataFrame of the target with entity and time columns.
+    horizon_cols : List[List[str]]
+        Feature columns per horizon (in order).
+    alpha : float
+        Regularization strength, same scale as the corresponding sklearn estimator.
+    l1_ratio : float
+        ElasticNet mixing parameter. 0 for ridge and 1 for lasso.
+    fit_intercept : bool
+        Whether to fit intercepts.
+    positive : bool
+        Constrain coefficients to be positive. Only supported if `l1_ratio > 0`.
+    tol : float
+        Coordinate descent tolerance.
+    max_iter : int
+        Maximum coordinate descent iterations.
+
+    Returns
+    -------
+    regressors : List[LinearHorizonRegressor]
+        Fitted regressor per horizon.
+    """
+    from sklearn.preprocessing import MaxAbsScaler, OneHotEncoder
+
+    if positive and l1_ratio == 0:
+        raise ValueError("`positive=True` is only supported if `l1_ratio > 0`")
+
+    # Get column names
+    entity_col, time_col = X.columns[:2]
+    numeric_cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
+    n_numeric = len(numeric_cols)
+    n_categorical = len(X.select(pl.col(pl.Categorical).exclude(entity_col)).columns)
+    n_boolean = len(X.select(pl.col(pl.Boolean)).columns)
+
+    # 1. Convert and standardize the shared feature matrix once
+    X_arr = _X_to_numpy(StandardizedSklearnRegressor._preproc_X(X))
+    y_arr = _y_to_numpy(y).astype(np.float64)
+    n_samples = X_arr.shape[0]
+    scale = MaxAbsScaler().fit(X_arr[:, :n_numeric]).scale_
+    X_blocks = [X_arr[:, :n_numeric] / scale]
+    encoder = None
+    if n_categorical > 1:
+        encoder = OneHotEncoder(
+            drop=None, dtype=np.int8, sparse_output=False, handle_unknown="ignore"
+        )
+        X_blocks.append(
+            encoder.fit_transform(X_arr[:, n_numeric : n_numeric + n_categorical])
+        )
+    if n_boolean > 1:
+        X_blocks.append(X_arr[:, n_numeric + n_categorical :])
+    X_arr = np.hstack(X_blocks).astype(np.float64)
+
+    # 2. Center and reduce into Gram matrix once
+    if fit_intercept:
+        X_offset = X_arr.mean(axis=0)
+        y_offset = y_arr.mean()
+        X_arr -= X_offset
+        y_arr -= y_offset
+    gram = X_arr.T @ X_arr
+    Xy = X_arr.T @ y_arr
+
+    # 3. Solve each horizon from its Gram sub-matrix
+    regressors = _solve_linear_horizons(
+        gram=gram,
+        Xy=Xy,
+        y=y_arr,
+        n_samples=n_samples,
+        X_offset=X_offset if fit_intercept else None,
+        y_offset=y_offset if fit_intercept else None,
+        scale=scale,
+        numeric_cols=numeric_cols,
+        horizon_cols=horizon_cols,
+        n_categorical=n_categorical,
+        encoder=encoder,
+        passthrough_boolean=n_boolean > 1,
+        alpha=alpha,
+        l1_ratio=l1_ratio,
+        positive=positive,
+        tol=tol,
+        max_iter=max_iter,
+    )
+    return regressors
+
+
+def fit_linear_horizons_batches(
+    batches: "XyBatches",
+    horizon_cols: List[List[str]],
+    alpha: float = 0.0,
+    l1_ratio: float = 0.0,
+    fit_intercept: bool = True,
+    positive: bool = False,
+    tol: float = 0.001,
+    max_iter: int = 10000,
+) -> List[LinearHorizonRegressor]:
+    """Fit one standardized linear regressor per horizon from batches of features.
+
+    Same estimator as `fit_linear_horizons`, but the Gram matrix is accumulated
+    over `batches` (e.g. `XyBatches` of a Parquet scan) such that at most one batch
+    of features is in memory. Batches are read twice: once for the max-abs
+    scale and categories, and once for the Gram matrix.
+
+    Parameters
+    ----------
+    batches : XyBatches
+        Pairs of panel DataFrames of features and target per batch of entities.
+    horizon_cols : List[List[str]]
+        Feature columns per horizon (in order).
+    alpha : float
+        Regularization strength, same scale as the corresponding sklearn estimator.
+    l1_ratio : float
+        ElasticNet mixing parameter. 0 for ridge and 1 for lasso.
+    fit_intercept : bool
+        Whether to fit intercepts.
+    positive : bool
+        Constrain coefficients to be positive. Only supported if `l1_ratio > 0`.
+    tol : float
+        Coordinate descent tolerance.
+    max_iter : int
+        Maximum coordinate descent iterations.
+
+    Returns
+    -------
+    regressors : List[LinearHorizonRegressor]
+        Fitted regressor per horizon.
+    """
+    from sklearn.preprocessing import OneHotEncoder
+
+    if positive and l1_ratio == 0:
+        raise ValueError("`positive=True` is only supported if `l1_ratio > 0`")
+
+    # 1. First pass: max-abs scale of numeric and levels of categorical columns
+    numeric_cols = None
+    for X, _ in batches:
+        X = StandardizedSklearnRegressor._preproc_X(X)
+        if numeric_cols is None:
+            entity_col, time_col = X.columns[:2]
+            numeric_cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
+            n_numeric = len(numeric_cols)
+            n_categorical = len(
+                X.select(pl.col(pl.Categorical).exclude(entity_col)).columns
+            )
+            n_boolean = len(X.select(pl.col(pl.Boolean)).columns)
+            scale = np.zeros(n_numeric)
+            categories = [set() for _ in range(n_categorical)]
+        if len(X) == 0:
+            continue
+        X_arr = _X_to_numpy(X)
+        scale = np.maximum(scale, np.abs(X_arr[:, :n_numeric]).max(axis=0))
+        for j, levels in enumerate(categories):
+            levels.update(np.unique(X_arr[:, n_numeric + j]))
+    # Same as `MaxAbsScaler` for constant zero columns
+    scale[scale == 0.0] = 1.0
+    encoder = None
+    if n_categorical > 1:
+        categories = [np.array(sorted(levels)) for levels in categories]
+        encoder = OneHotEncoder(
+            categories=categories,
+            drop=None,
+            dtype=np.int8,
+            sparse_output=False,
+            handle_unknown="ignore",
+        ).fit(np.array([[levels[0] for levels in categories]]))
+
+    # 2. Second pass: accumulate uncentered Gram matrix and moments
+    n_samples, X_sum, y_sum, y_norm2, gram, Xy = 0, 0.0, 0.0, 0.0, 0.0, 0.0
+    for X, y in batches:
+        if len(X) == 0:
+            continue
+        X_arr = _X_to_numpy(StandardizedSklearnRegressor._preproc_X(X))
+        y_arr = _y_to_numpy(y).astype(np.float64)
+        X_blocks = [X_arr[:, :n_numeric] / scale]
+        if encoder is not None:
+            X_blocks.append(
+                encoder.transform(X_arr[:, n_numeric : n_numeric + n_categorical])
+            )
+        if n_boolean > 1:
+            X_blocks.append(X_arr[:, n_numeric + n_categorical :])
+        X_arr = np.hstack(X_blocks).astype(np.float64)
+        n_samples += X_arr.shape[0]
+        X_sum = X_sum + X_arr.sum(axis=0)
+        y_sum += y_arr.sum()
+        y_norm2 += y_arr @ y_arr
+        gram = gram + X_arr.T @ X_arr
+        Xy = Xy + X_arr.T @ y_arr
+
+    # 3. Center and solve each horizon from its Gram sub-matrix
+    X_offset, y_offset = None, None
+    if fit_intercept:
+        X_offset = X_sum / n_samples
+        y_offset = y_sum / n_samples
+        gram = gram - n_samples * np.outer(X_offset, X_offset)
+        Xy = Xy - n_samples * X_offset * y_offset
+        y_norm2 -= n_samples * y_offset**2
+    regressors = _solve_linear_horizons(
+        gram=gram,
+        Xy=Xy,
+        y=np.array([np.sqrt(max(y_norm2, 0.0))]),
+        n_samples=n_samples,
+        X_offset=X_offset,
+        y_offset=y_offset,
+        scale=scale,
+        numeric_cols=numeric_cols,
+        horizon_cols=horizon_cols,
+        n_categorical=n_categorical,
+        encoder=encoder,
+        passthrough_boolean=n_boolean > 1,
+        alpha=alpha,
+        l1_ratio=l1_ratio,
+        positive=positive,
+        tol=tol,
+        max_iter=max_iter,
+    )
+    return regressors
+
 
 class CensoredRegressor:
     def __init__(
@@ -6,7 +6,7 @@ import polars as pl
 from flaml import tune
 from typing_extensions import Literal
 
-from functime.base.forecaster import FORECAST_STRATEGIES, Forecaster
+from functime.base.forecaster import FORECAST_STRATEGIES, PREDICT_ENGINES, Forecaster
 from functime.forecasting.knn import knn
 from functime.forecasting.lightgbm import lightgbm
 from functime.forecasting.linear import elastic_net, lasso, linear_model, ridge
@@ -43,6 +43,11 @@ class AutoForecaster(Forecaster):
         Equivalent to `points_to_evaluate` in [FLAML](https://microsoft.github.io/FLAML/docs/Use-Cases/Tune-User-Defined-Function#warm-start)
     num_samples : int
         Number of hyper-parameter sets to test. -1 means unlimited (until `time_budget` is exhausted.)
+    engine : str
+        Recursive prediction engine ("numpy" or "polars").
+    cv_n_jobs : int
+        Number of candidate lag counts (or CV splits, if tuning hyperparameters)
+        evaluated in parallel. Defaults to 1. -1 means using all processors.
     **kwargs : Mapping[str, Any]
         Additional keyword arguments passed into underlying sklearn-compatible estimator.
     """
@@ -63,6 +68,8 @@ class AutoForecaster(Forecaster):
         search_space: Optional[Mapping[str, Any]] = None,
         points_to_evaluate: Optional[Mapping[str, Any]] = None,
         num_samples: int = -1,
+        engine: PREDICT_ENGINES = "numpy",
+        cv_n_jobs: int = 1,
         **kwargs,
     ):
         self.freq = freq
@@ -77,6 +84,8 @@ class AutoForecaster(Forecaster):
         self.search_space = search_space
         self.points_to_evaluate = points_to_evaluate
         self.num_samples = num_samples
+        self.engine = engine
+        self.cv_n_jobs = cv_n_jobs
         self.kwargs = kwargs
 
     @property
@@ -110,7 +119,7 @@ class AutoForecaster(Forecaster):
         return fit_cv(
             y=y,
             X=X,
-            forecaster_cls=partial(self.forecaster, **self.kwargs),
+            forecaster_cls=partial(self.forecaster, engine=self.engine, **self.kwargs),
             freq=self.freq,
             min_lags=self.min_lags,
             max_lags=self.max_lags,
@@ -125,12 +134,13 @@ class AutoForecaster(Forecaster):
             or self.default_points_to_evaluate,
             num_samples=self.num_samples,
             low_cost_partial_config=self.low_cost_partial_config,
+            n_jobs=self.cv_n_jobs,
         )
 
     def _predict(self, fh: int, X: Optional[pl.LazyFrame] = None):
         from functime.forecasting._ar import predict_autoreg
 
-        return predict_autoreg(state=self.state, fh=fh, X=X)
+        return predict_autoreg(state=self.state, fh=fh, X=X, engine=self.engine)
 
     def backtest(
         self,
@@ -141,6 +151,7 @@ class AutoForecaster(Forecaster):
         n_splits: int = 5,
         window_size: int = 10,
         strategy: Literal["expanding", "sliding"] = "expanding",
+        n_jobs: int = 1,
     ):
         # Get base forecaster with fixed best params
         forecaster_cls = self.forecaster
@@ -156,6 +167,7 @@ class AutoForecaster(Forecaster):
             n_splits=n_splits,
             window_size=window_size,
             strategy=strategy,
+            n_jobs=n_jobs,
         )
         return y_preds, y_resids
 
@@ -1,13 +1,16 @@
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 import numpy as np
+import pandas as pd
 import polars as pl
-from catboost import Pool
+from catboost import CatBoost, Pool
 from catboost import train as cat_train
 
 from functime.base import Forecaster
 from functime.forecasting._ar import fit_autoreg
-from functime.forecasting._regressors import GradientBoostedTreeRegressor
+from functime.forecasting._regressors import GradientBoostedTreeRegressor, fit_horizons
+
+_NULL_CATEGORY = "__null__"
 
 
 def _enforce_label_constraint(y: pl.DataFrame, loss_function: Union[str, None]):
@@ -23,33 +26,73 @@ def _enforce_label_constraint(y: pl.DataFrame, loss_function: Union[str, None]):
     return y
 
 
-def _catboost(weight_transform: Optional[Callable] = None, **kwargs):
-    def regress(X: pl.DataFrame, y: pl.DataFrame):
+def _fill_null_categories(X: pd.DataFrame, categorical_cols: List[str]) -> pd.DataFrame:
+    # CatBoost does not accept missing categorical values: treat them as a category
+    for col in categorical_cols:
+        if X[col].hasnans:
+            X[col] = X[col].cat.add_categories(_NULL_CATEGORY).fillna(_NULL_CATEGORY)
+    return X
+
 
-        idx_cols = X.columns[:2]
-        feature_cols = X.columns[2:]
-        categorical_cols = X.select(pl.col(pl.Categorical).exclude(idx_cols)).columns
-
-        def train(
-            X: np.ndarray, y: np.ndarray, sample_weight: Optional[np.ndarray] = None
-        ):
-            pool = Pool(
-                data=X,
-                label=y,
-                weight=sample_weight,
-                feature_names=feature_cols,
-                cat_features=categorical_cols,
-            )
-            return cat_train(params=kwargs, pool=pool)
-
-        regressor = GradientBoostedTreeRegressor(
-            regress=train, weight_transform=weight_transform
+def _catboost_regressor(
+    X: pl.DataFrame, weight_transform: Optional[Callable] = None, **kwargs
+) -> GradientBoostedTreeRegressor:
+    idx_cols = X.columns[:2]
+    feature_cols = X.columns[2:]
+    categorical_cols = X.select(pl.col(pl.Categorical).exclude(idx_cols)).columns
+
+    def train(
+        X: pd.DataFrame,
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+        init_model: Optional[CatBoost] = None,
+    ):
+        pool = Pool(
+            data=_fill_null_categories(X, categorical_cols),
+            label=y,
+            weight=sample_weight,
+            feature_names=feature_cols,
+            cat_features=categorical_cols,
         )
+        return cat_train(params=kwargs, pool=pool, init_model=init_model)
+
+    regressor = GradientBoostedTreeRegressor(
+        regress=train,
+        weight_transform=weight_transform,
+        fit_dtype="pandas",
+        predict_dtype="pandas",
+        predict_wrapper=lambda X: _fill_null_categories(X, categorical_cols),
+    )
+    return regressor
+
+
+def _catboost(weight_transform: Optional[Callable] = None, **kwargs):
+    def regress(X: pl.DataFrame, y: pl.DataFrame):
+        regressor = _catboost_regressor(X, weight_transform=weight_transform, **kwargs)
         return regressor.fit(X=X, y=y)
 
     return regress
 
 
+def _catboost_horizons(
+    n_jobs: int = 1, weight_transform: Optional[Callable] = None, **kwargs
+):
+    def regress_horizons(
+        X: pl.DataFrame, y: pl.DataFrame, horizon_cols: List[List[str]]
+    ) -> List[GradientBoostedTreeRegressor]:
+        return fit_horizons(
+            lambda X: _catboost_regressor(
+                X, weight_transform=weight_transform, **kwargs
+            ),
+            X=X,
+            y=y,
+            horizon_cols=horizon_cols,
+            n_jobs=n_jobs,
+        )
+
+    return regress_horizons
+
+
 class catboost(Forecaster):
     """Autoregressive Catboost forecaster.
 
@@ -69,4 +112,9 @@ class catboost(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            # NOTE: Horizons are fitted on column slices of one coerced reduction
+            regress_horizons=_catboost_horizons(
+                n_jobs=self.direct_n_jobs, **self.kwargs
+            ),
         )
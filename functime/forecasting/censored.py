@@ -4,7 +4,7 @@ import numpy as np
 import polars as pl
 
 from functime.base import Forecaster
-from functime.base.forecaster import FORECAST_STRATEGIES
+from functime.base.forecaster import FORECAST_STRATEGIES, PREDICT_ENGINES
 from functime.forecasting._ar import fit_autoreg
 from functime.forecasting._reduction import make_reduction
 from functime.forecasting._regressors import CensoredRegressor, _X_to_numpy, _y_to_numpy
@@ -42,13 +42,19 @@ class censored_model(Forecaster):
         threshold: float = 0.0,
         regress: Optional[Callable] = None,
         classify: Optional[Callable] = None,
+        engine: PREDICT_ENGINES = "numpy",
         **kwargs
     ):
         self.threshold = threshold
         self.regress = regress or default_regress
         self.classify = classify or default_classify
         return super().__init__(
-            freq=freq, lags=lags, max_horizons=max_horizons, strategy=strategy, **kwargs
+            freq=freq,
+            lags=lags,
+            max_horizons=max_horizons,
+            strategy=strategy,
+            engine=engine,
+            **kwargs
         )
 
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
@@ -104,6 +110,7 @@ class zero_inflated_model(censored_model):
         strategy: FORECAST_STRATEGIES = None,
         regress: Optional[Callable] = None,
         classify: Optional[Callable] = None,
+        engine: PREDICT_ENGINES = "numpy",
         **kwargs
     ):
         super().__init__(
@@ -114,5 +121,6 @@ class zero_inflated_model(censored_model):
             threshold=0.0,
             regress=regress,
             classify=classify,
+            engine=engine,
             **kwargs
         )
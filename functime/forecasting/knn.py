@@ -35,4 +35,5 @@ class knn(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
         )
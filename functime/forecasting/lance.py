@@ -3,7 +3,7 @@ from typing import Optional
 import lance
 import numpy as np
 import polars as pl
-from tqdm import tqdm
+from joblib import Parallel, delayed
 from typing_extensions import Literal
 
 from functime.base import Forecaster
@@ -13,6 +13,10 @@ from functime.forecasting._ar import fit_autoreg
 class ANNRegressor:
     """Approximate-nearest neighbors regressor built on Lance.
 
+    Queries are submitted in blocks of `batch_size` vectors and blocks are searched
+    concurrently on a thread pool of `n_jobs` threads. If `k > 1`, predictions are
+    the inverse-distance weighted average of the `k` nearest labels.
+
     Reference:
     https://lancedb.github.io/lance/api/python/lance.html#module-lance.dataset
     """
@@ -27,7 +31,10 @@ class ANNRegressor:
         ivf_centroids: Optional[np.ndarray] = None,
         nprobes: Optional[int] = None,
         refine_factor: Optional[int] = None,
-        **kwargs
+        k: int = 1,
+        batch_size: int = 1024,
+        n_jobs: int = -1,
+        **kwargs,
     ):
         self.uri = uri or "functime_embs/knn.lance"
         self.index_type = index_type
@@ -37,9 +44,25 @@ class ANNRegressor:
         self.ivf_centroids = ivf_centroids
         self.nprobes = nprobes
         self.refine_factor = refine_factor
+        self.k = k
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
         self.kwargs = kwargs
         self._dataset = None
 
+    def __getstate__(self):
+        # Dataset handles are reopened from `uri` after unpickling
+        state = self.__dict__.copy()
+        state["_dataset"] = None
+        return state
+
+    @property
+    def dataset(self) -> lance.LanceDataset:
+        # Open once and cache the dataset (and its index) across `predict` calls
+        if self._dataset is None:
+            self._dataset = lance.dataset(self.uri)
+        return self._dataset
+
     def fit(self, X: pl.DataFrame, y: pl.DataFrame):
         idx_cols = y.columns[:2]
         feat_cols = X.columns[2:]
@@ -71,27 +94,53 @@ class ANNRegressor:
         self._dataset = dataset
         return self
 
-    def predict(self, X: pl.DataFrame):
-        dataset = self._dataset
-        feat_cols = X.columns[2:]
-        embs = (
-            X.select(pl.concat_list(feat_cols).alias("emb")).get_column("emb").to_list()
-        )
-        labels = np.zeros(shape=X.shape[0], dtype=np.float32)
-        # TODO: Parallelize
-        for i, emb in tqdm(enumerate(embs), desc="ANN search"):
-            labels[i] = dataset.to_table(
+    def _search(self, dataset: lance.LanceDataset, embs: np.ndarray) -> np.ndarray:
+        labels = np.empty(shape=embs.shape[0], dtype=np.float32)
+        for i, emb in enumerate(embs):
+            neighbors = dataset.to_table(
                 columns=["label"],
                 nearest={
                     "column": "emb",
                     "q": emb,
-                    "k": 1,
+                    "k": self.k,
                     "nprobes": self.nprobes,
                     "refine_factor": self.refine_factor,
                 },
-            )["label"][0].as_py()
+            )
+            neighbor_labels = neighbors["label"].to_numpy()
+            if self.k == 1:
+                labels[i] = neighbor_labels[0]
+                continue
+            # NOTE: Older lance versions name the distance column "score"
+            distance_col = (
+                "_distance" if "_distance" in neighbors.column_names else "score"
+            )
+            distances = neighbors[distance_col].to_numpy()
+            exact = distances == 0
+            if exact.any():
+                labels[i] = neighbor_labels[exact].mean()
+            else:
+                labels[i] = np.average(neighbor_labels, weights=1 / distances)
         return labels
 
+    def predict(self, X: pl.DataFrame):
+        feat_cols = X.columns[2:]
+        embs = (
+            X.select(pl.col(feat_cols).to_physical().cast(pl.Float32))
+            .to_numpy()
+            .astype(np.float32, copy=False)
+        )
+        dataset = self.dataset
+        # Blocks of queries are searched concurrently (lance releases the GIL)
+        blocks = range(0, embs.shape[0], self.batch_size)
+        labels = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(self._search)(dataset, embs[i : i + self.batch_size])
+            for i in blocks
+        )
+        if len(labels) == 0:
+            return np.zeros(shape=0, dtype=np.float32)
+        return np.concatenate(labels)
+
 
 def _ann(**kwargs):
     def regress(X: pl.DataFrame, y: pl.DataFrame):
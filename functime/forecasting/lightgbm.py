@@ -1,15 +1,21 @@
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Hashable, List, Mapping, Optional, Union
 
 import numpy as np
+import pandas as pd
 import polars as pl
-from lightgbm import Dataset
+from lightgbm import Booster, Dataset, Sequence
 from lightgbm import train as lgb_train
 
 from functime.base import Forecaster
 from functime.forecasting._ar import fit_autoreg
+from functime.forecasting._reduction import shared_artifact, shared_key
 from functime.forecasting._regressors import (
     FLAMLRegressor,
     GradientBoostedTreeRegressor,
+    NumpyBatches,
+    _X_to_numpy,
+    _y_to_numpy,
+    fit_horizons,
 )
 
 
@@ -45,32 +51,223 @@ def _enforce_label_constraint(y: pl.DataFrame, objective: Union[str, None]):
     return y
 
 
+# Parameters fixed once a `Dataset` is binned, i.e. shared by every booster
+# trained on the same binned dataset
+_DATASET_PARAMS = [
+    "max_bin",
+    "max_bin_by_feature",
+    "min_data_in_bin",
+    "bin_construct_sample_cnt",
+    "data_random_seed",
+    "use_missing",
+    "zero_as_missing",
+    "linear_tree",
+    "verbose",
+]
+
+
+def _dataset_params(params: Mapping[str, Any]) -> Mapping[str, Any]:
+    # NOTE: Without pre-filtering, boosters with different `min_data_in_leaf`
+    # (e.g. tuning trials) can be trained on the same binned dataset
+    dataset_params = {key: params[key] for key in _DATASET_PARAMS if key in params}
+    return {**dataset_params, "feature_pre_filter": False}
+
+
+def _make_train(
+    params: Mapping[str, Any],
+    feature_names: List[str],
+    categorical_names: List[str],
+    key: Optional[Hashable] = None,
+):
+    dataset_params = _dataset_params(params)
+
+    def train(
+        X: Union[np.ndarray, pd.DataFrame],
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+        init_model: Optional[Booster] = None,
+    ):
+        def build() -> Dataset:
+            # NOTE: Keep the raw data, since `lgb_train` still sets categorical
+            # features and the predictor (warm starts) on the constructed dataset
+            return Dataset(
+                data=X,
+                label=y,
+                weight=sample_weight,
+                feature_name=feature_names,
+                categorical_feature=categorical_names,
+                params=dataset_params,
+                free_raw_data=False,
+            ).construct()
+
+        # NOTE: Binned once per reduction within `shared_reduction` (e.g. CV splits
+        # across tuning trials). Warm starts always bin the new observations.
+        dataset_key = None
+        if key is not None and init_model is None:
+            dataset_key = ("lightgbm", key, tuple(sorted(dataset_params.items())))
+        dataset = shared_artifact(key=dataset_key, build=build)
+        return lgb_train(params=params, train_set=dataset, init_model=init_model)
+
+    return train
+
+
+def _lightgbm_regressor(
+    X: pl.DataFrame,
+    y: pl.DataFrame,
+    weight_transform: Optional[Callable] = None,
+    **kwargs,
+) -> GradientBoostedTreeRegressor:
+    idx_cols = X.columns[:2]
+    feature_cols = X.columns[2:]
+    categorical_cols = X.select(pl.col(pl.Categorical).exclude(idx_cols)).columns
+    train = _make_train(
+        params=_prepare_kwargs(kwargs),
+        feature_names=feature_cols,
+        categorical_names=categorical_cols,
+        key=shared_key(X, y),
+    )
+    # NOTE: Categoricals and missing values are binned natively by LightGBM
+    regressor = GradientBoostedTreeRegressor(
+        regress=train,
+        weight_transform=weight_transform,
+        fit_dtype="pandas",
+        predict_dtype="pandas",
+    )
+    return regressor
+
+
 def _lightgbm(weight_transform: Optional[Callable] = None, **kwargs):
     def regress(X: pl.DataFrame, y: pl.DataFrame):
+        regressor = _lightgbm_regressor(
+            X, y=y, weight_transform=weight_transform, **kwargs
+        )
+        return regressor.fit(X=X, y=y)
+
+    return regress
 
+
+def _lightgbm_exogenous_horizons(
+    n_jobs: int = 1, weight_transform: Optional[Callable] = None, **kwargs
+):
+    def regress_horizons(
+        X: pl.DataFrame, y: pl.DataFrame, horizon_cols: List[List[str]]
+    ) -> List[GradientBoostedTreeRegressor]:
+        # NOTE: Exogenous features are observed at the target time, hence horizons
+        # cannot share one binned dataset. Horizons are instead fitted on column
+        # slices of one coerced reduction.
+        return fit_horizons(
+            lambda X: _lightgbm_regressor(
+                X, y=y, weight_transform=weight_transform, **kwargs
+            ),
+            X=X,
+            y=y,
+            horizon_cols=horizon_cols,
+            n_jobs=n_jobs,
+        )
+
+    return regress_horizons
+
+
+def _lightgbm_horizons(weight_transform: Optional[Callable] = None, **kwargs):
+    def regress_horizons(
+        X: pl.DataFrame, y: pl.DataFrame, horizon_cols: List[List[str]]
+    ) -> List[GradientBoostedTreeRegressor]:
+        # NOTE: Only lagged targets are features, hence horizon `h` regressing
+        # `y[t]` on lags `h`...`h + lags - 1` is equivalent to regressing `y[t + h - 1]`
+        # on lags `1`...`lags`. Every horizon is trained on a row subset of one binned
+        # dataset with its labels swapped.
         idx_cols = X.columns[:2]
-        feature_cols = X.columns[2:]
-        categorical_cols = X.select(pl.col(pl.Categorical).exclude(idx_cols)).columns
+        entity_col = idx_cols[0]
+        target_col = y.columns[-1]
+        feature_cols = horizon_cols[0]
+        X_y = (
+            X.select([*idx_cols, *feature_cols])
+            .hstack([y.get_column(target_col)])
+            .sort(idx_cols)
+        )
+        y = X_y.select([*idx_cols, target_col])
+        X = X_y.select([*idx_cols, *feature_cols])
+        labels = _y_to_numpy(y)
+        weights = None
+        if weight_transform is not None:
+            weights = np.asarray(y.pipe(weight_transform))
+        params = _prepare_kwargs(kwargs)
+        train = _make_train(params, feature_names=feature_cols, categorical_names=[])
+        dataset = Dataset(
+            data=_X_to_numpy(X),
+            label=labels,
+            weight=weights,
+            feature_name=feature_cols,
+            params=_dataset_params(params),
+            free_raw_data=False,
+        ).construct()
+        entities = X.get_column(entity_col)
+        regressors = []
+        for h in range(len(horizon_cols)):
+            if h == 0:
+                train_set = dataset
+            else:
+                # Rows with an observation `h` steps ahead in the same entity
+                is_valid = (entities == entities.shift(-h)).fill_null(False)
+                rows = np.flatnonzero(is_valid.to_numpy())
+                train_set = dataset.subset(
+                    rows.tolist(), params=_dataset_params(params)
+                ).construct()
+                train_set.set_label(labels[rows + h])
+                if weights is not None:
+                    train_set.set_weight(weights[rows + h])
+            regressor = GradientBoostedTreeRegressor(
+                regress=train, weight_transform=weight_transform
+            )
+            regressor.regressor = lgb_train(params=params, train_set=train_set)
+            regressors.append(regressor)
+        return regressors
+
+    return regress_horizons
+
+
+class _BatchSequence(Sequence):
+    """LightGBM `Sequence` of the rows of one batch of `NumpyBatches`."""
 
+    def __init__(self, X: NumpyBatches, i: int):
+        self.X = X
+        self.i = i
+
+    def __len__(self) -> int:
+        return self.X.lengths[self.i]
+
+    def __getitem__(self, idx):
+        # NOTE: LightGBM only samples rows of float64 sequences
+        return self.X[self.i][idx].astype(np.float64)
+
+
+def _lightgbm_batches(weight_transform: Optional[Callable] = None, **kwargs):
+    def regress_batches(batches, horizon_cols: List[List[str]]):
         def train(
-            X: np.ndarray, y: np.ndarray, sample_weight: Optional[np.ndarray] = None
+            X: NumpyBatches,
+            y: np.ndarray,
+            sample_weight: Optional[np.ndarray] = None,
         ):
+            # NOTE: LightGBM samples bin boundaries then pushes rows batch by batch,
+            # hence at most one batch of raw features is in memory at once
             dataset = Dataset(
-                data=X,
+                data=[_BatchSequence(X, i) for i in range(len(X))],
                 label=y,
                 weight=sample_weight,
-                feature_name=feature_cols,
-                categorical_feature=categorical_cols,
+                feature_name=X.feature_names,
+                categorical_feature=X.categorical_names,
             )
             return lgb_train(params=params, train_set=dataset)
 
         params = _prepare_kwargs(kwargs)
-        regressor = GradientBoostedTreeRegressor(
-            regress=train, weight_transform=weight_transform
-        )
-        return regressor.fit(X=X, y=y)
+        return [
+            GradientBoostedTreeRegressor(
+                regress=None, regress_batches=train, weight_transform=weight_transform
+            ).fit_batches(batches.select(cols))
+            for cols in horizon_cols
+        ]
 
-    return regress
+    return regress_batches
 
 
 def _flaml_lightgbm(**kwargs):
@@ -104,6 +301,8 @@ class lightgbm(Forecaster):
     https://lightgbm.readthedocs.io/en/latest/pythonapi/lightgbm.LGBMRegressor.html
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
         y_new = y.pipe(
             _enforce_label_constraint, objective=self.kwargs.get("objective")
@@ -116,6 +315,18 @@ class lightgbm(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            # NOTE: Horizons share one binned dataset unless exogenous features
+            # (observed at the target time) are present
+            regress_horizons=(
+                _lightgbm_horizons(**self.kwargs)
+                if X is None
+                else _lightgbm_exogenous_horizons(
+                    n_jobs=self.direct_n_jobs, **self.kwargs
+                )
+            ),
+            memory_budget=self.memory_budget,
+            regress_batches=_lightgbm_batches(**self.kwargs),
         )
 
 
@@ -138,4 +349,5 @@ class flaml_lightgbm(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
         )
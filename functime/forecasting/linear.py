@@ -4,7 +4,11 @@ import polars as pl
 
 from functime.base import Forecaster
 from functime.forecasting._ar import fit_autoreg
-from functime.forecasting._regressors import StandardizedSklearnRegressor
+from functime.forecasting._regressors import (
+    StandardizedSklearnRegressor,
+    fit_linear_horizons,
+    fit_linear_horizons_batches,
+)
 
 
 def _linear_model(**kwargs):
@@ -55,6 +59,57 @@ def _elastic_net(**kwargs):
     return regress
 
 
+def _linear_horizons(
+    alpha: float = 0.0,
+    l1_ratio: float = 0.0,
+    fit_intercept: bool = True,
+    positive: bool = False,
+    **kwargs,
+):
+    # Multi-output fit across direct horizons, which only covers the core penalties.
+    # Fallback to per-horizon sklearn estimators (i.e. None) for any other kwargs.
+    if kwargs or (positive and l1_ratio == 0):
+        return None
+
+    def regress_horizons(X: pl.DataFrame, y: pl.DataFrame, horizon_cols):
+        return fit_linear_horizons(
+            X=X,
+            y=y,
+            horizon_cols=horizon_cols,
+            alpha=alpha,
+            l1_ratio=l1_ratio,
+            fit_intercept=fit_intercept,
+            positive=positive,
+        )
+
+    return regress_horizons
+
+
+def _linear_batches(
+    alpha: float = 0.0,
+    l1_ratio: float = 0.0,
+    fit_intercept: bool = True,
+    positive: bool = False,
+    **kwargs,
+):
+    # Out-of-core fit accumulates the Gram matrix across batches of entities,
+    # which only covers the same core penalties as `_linear_horizons`
+    if kwargs or (positive and l1_ratio == 0):
+        return None
+
+    def regress_batches(batches, horizon_cols):
+        return fit_linear_horizons_batches(
+            batches=batches,
+            horizon_cols=horizon_cols,
+            alpha=alpha,
+            l1_ratio=l1_ratio,
+            fit_intercept=fit_intercept,
+            positive=positive,
+        )
+
+    return regress_batches
+
+
 class linear_model(Forecaster):
     """Autoregressive linear forecaster.
 
@@ -62,6 +117,8 @@ class linear_model(Forecaster):
     https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LinearRegression.html
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
         kwargs = self.kwargs
         # Check dummy variable trap
@@ -82,6 +139,10 @@ class linear_model(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            regress_horizons=_linear_horizons(alpha=0.0, **kwargs),
+            memory_budget=self.memory_budget,
+            regress_batches=_linear_batches(alpha=0.0, **kwargs),
         )
 
 
@@ -92,6 +153,8 @@ class lasso(Forecaster):
     https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Lasso.html#sklearn.linear_model.Lasso
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
         regress = _lasso(**self.kwargs)
         return fit_autoreg(
@@ -101,6 +164,14 @@ class lasso(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            regress_horizons=_linear_horizons(
+                l1_ratio=1.0, **{"alpha": 1.0, **self.kwargs}
+            ),
+            memory_budget=self.memory_budget,
+            regress_batches=_linear_batches(
+                l1_ratio=1.0, **{"alpha": 1.0, **self.kwargs}
+            ),
         )
 
 
@@ -111,6 +182,8 @@ class ridge(Forecaster):
     https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Ridge.html#sklearn.linear_model.Ridge
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
         regress = _ridge(**self.kwargs)
         return fit_autoreg(
@@ -120,6 +193,14 @@ class ridge(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            regress_horizons=_linear_horizons(
+                l1_ratio=0.0, **{"alpha": 1.0, **self.kwargs}
+            ),
+            memory_budget=self.memory_budget,
+            regress_batches=_linear_batches(
+                l1_ratio=0.0, **{"alpha": 1.0, **self.kwargs}
+            ),
         )
 
 
@@ -130,6 +211,8 @@ class elastic_net(Forecaster):
     https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ElasticNet.html#sklearn.linear_model.ElasticNet
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
         regress = _elastic_net(**self.kwargs)
         return fit_autoreg(
@@ -139,4 +222,12 @@ class elastic_net(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            regress_horizons=_linear_horizons(
+                **{"alpha": 1.0, "l1_ratio": 0.5, **self.kwargs}
+            ),
+            memory_budget=self.memory_budget,
+            regress_batches=_linear_batches(
+                **{"alpha": 1.0, "l1_ratio": 0.5, **self.kwargs}
+            ),
         )
@@ -0,0 +1,151 @@
+from typing import Callable, List, Optional, Union
+
+import polars as pl
+from joblib import Parallel, delayed
+
+from functime.base import Forecaster
+from functime.base.forecaster import DF_TYPE, FORECAST_STRATEGIES, PREDICT_ENGINES
+
+
+def make_shards(y: pl.DataFrame, n_shards: int) -> pl.DataFrame:
+    """Partition entities into `n_shards` shards with roughly equal number of rows.
+
+    Entities are assigned in order to contiguous shards by their cumulative
+    number of observations, i.e. an entity is never split across shards.
+    """
+    entity_col = y.columns[0]
+    shards = (
+        y.groupby(entity_col)
+        .agg(pl.count().alias("n_obs"))
+        .sort(entity_col)
+        .select(
+            [
+                entity_col,
+                (
+                    (pl.col("n_obs").cumsum() - pl.col("n_obs"))
+                    * n_shards
+                    // pl.col("n_obs").sum()
+                )
+                .cast(pl.Int32)
+                .alias("shard"),
+            ]
+        )
+    )
+    return shards
+
+
+def _fit_shard(
+    forecaster: Forecaster, y: pl.DataFrame, X: Optional[pl.DataFrame] = None
+) -> Forecaster:
+    # NOTE: Categorical exogenous features are shared across shards
+    pl.enable_string_cache(True)
+    return forecaster.fit(y=y, X=X)
+
+
+class sharded_model(Forecaster):
+    """Global forecaster fitted per shard of entities.
+
+    Entities are partitioned into `n_shards` shards with roughly equal number of
+    observations (see `artifacts["shards"]` in the fitted state). One `forecaster`
+    is fit per shard in a separate process, so that each worker only builds the
+    lagged features of its own shard. Every entity is forecasted by its shard's forecaster.
+
+    Parameters
+    ----------
+    freq : str
+        Offset alias supported by Polars.
+    lags : int
+        Number of lagged target variables.
+    max_horizons: Optional[int]
+        Maximum number of horizons to predict directly.
+        Only applied if `strategy` equals "direct" or "ensemble".
+    strategy : Optional[str]
+        Forecasting strategy. Currently supports "recursive", "direct",
+        and "ensemble" of both recursive and direct strategies.
+    forecaster : Optional[Callable[..., Forecaster]]
+        Forecaster (e.g. `lightgbm`) fit on every shard. Defaults to `linear_model`.
+    n_shards : int
+        Number of shards of entities. Defaults to 4.
+    n_jobs : int
+        Number of shards fitted in parallel. Defaults to -1 i.e. using all processors.
+    engine : str
+        Recursive prediction engine ("numpy" or "polars").
+    **kwargs : Mapping[str, Any]
+        Additional keyword arguments passed into `forecaster`.
+    """
+
+    def __init__(
+        self,
+        freq: Union[str, None],
+        lags: int,
+        max_horizons: Optional[int] = None,
+        strategy: FORECAST_STRATEGIES = None,
+        forecaster: Optional[Callable[..., Forecaster]] = None,
+        n_shards: int = 4,
+        n_jobs: int = -1,
+        engine: PREDICT_ENGINES = "numpy",
+        **kwargs
+    ):
+        if forecaster is None:
+            from functime.forecasting.linear import linear_model
+
+            forecaster = linear_model
+        self.forecaster = forecaster
+        self.n_shards = n_shards
+        self.n_jobs = n_jobs
+        return super().__init__(
+            freq=freq,
+            lags=lags,
+            max_horizons=max_horizons,
+            strategy=strategy,
+            engine=engine,
+            **kwargs
+        )
+
+    def _split(
+        self, shards: pl.DataFrame, df: Optional[pl.DataFrame]
+    ) -> List[Optional[pl.DataFrame]]:
+        # Rows of `df` per shard, `df` as is if it has no entity column
+        entity_col = shards.columns[0]
+        if df is None or df.columns[0] != entity_col:
+            return [df] * shards.get_column("shard").n_unique()
+        return [
+            df.join(entities, on=entity_col, how="semi")
+            for entities in shards.partition_by("shard", maintain_order=True)
+        ]
+
+    def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
+        y = y.collect()
+        X = X.collect() if X is not None else X
+        shards = make_shards(y, n_shards=self.n_shards)
+        params = {
+            "freq": self.freq,
+            "lags": self.lags,
+            "max_horizons": self.max_horizons,
+            "strategy": self.strategy,
+            "engine": self.engine,
+            **self.kwargs,
+        }
+        # NOTE: Processes by default such that each shard's reduction
+        # is built in its own worker's memory
+        forecasters: List[Forecaster] = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_shard)(self.forecaster(**params), y=y_shard, X=X_shard)
+            for y_shard, X_shard in zip(self._split(shards, y), self._split(shards, X))
+        )
+        artifacts = {"shards": shards, "forecasters": forecasters}
+        return artifacts
+
+    def predict(self, fh: int, X: Optional[DF_TYPE] = None) -> pl.DataFrame:
+        artifacts = self.state.artifacts
+        shards = artifacts["shards"]
+        if X is not None:
+            X = X.lazy().collect()
+            if X.columns[0] == self.state.entity:
+                X = self._encode_entities(X)
+        X_shards = self._split(shards, X)
+        y_preds = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(forecaster.predict)(fh=fh, X=X_shard)
+            for forecaster, X_shard in zip(artifacts["forecasters"], X_shards)
+        )
+        y_pred = pl.concat(y_preds).pipe(self._decode_entities)
+        return y_pred
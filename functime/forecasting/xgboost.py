@@ -1,14 +1,18 @@
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 import numpy as np
+import pandas as pd
 import polars as pl
-import pyarrow as pa
-from xgboost import DMatrix
+from xgboost import Booster, DataIter, DMatrix, QuantileDMatrix
 from xgboost import train as xgb_train
 
 from functime.base import Forecaster
 from functime.forecasting._ar import fit_autoreg
-from functime.forecasting._regressors import GradientBoostedTreeRegressor
+from functime.forecasting._regressors import (
+    GradientBoostedTreeRegressor,
+    NumpyBatches,
+    fit_horizons,
+)
 
 
 def _enforce_label_constraint(y: pl.DataFrame, objective: Union[str, None]):
@@ -31,45 +35,185 @@ def _enforce_label_constraint(y: pl.DataFrame, objective: Union[str, None]):
     return y
 
 
+def _xgboost_regressor(
+    X: pl.DataFrame, weight_transform: Optional[Callable] = None, **kwargs
+) -> GradientBoostedTreeRegressor:
+    feature_cols = X.columns[2:]
+    # NOTE: Native categorical splits are only supported by histogram methods
+    params = {"tree_method": "hist", **kwargs}
+
+    def train(
+        X: pd.DataFrame,
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+        init_model: Optional[Booster] = None,
+    ):
+        # NOTE: QuantileDMatrix quantizes features while they are ingested,
+        # i.e. no float copy of the features is held by XGBoost
+        dataset = QuantileDMatrix(
+            data=X,
+            label=y,
+            weight=sample_weight,
+            feature_names=feature_cols,
+            enable_categorical=True,
+            max_bin=params.get("max_bin", 256),
+            nthread=params.get("nthread", params.get("n_jobs", -1)),
+        )
+        return xgb_train(params=params, dtrain=dataset, xgb_model=init_model)
+
+    regressor = GradientBoostedTreeRegressor(
+        regress=train,
+        weight_transform=weight_transform,
+        fit_dtype="pandas",
+        predict_dtype="pandas",
+        predict_method="inplace_predict",
+    )
+    return regressor
+
+
 def _xgboost(weight_transform: Optional[Callable] = None, **kwargs):
     def regress(X: pl.DataFrame, y: pl.DataFrame):
+        regressor = _xgboost_regressor(X, weight_transform=weight_transform, **kwargs)
+        return regressor.fit(X=X, y=y)
+
+    return regress
+
 
-        feature_cols = X.columns[2:]
-
-        def train(X: pa.Table, y: pa.Table, sample_weight: Optional[np.ndarray] = None):
-            dataset = DMatrix(
-                data=X,
-                label=y,
-                weight=sample_weight,
-                feature_names=feature_cols,
-                nthread=-1,
-            )
-            return xgb_train(params=kwargs, dtrain=dataset)
-
-        regressor = GradientBoostedTreeRegressor(
-            regress=train,
-            weight_transform=weight_transform,
-            predict_dtype=lambda X: DMatrix(
-                X.select(pl.col(X.columns[2:])), feature_names=feature_cols
+def _xgboost_horizons(
+    n_jobs: int = 1, weight_transform: Optional[Callable] = None, **kwargs
+):
+    def regress_horizons(
+        X: pl.DataFrame, y: pl.DataFrame, horizon_cols: List[List[str]]
+    ) -> List[GradientBoostedTreeRegressor]:
+        return fit_horizons(
+            lambda X: _xgboost_regressor(
+                X, weight_transform=weight_transform, **kwargs
             ),
+            X=X,
+            y=y,
+            horizon_cols=horizon_cols,
+            n_jobs=n_jobs,
         )
-        return regressor.fit(X=X, y=y)
 
-    return regress
+    return regress_horizons
+
+
+class _BatchIter(DataIter):
+    """XGBoost `DataIter` over the batches of `NumpyBatches`.
+
+    If `cache_prefix` is set, XGBoost pages the ingested batches to disk under
+    `cache_prefix` (i.e. external memory) instead of keeping them in memory.
+    """
+
+    def __init__(
+        self,
+        X: NumpyBatches,
+        y: np.ndarray,
+        sample_weight: Optional[np.ndarray],
+        cache_prefix: Optional[str] = None,
+    ):
+        self.X = X
+        self.y = y
+        self.sample_weight = sample_weight
+        self.offsets = np.cumsum([0, *X.lengths])
+        self._it = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data: Callable) -> int:
+        # Skip batches without any rows
+        while self._it < len(self.X) and self.X.lengths[self._it] == 0:
+            self._it += 1
+        if self._it == len(self.X):
+            return 0
+        rows = slice(self.offsets[self._it], self.offsets[self._it + 1])
+        # NOTE: Labels, weights and feature names are only accepted per batch
+        input_data(
+            data=self.X[self._it],
+            label=self.y[rows],
+            weight=self.sample_weight[rows] if self.sample_weight is not None else None,
+            feature_names=self.X.feature_names,
+        )
+        self._it += 1
+        return 1
+
+    def reset(self):
+        self._it = 0
+
+
+def _xgboost_batches(
+    weight_transform: Optional[Callable] = None,
+    cache_prefix: Optional[str] = None,
+    **kwargs,
+):
+    def regress_batches(batches, horizon_cols: List[List[str]]):
+        def make_train(i: int):
+            def train(
+                X: NumpyBatches,
+                y: np.ndarray,
+                sample_weight: Optional[np.ndarray] = None,
+            ):
+                params = {"tree_method": "hist", **kwargs}
+                if cache_prefix is None:
+                    # NOTE: QuantileDMatrix sketches then quantizes one batch at a
+                    # time, hence at most one batch of raw features is in memory
+                    dataset = QuantileDMatrix(
+                        _BatchIter(X, y=y, sample_weight=sample_weight),
+                        max_bin=params.get("max_bin", 256),
+                        nthread=params.get("nthread", params.get("n_jobs", -1)),
+                    )
+                else:
+                    # External memory: pages are written to disk once, then
+                    # streamed from disk at every boosting round
+                    it = _BatchIter(
+                        X,
+                        y=y,
+                        sample_weight=sample_weight,
+                        cache_prefix=f"{cache_prefix}-{i}",
+                    )
+                    dataset = DMatrix(
+                        it, nthread=params.get("nthread", params.get("n_jobs", -1))
+                    )
+                return xgb_train(params=params, dtrain=dataset)
+
+            return train
+
+        # NOTE: Fitted on physical codes with nulls imputed (i.e. `NumpyBatches`),
+        # hence predictions are made on the same dense features
+        return [
+            GradientBoostedTreeRegressor(
+                regress=None,
+                regress_batches=make_train(i),
+                weight_transform=weight_transform,
+                predict_dtype="numpy",
+                predict_method="inplace_predict",
+            ).fit_batches(batches.select(cols))
+            for i, cols in enumerate(horizon_cols)
+        ]
+
+    return regress_batches
 
 
 class xgboost(Forecaster):
     """Autoregressive XGBoost forecaster.
 
+    Trained on a `QuantileDMatrix` with the histogram tree method. If fitted with
+    `memory_budget`, batches of entities are streamed into XGBoost; pass
+    `cache_prefix` (a path prefix) to also page them to disk, i.e. XGBoost's external
+    memory mode, for panels that do not fit in memory.
+
     Reference:
     https://xgboost.readthedocs.io/en/stable/python/python_api.html#module-xgboost.training
     """
 
+    _supports_batches = True
+
     def _fit(self, y: pl.LazyFrame, X: Optional[pl.LazyFrame] = None):
-        y_new = y.pipe(
-            _enforce_label_constraint, objective=self.kwargs.get("objective")
-        )
-        regress = _xgboost(**self.kwargs)
+        kwargs = self.kwargs.copy()
+        cache_prefix = kwargs.pop("cache_prefix", None)
+        if cache_prefix is not None and self.memory_budget is None:
+            raise ValueError("`cache_prefix` requires `memory_budget` to be set")
+        y_new = y.pipe(_enforce_label_constraint, objective=kwargs.get("objective"))
+        regress = _xgboost(**kwargs)
         return fit_autoreg(
             regress=regress,
             y=y_new,
@@ -77,4 +221,9 @@ class xgboost(Forecaster):
             lags=self.lags,
             max_horizons=self.max_horizons,
             strategy=self.strategy,
+            n_jobs=self.direct_n_jobs,
+            # NOTE: Horizons are fitted on column slices of one coerced reduction
+            regress_horizons=_xgboost_horizons(n_jobs=self.direct_n_jobs, **kwargs),
+            memory_budget=self.memory_budget,
+            regress_batches=_xgboost_batches(cache_prefix=cache_prefix, **kwargs),
         )
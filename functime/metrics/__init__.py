@@ -1,4 +1,15 @@
-from .point import mae, mape, mase, mse, overforecast, rmse, rmsse, smape, underforecast
+from .point import (
+    mae,
+    mape,
+    mase,
+    mse,
+    overforecast,
+    rmse,
+    rmsse,
+    score_point,
+    smape,
+    underforecast,
+)
 
 __all__ = [
     "mae",
@@ -7,6 +18,7 @@ __all__ = [
     "mse",
     "rmse",
     "rmsse",
+    "score_point",
     "smape",
     "overforecast",
     "underforecast",
@@ -2,21 +2,23 @@
 """
 
 from dataclasses import dataclass
-from functools import partial, reduce
+from typing import List, Optional
 
 import polars as pl
 from typing_extensions import Literal
 
-from functime.metrics import (
-    mae,
-    mase,
-    mse,
-    overforecast,
-    rmse,
-    rmsse,
-    smape,
-    underforecast,
-)
+from functime.metrics import score_point
+
+DEFAULT_METRICS = [
+    "mae",
+    "mase",
+    "mse",
+    "overforecast",
+    "rmse",
+    "rmsse",
+    "smape",
+    "underforecast",
+]
 
 
 @dataclass(frozen=True)
@@ -58,7 +60,10 @@ def summarize_scores(
 
 
 def score_forecast(
-    y_true: pl.DataFrame, y_pred: pl.DataFrame, y_train: pl.DataFrame
+    y_true: pl.DataFrame,
+    y_pred: pl.DataFrame,
+    y_train: pl.DataFrame,
+    metrics: Optional[List[str]] = None,
 ) -> pl.DataFrame:
     """Return DataFrame of forecast metrics across entities.
 
@@ -82,27 +87,17 @@ def score_forecast(
         Predicted values.
     y_train : pl.DataFrame
         Observed training values.
+    metrics : Optional[List[str]]
+        Subset of metrics to compute. Defaults to all metrics above.
 
     Returns
     -------
     scores : pl.DataFrame
         DataFrame with computed metrics column by column across entities row by row.
     """
-    entity_col = y_true.columns[0]
-    metrics = [
-        mae,
-        partial(mase, y_train=y_train),
-        mse,
-        overforecast,
-        rmse,
-        partial(rmsse, y_train=y_train),
-        smape,
-        underforecast,
-    ]
-    scores = [metric(y_true, y_pred) for metric in metrics]
-    scores = reduce(
-        lambda df1, df2: df1.lazy().join(df2.lazy(), how="left", on=entity_col), scores
-    ).collect()
+    scores = score_point(
+        y_true, y_pred, metrics=metrics or DEFAULT_METRICS, y_train=y_train
+    )
     return scores
 
 
@@ -110,6 +105,7 @@ def score_backtest(
     y_true: pl.DataFrame,
     y_preds: pl.DataFrame,
     agg_method: Literal["mean", "median"] = "mean",
+    metrics: Optional[List[str]] = None,
 ) -> pl.DataFrame:
     """Return DataFrame of forecast metrics across entities.
 
@@ -135,6 +131,8 @@ def score_backtest(
         DataFrame contains four columns: entity, time, target, "split".
     agg_method : str
         Method ("mean", "median") to aggregate scores across entities by.
+    metrics : Optional[List[str]]
+        Subset of metrics to compute. Defaults to all metrics above.
 
     Returns
     -------
@@ -149,5 +147,5 @@ def score_backtest(
     y_pred = (
         y_preds.lazy().groupby([entity_col, time_col]).agg(expr[agg_method]).collect()
     )
-    scores = score_forecast(y_true, y_pred, y_train=y_true)
+    scores = score_forecast(y_true, y_pred, y_train=y_true, metrics=metrics)
     return scores
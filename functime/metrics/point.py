@@ -1,8 +1,24 @@
+from typing import List, Mapping, Optional
+
 import numpy as np
 import polars as pl
 
 from functime.base import metric
 
+# Point forecast metrics as aggregations over "actual" and "pred" per entity
+_ERROR = pl.col("pred") - pl.col("actual")
+POINT_METRICS: Mapping[str, pl.Expr] = {
+    "mae": _ERROR.abs().mean(),
+    "mape": (_ERROR.abs() / np.abs(pl.col("actual"))).mean(),
+    "mse": (_ERROR**2).mean(),
+    "rmse": (_ERROR**2).mean().sqrt(),
+    "smape": _ERROR.abs().sum() / (pl.col("pred") + pl.col("actual")).sum(),
+    "overforecast": pl.col("pred").filter(pl.col("pred") > pl.col("actual")).sum(),
+    "underforecast": pl.col("pred").filter(pl.col("pred") < pl.col("actual")).sum(),
+}
+# Scaled metrics divide a point metric by the same metric of the naive forecast
+SCALED_METRICS: Mapping[str, str] = {"mase": "mae", "rmsse": "mse"}
+
 
 def _score(y_true, y_pred, formula: pl.Expr, alias: str):
     y_true = y_true.rename({y_true.columns[-1]: "actual"})
@@ -16,6 +32,89 @@ def _score(y_true, y_pred, formula: pl.Expr, alias: str):
     return scores
 
 
+def _score_fused(
+    y_true: pl.DataFrame,
+    y_pred: pl.DataFrame,
+    metrics: List[str],
+    y_train: Optional[pl.DataFrame] = None,
+    sp: int = 1,
+) -> pl.DataFrame:
+    unknown = set(metrics) - set(POINT_METRICS) - set(SCALED_METRICS)
+    if unknown:
+        raise ValueError(f"Unsupported metrics: {sorted(unknown)}")
+    scaled = [m for m in metrics if m in SCALED_METRICS]
+    if scaled and y_train is None:
+        raise ValueError(f"`y_train` is required to compute {scaled}")
+    entity_col, time_col = y_true.columns[:2]
+    # Join actuals and predictions once, then aggregate every metric in one pass
+    unscaled = {SCALED_METRICS[m] for m in scaled} | {
+        m for m in metrics if m in POINT_METRICS
+    }
+    scores = (
+        y_true.lazy()
+        .rename({y_true.columns[-1]: "actual"})
+        .join(
+            y_pred.lazy().rename({y_pred.columns[-1]: "pred"}),
+            on=[entity_col, time_col],
+            how="left",
+        )
+        .groupby(entity_col)
+        .agg([POINT_METRICS[m].alias(m) for m in sorted(unscaled)])
+    )
+    if scaled:
+        # Naive (seasonal) forecast errors are computed once from `y_train`
+        naive_error = pl.col("naive") - pl.col("naive").shift(sp)
+        naive_exprs = {
+            "mae": naive_error.abs().mean(),
+            "mse": (naive_error**2).mean(),
+        }
+        naive_scores = (
+            y_train.lazy()
+            .rename({y_train.columns[-1]: "naive"})
+            .groupby(y_train.columns[0])
+            .agg([naive_exprs[SCALED_METRICS[m]].alias(f"{m}__naive") for m in scaled])
+        )
+        scaled_exprs = {
+            "mase": pl.col("mae") / pl.col("mase__naive"),
+            "rmsse": (pl.col("mse") / pl.col("rmsse__naive")).sqrt(),
+        }
+        scores = scores.join(naive_scores, on=entity_col, how="left").with_columns(
+            [scaled_exprs[m].alias(m) for m in scaled]
+        )
+    return scores.select([entity_col, *metrics]).collect()
+
+
+@metric
+def score_point(
+    y_true: pl.DataFrame,
+    y_pred: pl.DataFrame,
+    metrics: List[str],
+    y_train: Optional[pl.DataFrame] = None,
+    sp: int = 1,
+) -> pl.DataFrame:
+    """Return any set of point forecast metrics from a single join and aggregation.
+
+    Parameters
+    ----------
+    y_true : pl.DataFrame
+        Ground truth (correct) target values.
+    y_pred : pl.DataFrame
+        Predicted values.
+    metrics : List[str]
+        Names of metrics to compute, e.g. ["mae", "mase", "smape"].
+    y_train : Optional[pl.DataFrame]
+        Observed training values. Required for scaled metrics ("mase", "rmsse").
+    sp : int
+        Seasonal period of the naive forecast used by scaled metrics.
+
+    Returns
+    -------
+    scores : pl.DataFrame
+        Scores per series, one column per metric in the order of `metrics`.
+    """
+    return _score_fused(y_true, y_pred, metrics=metrics, y_train=y_train, sp=sp)
+
+
 @metric
 def mae(y_true: pl.DataFrame, y_pred: pl.DataFrame) -> pl.DataFrame:
     """Return mean absolute error (MAE).
@@ -32,8 +131,7 @@ def mae(y_true: pl.DataFrame, y_pred: pl.DataFrame) -> pl.DataFrame:
     scores : pl.DataFrame
         Score per series.
     """
-    abs_error = (pl.col("pred") - pl.col("actual")).abs()
-    return _score(y_true, y_pred, abs_error.mean(), "mae")
+    return _score(y_true, y_pred, POINT_METRICS["mae"], "mae")
 
 
 @metric
@@ -72,8 +170,7 @@ def mape(y_true: pl.DataFrame, y_pred: pl.DataFrame):
     scores : pl.DataFrame
         Score per series.
     """
-    pct_error = (pl.col("actual") - pl.col("pred")).abs() / np.abs(pl.col("actual"))
-    return _score(y_true, y_pred, pct_error.mean(), "mape")
+    return _score(y_true, y_pred, POINT_METRICS["mape"], "mape")
 
 
 @metric
@@ -92,8 +189,7 @@ def mse(y_true: pl.DataFrame, y_pred: pl.DataFrame):
     scores : pl.DataFrame
         Score per series.
     """
-    squared_error = (pl.col("pred") - pl.col("actual")) ** 2
-    return _score(y_true, y_pred, squared_error.mean(), "mse")
+    return _score(y_true, y_pred, POINT_METRICS["mse"], "mse")
 
 
 @metric
@@ -112,8 +208,7 @@ def rmse(y_true: pl.DataFrame, y_pred: pl.DataFrame):
     scores : pl.DataFrame
         Score per series.
     """
-    squared_error = (pl.col("pred") - pl.col("actual")) ** 2
-    return _score(y_true, y_pred, squared_error.mean().sqrt(), "rmse")
+    return _score(y_true, y_pred, POINT_METRICS["rmse"], "rmse")
 
 
 @metric
@@ -134,10 +229,7 @@ def smape(y_true: pl.DataFrame, y_pred: pl.DataFrame):
     scores : pl.DataFrame
         Score per series.
     """
-    diff = (pl.col("pred") - pl.col("actual")).abs().sum()
-    total = (pl.col("pred") + pl.col("actual")).sum()
-    pct_error = diff / total
-    return _score(y_true, y_pred, pct_error, "smape")
+    return _score(y_true, y_pred, POINT_METRICS["smape"], "smape")
 
 
 @metric
@@ -160,20 +252,7 @@ def mase(
     scores : pl.DataFrame
         Score per series.
     """
-    mae_scores = mae(y_true, y_pred)
-    naive_mae_scores = (
-        y_train.rename({y_train.columns[-1]: "naive"})
-        .groupby(y_train.columns[0])
-        .agg((pl.col("naive") - pl.col("naive").shift(sp)).abs().mean())
-    )
-    entity_col = y_true.columns[0]
-    scores = (
-        mae_scores.lazy()
-        .join(naive_mae_scores.lazy(), on=entity_col, how="left")
-        .select([entity_col, (pl.col("mae") / pl.col("naive")).alias("mase")])
-        .collect(streaming=True)
-    )
-    return scores
+    return _score_fused(y_true, y_pred, metrics=["mase"], y_train=y_train, sp=sp)
 
 
 @metric
@@ -196,20 +275,7 @@ def rmsse(
     scores : pl.DataFrame
         Score per series.
     """
-    mse_scores = mse(y_true, y_pred)
-    naive_mse_scores = (
-        y_train.rename({y_train.columns[-1]: "naive"})
-        .groupby(y_train.columns[0])
-        .agg(((pl.col("naive") - pl.col("naive").shift(sp)) ** 2).mean())
-    )
-    entity_col = y_true.columns[0]
-    scores = (
-        mse_scores.lazy()
-        .join(naive_mse_scores.lazy(), on=entity_col, how="left")
-        .select([entity_col, (pl.col("mse") / pl.col("naive")).sqrt().alias("rmsse")])
-        .collect(streaming=True)
-    )
-    return scores
+    return _score_fused(y_true, y_pred, metrics=["rmsse"], y_train=y_train, sp=sp)
 
 
 @metric
@@ -230,8 +296,7 @@ def overforecast(y_true: pl.DataFrame, y_pred: pl.DataFrame) -> pl.DataFrame:
     scores : pl.DataFrame
         Score per series.
     """
-    overforecast = pl.col("pred").filter(pl.col("pred") > pl.col("actual")).sum()
-    return _score(y_true, y_pred, overforecast, "overforecast")
+    return _score(y_true, y_pred, POINT_METRICS["overforecast"], "overforecast")
 
 
 @metric
@@ -252,5 +317,4 @@ def underforecast(y_true: pl.DataFrame, y_pred: pl.DataFrame) -> pl.DataFrame:
     scores : pl.DataFrame
         Score per series.
     """
-    underforecast = pl.col("pred").filter(pl.col("pred") < pl.col("actual")).sum()
-    return _score(y_true, y_pred, underforecast, "underforecast")
+    return _score(y_true, y_pred, POINT_METRICS["underforecast"], "underforecast")
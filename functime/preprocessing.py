@@ -1,13 +1,13 @@
-from itertools import product
-from typing import List, Mapping, Union
+from typing import List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import polars as pl
-from scipy.stats import boxcox_normmax
 from typing_extensions import Literal
 
 from functime.base import transformer
 from functime.base.model import ModelState
-from functime.offsets import _strip_freq_alias
+from functime.base.transformer import sort_panel
+from functime.conversion import df_to_ndarray
 
 PL_FLOAT_DTYPES = [pl.Float32, pl.Float64]
 PL_INT_DTYPES = [pl.Int8, pl.Int16, pl.Int32, pl.Int64]
@@ -20,16 +20,68 @@ def PL_NUMERIC_COLS(*exclude):
     return pl.col(PL_NUMERIC_DTYPES).exclude(exclude)
 
 
-def reindex(X: pl.DataFrame) -> pl.DataFrame:
+def _join_stats(X: pl.LazyFrame, stats: pl.DataFrame, suffix: str) -> pl.LazyFrame:
+    # Left join per-entity statistics with their columns renamed by `suffix`
+    # NOTE: Joining the same statistics columns twice into one plan (e.g. `invert`
+    # after `transform_new`) breaks projection pushdown in polars 0.18
+    entity_col = X.columns[0]
+    stats = stats.lazy().select(
+        [pl.col(entity_col), pl.all().exclude(entity_col).suffix(suffix)]
+    )
+    return X.join(stats, on=entity_col, how="left")
+
+
+def reindex(
+    X: Union[pl.DataFrame, pl.LazyFrame], freq: Optional[str] = None
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Reindex panel data onto a complete grid of entities and timestamps.
+
+    Missing observations are inserted as null values (e.g. to be filled by `impute`).
+
+    Parameters
+    ----------
+    X : Union[pl.DataFrame, pl.LazyFrame]
+        Panel DataFrame with entity and time columns.
+    freq : Optional[str]
+        Offset alias supported by Polars (e.g. "1d", or "1i" for integer time).
+        If set, every entity is reindexed from its own first to last timestamp at `freq`.
+        Otherwise, every entity is reindexed onto the union of all timestamps.
+
+    Returns
+    -------
+    X_new : Union[pl.DataFrame, pl.LazyFrame]
+        Panel sorted by entity and time.
+    """
     entity_col, time_col = X.columns[:2]
-    dtypes = X.dtypes[:2]
-    entities = sorted(set(X.get_column(entity_col)))
-    timestamps = sorted(set(X.get_column(time_col)))
-    X = pl.DataFrame(
-        product(entities, timestamps),
-        schema={entity_col: dtypes[0], time_col: dtypes[1]},
-    ).join(X, how="left", on=[entity_col, time_col])
-    return X
+    if freq is None:
+        entities = X.select(pl.col(entity_col).unique())
+        timestamps = X.select(pl.col(time_col).unique())
+        X_idx = entities.join(timestamps, how="cross")
+    else:
+        if freq.endswith("i"):
+            time_range = pl.arange(
+                pl.col("low"), pl.col("high") + 1, step=int(freq[:-1]), eager=False
+            )
+        else:
+            time_range = pl.date_range(
+                pl.col("low"), pl.col("high"), interval=freq, eager=False
+            )
+        X_idx = (
+            X.groupby(entity_col)
+            .agg(
+                [
+                    pl.col(time_col).min().alias("low"),
+                    pl.col(time_col).max().alias("high"),
+                ]
+            )
+            .select([entity_col, time_range.alias(time_col)])
+            .explode(time_col)
+            .with_columns(pl.col(time_col).cast(X.schema[time_col]))
+        )
+    X_new = X_idx.sort([entity_col, time_col]).join(
+        X, how="left", on=[entity_col, time_col]
+    )
+    return X_new
 
 
 @transformer
@@ -134,30 +186,21 @@ def lag(lags: List[int]):
     """
 
     def transform(X: pl.LazyFrame) -> pl.LazyFrame:
-        entity_col = X.columns[0]
-        time_col = X.columns[1]
+        entity_col, time_col = X.columns[:2]
         max_lag = max(lags)
-        lagged_series = [
-            (
-                pl.all()
-                .exclude([entity_col, time_col])
-                .shift(lag)
-                .over(entity_col)
-                .suffix(f"__lag_{lag}")
-            )
-            for lag in lags
-        ]
+        values = pl.all().exclude([entity_col, time_col])
+        # NOTE: Shifts over the sorted frame cross entity boundaries, but only
+        # into the first `max_lag` rows of every entity, which are dropped
         X_new = (
-            # Pre-sorting seems to improve performance by ~20%
-            X.sort(by=[entity_col, time_col])
+            sort_panel(X)
             .select(
-                pl.col(entity_col).set_sorted(),
-                pl.col(time_col).set_sorted(),
-                *lagged_series,
+                [
+                    pl.col(entity_col).set_sorted(),
+                    pl.col(time_col),
+                    *[values.shift(lag).suffix(f"__lag_{lag}") for lag in lags],
+                ]
             )
-            .groupby(entity_col)
-            .agg(pl.all().slice(max_lag))
-            .explode(pl.all().exclude(entity_col))
+            .filter(pl.col(entity_col) == pl.col(entity_col).shift(max_lag))
         )
         artifacts = {"X_new": X_new}
         return artifacts
@@ -165,15 +208,60 @@ def lag(lags: List[int]):
     return transform
 
 
+def lag_matrix(
+    X: pl.DataFrame, lags: List[int], dtype: np.dtype = np.float32
+) -> Tuple[pl.DataFrame, np.ndarray]:
+    """Lagged values of a panel DataFrame as one dense NumPy matrix.
+
+    Same rows and columns as `lag(lags)`, i.e. every lag of every value column
+    (in order), without the first `max(lags)` observations per entity.
+    The matrix is gathered straight from the value columns of the sorted panel.
+
+    Parameters
+    ----------
+    X : pl.DataFrame
+        Panel DataFrame with numeric value columns.
+    lags : List[int]
+        A list of lag values to apply.
+    dtype : np.dtype
+        Data type of the returned matrix. Defaults to `np.float32`.
+
+    Returns
+    -------
+    X_idx : pl.DataFrame
+        Entity and time columns of every row.
+    X_lag : np.ndarray
+        Column-major array of shape (n_rows, len(lags) * n_values).
+    """
+    entity_col, time_col = X.columns[:2]
+    X = X.sort(by=[entity_col, time_col])
+    entities = X.get_column(entity_col)
+    is_valid = (entities == entities.shift(max(lags))).fill_null(False)
+    rows = np.flatnonzero(is_valid.to_numpy())
+    values = df_to_ndarray(X.select(X.columns[2:]), dtype=dtype)
+    n_values = values.shape[1]
+    X_lag = np.empty((len(rows), len(lags) * n_values), dtype=dtype, order="F")
+    for i, lag in enumerate(lags):
+        X_lag[:, i * n_values : (i + 1) * n_values] = values[rows - lag]
+    X_idx = X.select([entity_col, time_col]).filter(is_valid)
+    return X_idx, X_lag
+
+
 @transformer
 def roll(
     window_sizes: List[int],
     stats: List[Literal["mean", "min", "max", "mlm", "sum", "std", "cv"]],
     freq: str,
+    expanding: bool = False,
+    alphas: Optional[List[float]] = None,
 ):
     """
     Performs rolling window calculations on specified columns of a DataFrame.
 
+    Every window and statistic is computed in one pass over the panel sorted
+    by entity and time. Statistics at time `t` only use observations before `t`
+    (no data leakage), and are null until a full window is observed.
+
     Parameters
     ----------
     window_sizes : List[int]
@@ -189,47 +277,81 @@ def roll(
         - 'std' for standard deviation
         - 'cv' for coefficient of variation
     freq : str
-        Offset alias supported by Polars.
+        Offset alias supported by Polars. Observations must be evenly spaced
+        by `freq` (e.g. after `impute`), i.e. a window of size `w` spans `w` rows.
+    expanding : bool
+        Whether to also calculate `stats` over all previous observations per entity.
+        Defaults to False.
+    alphas : Optional[List[float]]
+        Smoothing factors of exponentially weighted statistics.
+        Only "mean" and "std" in `stats` are calculated. Defaults to None.
     """
 
+    def _rolling_exprs(x: pl.Expr, w: int) -> Mapping[str, pl.Expr]:
+        # NOTE: Sliding sums and monotonic deques in Polars rolling kernels
+        return {
+            "mean": x.rolling_mean(w),
+            "min": x.rolling_min(w),
+            "max": x.rolling_max(w),
+            "mlm": x.rolling_max(w) - x.rolling_min(w),
+            "sum": x.rolling_sum(w),
+            "std": x.rolling_std(w),
+            "cv": x.rolling_std(w) / x.rolling_mean(w),
+        }
+
+    def _expanding_exprs(x: pl.Expr, entity_col: str) -> Mapping[str, pl.Expr]:
+        # Cumulative moments of all previous observations per entity
+        x = x.cast(pl.Float64)
+        n = x.cumcount().over(entity_col)
+        x_sum = x.cumsum().shift(1).over(entity_col)
+        x_sq_sum = (x**2).cumsum().shift(1).over(entity_col)
+        x_mean = x_sum / n
+        x_std = ((x_sq_sum - x_sum * x_mean).clip_min(0) / (n - 1)).sqrt()
+        x_min = x.cummin().shift(1).over(entity_col)
+        x_max = x.cummax().shift(1).over(entity_col)
+        return {
+            "mean": x_mean,
+            "min": x_min,
+            "max": x_max,
+            "mlm": x_max - x_min,
+            "sum": x_sum,
+            "std": x_std,
+            "cv": x_std / x_mean,
+        }
+
     def transform(X: pl.LazyFrame) -> pl.LazyFrame:
         entity_col, time_col = X.columns[:2]
-        offset_n, offset_alias = _strip_freq_alias(freq)
-        values = pl.all().exclude([entity_col, time_col])
-        stat_exprs = {
-            "mean": lambda w: values.mean().suffix(f"__rolling_mean_{w}"),
-            "min": lambda w: values.min().suffix(f"__rolling_min_{w}"),
-            "max": lambda w: values.max().suffix(f"__rolling_max_{w}"),
-            "mlm": lambda w: (values.max() - values.min()).suffix(f"__rolling_mlm_{w}"),
-            "sum": lambda w: values.sum().suffix(f"__rolling_sum_{w}"),
-            "std": lambda w: values.std().suffix(f"__rolling_std_{w}"),
-            "cv": lambda w: (values.std() / values.mean()).suffix(f"__rolling_cv_{w}"),
-        }
-        # Degrees of freedom
-        X_all = [
-            (
-                X.sort([entity_col, time_col])
-                .groupby_dynamic(
-                    index_column=time_col,
-                    by=entity_col,
-                    every=freq,
-                    period=f"{offset_n * w}{offset_alias}",
-                )
-                .agg([stat_exprs[stat](w) for stat in stats])
-                # NOTE: Must lag by 1 to avoid data leakage
-                .select([entity_col, time_col, values.shift(w).over(entity_col)])
-            )
-            for w in window_sizes
-        ]
-        # Join all window lazy operations
-        X_rolling = X_all[0]
-        for X_window in X_all[1:]:
-            X_rolling = X_rolling.join(X_window, on=[entity_col, time_col], how="outer")
-        # Defensive join to match original X index
-        X_new = X.join(X_rolling, on=[entity_col, time_col], how="left").select(
-            X_rolling.columns
+        value_cols = X.columns[2:]
+        exprs = []
+        for w in window_sizes:
+            # Rows whose previous `w` rows all belong to the same entity
+            is_full = pl.col(entity_col) == pl.col(entity_col).shift(w)
+            for stat in stats:
+                exprs += [
+                    pl.when(is_full)
+                    .then(_rolling_exprs(pl.col(col).shift(1), w)[stat])
+                    .alias(f"{col}__rolling_{stat}_{w}")
+                    for col in value_cols
+                ]
+        if expanding:
+            for stat in stats:
+                exprs += [
+                    _expanding_exprs(pl.col(col), entity_col)[stat].alias(
+                        f"{col}__expanding_{stat}"
+                    )
+                    for col in value_cols
+                ]
+        for alpha in alphas or []:
+            for stat in [stat for stat in stats if stat in ["mean", "std"]]:
+                exprs += [
+                    getattr(pl.col(col).shift(1), f"ewm_{stat}")(alpha=alpha)
+                    .over(entity_col)
+                    .alias(f"{col}__ewm_{stat}_{alpha}")
+                    for col in value_cols
+                ]
+        X_new = sort_panel(X).select(
+            [pl.col(entity_col).set_sorted(), time_col, *exprs]
         )
-
         artifacts = {"X_new": X_new}
         return artifacts
 
@@ -254,44 +376,48 @@ def scale(use_mean: bool = True, use_std: bool = True, rescale_bool: bool = True
     if not (use_mean or use_std):
         raise ValueError("At least one of `use_mean` or `use_std` must be set to True")
 
-    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
+    def _scale(
+        X: pl.LazyFrame, _mean: Optional[pl.DataFrame], _std: Optional[pl.DataFrame]
+    ) -> pl.LazyFrame:
         idx_cols = X.columns[:2]
         entity_col, time_col = idx_cols
         cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
-        boolean_cols = None
-        _mean = None
-        _std = None
-        if use_mean:
-            X = X.with_columns(
-                PL_NUMERIC_COLS(entity_col, time_col)
-                .mean()
-                .over(entity_col)
-                .suffix("_mean")
-            )
-            mean_cols = [col for col in X.columns if col.endswith("_mean")]
-            _mean = X.select([*idx_cols, *mean_cols])
-            X = X.select(
+        if _mean is not None:
+            X = X.join(_mean.lazy(), on=entity_col, how="left").select(
                 idx_cols + [pl.col(col) - pl.col(f"{col}_mean") for col in cols]
             )
-        if use_std:
-            X = X.with_columns(
-                PL_NUMERIC_COLS(entity_col, time_col)
-                .std()
-                .over(entity_col)
-                .suffix("_std")
-            )
-            std_cols = [col for col in X.columns if col.endswith("_std")]
-            _std = X.select([*idx_cols, *std_cols])
-            X = X.select(
+        if _std is not None:
+            X = X.join(_std.lazy(), on=entity_col, how="left").select(
                 idx_cols + [pl.col(col) / pl.col(f"{col}_std") for col in cols]
             )
         expr = pl.all()
         if rescale_bool:
-            # Original boolean column names
-            boolean_cols = X.select(pl.col(pl.Boolean)).columns
             # Minmax rescale boolean cols [-1, 1]
             expr = [expr, pl.col(pl.Boolean).cast(pl.Int8) * 2 - 1]
-        X_new = X.select(expr)
+        return X.select(expr)
+
+    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
+        idx_cols = X.columns[:2]
+        entity_col, time_col = idx_cols
+        cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
+        # Collect per-entity statistics once into compact tables
+        mean_cols = [f"{col}_mean" for col in cols] if use_mean else []
+        std_cols = [f"{col}_std" for col in cols] if use_std else []
+        stats = (
+            X.groupby(entity_col)
+            .agg(
+                [pl.col(col).mean().alias(f"{col}_mean") for col in cols if use_mean]
+                + [pl.col(col).std().alias(f"{col}_std") for col in cols if use_std]
+            )
+            .collect()
+        )
+        _mean = stats.select([entity_col, *mean_cols]) if use_mean else None
+        _std = stats.select([entity_col, *std_cols]) if use_std else None
+        X_new = _scale(X, _mean=_mean, _std=_std)
+        boolean_cols = None
+        if rescale_bool:
+            # Original boolean column names
+            boolean_cols = X_new.select(pl.col(pl.Boolean)).columns
         artifacts = {
             "X_new": X_new,
             "boolean_cols": boolean_cols,
@@ -300,18 +426,20 @@ def scale(use_mean: bool = True, use_std: bool = True, rescale_bool: bool = True
         }
         return artifacts
 
+    def transform_new(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
+        artifacts = state.artifacts
+        return _scale(X, _mean=artifacts["_mean"], _std=artifacts["_std"])
+
     def invert(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
         idx_cols = X.columns[:2]
         cols = X.select(PL_NUMERIC_COLS(state.time)).columns
         if use_std:
-            _std = state.artifacts["_std"]
-            X = X.join(_std, on=idx_cols, how="left").select(
-                idx_cols + [pl.col(col) * pl.col(f"{col}_std") for col in cols]
+            X = _join_stats(X, state.artifacts["_std"], suffix="__inv").select(
+                idx_cols + [pl.col(col) * pl.col(f"{col}_std__inv") for col in cols]
             )
         if use_mean:
-            _mean = state.artifacts["_mean"]
-            X = X.join(_mean, on=idx_cols, how="left").select(
-                idx_cols + [pl.col(col) + pl.col(f"{col}_mean") for col in cols]
+            X = _join_stats(X, state.artifacts["_mean"], suffix="__inv").select(
+                idx_cols + [pl.col(col) + pl.col(f"{col}_mean__inv") for col in cols]
             )
         expr = pl.all()
         if rescale_bool:
@@ -321,7 +449,7 @@ def scale(use_mean: bool = True, use_std: bool = True, rescale_bool: bool = True
         X_new = X.select(expr)
         return X_new
 
-    return transform, invert
+    return transform, invert, transform_new
 
 
 @transformer
@@ -399,24 +527,26 @@ def diff(order: int, sp: int = 1):
         Seasonal periodicity.
     """
 
-    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
-        def _diff(X):
-            X_new = (
-                X.groupby(entity_col, maintain_order=True)
-                .agg([pl.col(time_col), PL_FLOAT_COLS - PL_FLOAT_COLS.shift(sp)])
-                .explode(pl.all().exclude(entity_col))
-            )
-            return X_new
+    def _diff(X: pl.LazyFrame) -> pl.LazyFrame:
+        entity_col, time_col = X.columns[:2]
+        X_new = (
+            X.groupby(entity_col, maintain_order=True)
+            .agg([pl.col(time_col), PL_FLOAT_COLS - PL_FLOAT_COLS.shift(sp)])
+            .explode(pl.all().exclude(entity_col))
+        )
+        return X_new
 
+    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
         idx_cols = X.columns[:2]
         entity_col = idx_cols[0]
-        time_col = idx_cols[1]
         X = X.with_columns(pl.col(pl.Categorical).cast(pl.Utf8))
 
-        X_first, X_last = pl.collect_all(
+        X_first, X_last, X_tail = pl.collect_all(
             [
                 X.groupby(entity_col).head(1),
                 X.groupby(entity_col).tail(1),
+                # Trailing observations required to difference new data
+                X.groupby(entity_col).tail(order * sp),
             ]
         )
         for _ in range(order):
@@ -427,9 +557,21 @@ def diff(order: int, sp: int = 1):
             "X_new": X.drop_nulls(),
             "X_first": X_first.lazy(),
             "X_last": X_last.lazy(),
+            "X_tail": X_tail.lazy(),
         }
         return artifacts
 
+    def transform_new(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
+        idx_cols = X.columns[:2]
+        X = X.with_columns(pl.col(pl.Categorical).cast(pl.Utf8))
+        X_new = pl.concat(
+            [state.artifacts["X_tail"], X.select(state.artifacts["X_tail"].columns)]
+        ).sort(idx_cols)
+        for _ in range(order):
+            X_new = _diff(X_new)
+        # Keep the rows of new data only
+        return X_new.join(X.select(idx_cols), on=idx_cols, how="semi").drop_nulls()
+
     def invert(
         state: ModelState, X: pl.LazyFrame, from_last: bool = False
     ) -> pl.LazyFrame:
@@ -453,11 +595,123 @@ def diff(order: int, sp: int = 1):
 
         return X.select(idx_cols).join(X_new, on=idx_cols, how="left")
 
-    return transform, invert
+    return transform, invert, transform_new
+
+
+def _boxcox_values(x: np.ndarray, lmbds: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(lmbds == 0, np.log(x), np.expm1(lmbds * np.log(x)) / lmbds)
+
+
+def _yeojohnson_values(x: np.ndarray, lmbds: np.ndarray) -> np.ndarray:
+    # Box-Cox of |x| + 1 with lambda `lmbds` if x >= 0 else `2 - lmbds`, sign preserved
+    is_pos = x >= 0
+    log_x = np.log1p(np.abs(x))
+    lmbds = np.where(is_pos, lmbds, 2 - lmbds)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_new = np.where(lmbds == 0, log_x, np.expm1(lmbds * log_x) / lmbds)
+    return np.where(is_pos, x_new, -x_new)
+
+
+def _segment_var(x: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    # Population variance of contiguous segments
+    mean = np.add.reduceat(x, starts) / counts
+    return np.add.reduceat((x - np.repeat(mean, counts)) ** 2, starts) / counts
+
+
+def _power_normmax(
+    x: np.ndarray,
+    counts: np.ndarray,
+    method: Literal["boxcox", "yeojohnson"],
+    grid: np.ndarray,
+    n_iter: int,
+) -> np.ndarray:
+    # Maximize the profile log-likelihood of every segment of `x` at once
+    if method == "boxcox":
+        transform = _boxcox_values
+        log_jacobian = np.log(x)
+    else:
+        transform = _yeojohnson_values
+        log_jacobian = np.sign(x) * np.log1p(np.abs(x))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    log_jacobian = np.add.reduceat(log_jacobian, starts)
+
+    def llf(lmbds: np.ndarray) -> np.ndarray:
+        x_new = transform(x, np.repeat(lmbds, counts))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            llf = (lmbds - 1) * log_jacobian - counts / 2 * np.log(
+                _segment_var(x_new, starts, counts)
+            )
+        return np.nan_to_num(llf, nan=-np.inf)
+
+    # 1. Coarse grid search
+    scores = np.stack([llf(np.full(len(counts), lmbd)) for lmbd in grid])
+    best = grid[scores.argmax(axis=0)]
+    # 2. Golden-section search within one grid step of the best lambda
+    step = grid[1] - grid[0]
+    low, high = best - step, best + step
+    invphi = (np.sqrt(5) - 1) / 2
+    for _ in range(n_iter):
+        c = high - invphi * (high - low)
+        d = low + invphi * (high - low)
+        is_left = llf(c) > llf(d)
+        high = np.where(is_left, d, high)
+        low = np.where(is_left, low, c)
+    return (low + high) / 2
+
+
+def _power_lmbds(
+    X: pl.LazyFrame,
+    method: Literal["boxcox", "yeojohnson"],
+    n_jobs: int = 1,
+    chunk_size: int = 10_000,
+) -> pl.DataFrame:
+    """Maximum likelihood lambdas of every entity and numeric column.
+
+    Lambdas are first searched over a grid in [-5, 5] for every entity at once,
+    then refined by golden-section search. Entities are split into chunks of
+    `chunk_size` entities, which are estimated in parallel on `n_jobs` threads.
+    """
+    from joblib import Parallel, delayed
+
+    entity_col, time_col = X.columns[:2]
+    cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
+    X = X.select([entity_col, *cols]).sort(entity_col).collect()
+    counts = X.groupby(entity_col, maintain_order=True).agg(pl.count().alias("n"))
+    # NOTE: Counts are UInt32, i.e. mixed with a signed zero they promote to float64
+    n = counts.get_column("n").to_numpy().astype(np.int64)
+    bounds = np.concatenate([[0], np.cumsum(n)])
+    chunks = [
+        (slice(bounds[i], bounds[min(i + chunk_size, len(n))]), n[i : i + chunk_size])
+        for i in range(0, len(n), chunk_size)
+    ]
+    grid = np.linspace(-5, 5, 101)
+
+    def _normmax(x: np.ndarray) -> np.ndarray:
+        lmbds = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_power_normmax)(
+                x[rows], counts=n_chunk, method=method, grid=grid, n_iter=40
+            )
+            for rows, n_chunk in chunks
+        )
+        return np.concatenate(lmbds)
+
+    lmbds = counts.select(
+        [
+            entity_col,
+            *[
+                pl.Series(
+                    f"{col}__lmbd", _normmax(X.get_column(col).to_numpy().astype(float))
+                )
+                for col in cols
+            ],
+        ]
+    )
+    return lmbds
 
 
 @transformer
-def boxcox(method: str = "mle"):
+def boxcox(method: str = "mle", n_jobs: int = 1):
     """Applies the Box-Cox transformation to numeric columns in a DataFrame.
 
     Parameters
@@ -466,24 +720,18 @@ def boxcox(method: str = "mle"):
         The method used to determine the lambda parameter of the Box-Cox transformation.
 
         Supported methods:\n
-        - `mle`: maximum likelihood estimation
+        - `mle`: maximum likelihood estimation, vectorized across entities
         - `pearsonr`: Pearson correlation coefficient
+    n_jobs : int
+        Number of chunks of entities estimated in parallel if `method` is `mle`.
+        Defaults to 1. -1 means using all processors.
     """
 
-    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
+    def _boxcox(X: pl.LazyFrame, lmbds: pl.DataFrame) -> pl.LazyFrame:
         idx_cols = X.columns[:2]
         entity_col, time_col = idx_cols
-        gb = X.groupby(X.columns[0])
-        # Step 1. Compute optimal lambdas
-        lmbds = gb.agg(
-            PL_NUMERIC_COLS(entity_col, time_col)
-            .apply(lambda x: boxcox_normmax(x, method=method))
-            .cast(pl.Float64())
-            .suffix("__lmbd")
-        )
-        # Step 2. Transform
         cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
-        X_new = X.join(lmbds, on=entity_col, how="left").select(
+        X_new = X.join(lmbds.lazy(), on=entity_col, how="left").select(
             idx_cols
             + [
                 pl.when(pl.col(f"{col}__lmbd") == 0)
@@ -494,28 +742,126 @@ def boxcox(method: str = "mle"):
                 for col in cols
             ]
         )
+        return X_new
+
+    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
+        from scipy.stats import boxcox_normmax
+
+        entity_col, time_col = X.columns[:2]
+        # Step 1. Compute optimal lambdas
+        if method == "mle":
+            lmbds = _power_lmbds(X, method="boxcox", n_jobs=n_jobs)
+        else:
+            lmbds = (
+                X.groupby(entity_col)
+                .agg(
+                    PL_NUMERIC_COLS(entity_col, time_col)
+                    .apply(lambda x: boxcox_normmax(x, method=method))
+                    .cast(pl.Float64())
+                    .suffix("__lmbd")
+                )
+                .collect()
+            )
+        # Step 2. Transform
+        X_new = _boxcox(X, lmbds=lmbds)
         artifacts = {"X_new": X_new, "lmbds": lmbds}
         return artifacts
 
+    def transform_new(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
+        return _boxcox(X, lmbds=state.artifacts["lmbds"])
+
     def invert(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
         idx_cols = X.columns[:2]
         lmbds = state.artifacts["lmbds"]
         cols = X.select(PL_NUMERIC_COLS(state.time)).columns
-        X_new = X.join(lmbds, on=X.columns[0], how="left", suffix="__lmbd").select(
+        X_new = _join_stats(X, lmbds, suffix="__inv").select(
             idx_cols
             + [
-                pl.when(pl.col(f"{col}__lmbd") == 0)
+                pl.when(pl.col(f"{col}__lmbd__inv") == 0)
                 .then(pl.col(col).exp())
                 .otherwise(
-                    (pl.col(f"{col}__lmbd") * pl.col(col) + 1)
-                    ** (1 / pl.col(f"{col}__lmbd"))
+                    (pl.col(f"{col}__lmbd__inv") * pl.col(col) + 1)
+                    ** (1 / pl.col(f"{col}__lmbd__inv"))
                 )
                 for col in cols
             ]
         )
         return X_new
 
-    return transform, invert
+    return transform, invert, transform_new
+
+
+@transformer
+def yeojohnson(n_jobs: int = 1):
+    """Applies the Yeo-Johnson transformation to numeric columns in a DataFrame.
+
+    Unlike Box-Cox, Yeo-Johnson supports zero and negative values.
+    Lambdas are estimated per entity by maximum likelihood, vectorized across entities.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of chunks of entities estimated in parallel.
+        Defaults to 1. -1 means using all processors.
+    """
+
+    def _transform_expr(col: str, lmbd: pl.Expr) -> pl.Expr:
+        x = pl.col(col)
+        return (
+            pl.when((x >= 0) & (lmbd == 0))
+            .then((x + 1).log())
+            .when(x >= 0)
+            .then(((x + 1) ** lmbd - 1) / lmbd)
+            .when(lmbd == 2)
+            .then(-(1 - x).log())
+            .otherwise(-((1 - x) ** (2 - lmbd) - 1) / (2 - lmbd))
+        )
+
+    def _invert_expr(col: str, lmbd: pl.Expr) -> pl.Expr:
+        x = pl.col(col)
+        return (
+            pl.when((x >= 0) & (lmbd == 0))
+            .then(x.exp() - 1)
+            .when(x >= 0)
+            .then((x * lmbd + 1) ** (1 / lmbd) - 1)
+            .when(lmbd == 2)
+            .then(1 - (-x).exp())
+            .otherwise(1 - (1 - (2 - lmbd) * x) ** (1 / (2 - lmbd)))
+        )
+
+    def _yeojohnson(X: pl.LazyFrame, lmbds: pl.DataFrame) -> pl.LazyFrame:
+        idx_cols = X.columns[:2]
+        entity_col, time_col = idx_cols
+        cols = X.select(PL_NUMERIC_COLS(entity_col, time_col)).columns
+        X_new = X.join(lmbds.lazy(), on=entity_col, how="left").select(
+            idx_cols
+            + [_transform_expr(col, pl.col(f"{col}__lmbd")).alias(col) for col in cols]
+        )
+        return X_new
+
+    def transform(X: pl.LazyFrame) -> pl.LazyFrame:
+        lmbds = _power_lmbds(X, method="yeojohnson", n_jobs=n_jobs)
+        X_new = _yeojohnson(X, lmbds=lmbds)
+        artifacts = {"X_new": X_new, "lmbds": lmbds}
+        return artifacts
+
+    def transform_new(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
+        return _yeojohnson(X, lmbds=state.artifacts["lmbds"])
+
+    def invert(state: ModelState, X: pl.LazyFrame) -> pl.LazyFrame:
+        idx_cols = X.columns[:2]
+        lmbds = state.artifacts["lmbds"]
+        cols = X.select(PL_NUMERIC_COLS(state.time)).columns
+        X_new = _join_stats(X, lmbds, suffix="__inv").select(
+            idx_cols
+            + [
+                _invert_expr(col, pl.col(f"{col}__lmbd__inv")).alias(col)
+                for col in cols
+            ]
+        )
+        return X_new
+
+    return transform, invert, transform_new
 
 
 @transformer
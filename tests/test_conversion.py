@@ -0,0 +1,127 @@
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+import pytest
+
+from functime.conversion import df_to_ndarray, spill_to_disk
+from functime.forecasting import linear_model
+from functime.forecasting._reduction import make_reduction
+from functime.forecasting._regressors import _X_to_numpy
+
+
+def zarr_df_to_ndarray(df: pl.DataFrame) -> np.ndarray:
+    """Previous spill-to-disk zarr / dask implementation used as benchmark baseline."""
+    import dask.array as da
+    import zarr
+
+    columns = df.columns
+    df = df.select(pl.all().cast(pl.Float32))
+    with tempfile.TemporaryDirectory() as tempdir:
+        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        file_path = f"{tempdir}/{timestamp}.zarr"
+        X = zarr.open_array(
+            store=file_path,
+            mode="w",
+            shape=df.shape,
+            chunks=(df.shape[0], 1),
+            dtype=np.float32,
+            chunk_store=f"{file_path}/chunks",
+        )
+        for i, col in enumerate(columns):
+            X[:, i] = df.get_column(col).to_numpy(zero_copy_only=True)
+        X = da.from_zarr(X).compute()
+    return X
+
+
+@pytest.fixture
+def mixed_df():
+    return pl.DataFrame(
+        {
+            "x_float": [1.5, None, 3.0, 4.0],
+            "x_int": [1, 2, 3, None],
+            "x_bool": [True, False, True, False],
+        }
+    )
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_df_to_ndarray(mixed_df, dtype, order):
+    X = df_to_ndarray(mixed_df, dtype=dtype, order=order)
+    expected = np.array(
+        [[1.5, 1, 1], [np.nan, 2, 0], [3.0, 3, 1], [4.0, np.nan, 0]], dtype=dtype
+    )
+    assert X.dtype == dtype
+    assert X.flags[f"{order}_CONTIGUOUS"]
+    np.testing.assert_array_equal(X, expected)
+
+
+def test_df_to_ndarray_spill(mixed_df):
+    X = df_to_ndarray(mixed_df, max_memory=1)
+    assert isinstance(X, np.memmap)
+    np.testing.assert_array_equal(X, df_to_ndarray(mixed_df))
+
+
+def test_spill_to_disk_context(mixed_df, tmp_path):
+    X_idx = mixed_df.select(
+        [pl.lit("a").alias("entity"), pl.arange(0, 4).alias("time"), pl.all()]
+    )
+    with spill_to_disk(max_memory=1, spill_dir=str(tmp_path)):
+        X = _X_to_numpy(X_idx)
+        # Explicit budget takes precedence over the context
+        X_ram = df_to_ndarray(mixed_df, max_memory=10**6)
+    assert isinstance(X, np.memmap)
+    assert not isinstance(X_ram, np.memmap)
+    assert not isinstance(_X_to_numpy(X_idx), np.memmap)
+    np.testing.assert_array_equal(X, _X_to_numpy(X_idx))
+
+
+def test_spill_to_disk_forecast():
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 20 + ["b"] * 20,
+            "time": list(range(20)) + list(range(20)),
+            "target": np.random.normal(size=40),
+        }
+    )
+    forecaster = linear_model(freq="1i", lags=3)
+    expected = forecaster(y=y, fh=3)
+    with spill_to_disk(max_memory=1):
+        y_pred = forecaster(y=y, fh=3)
+    np.testing.assert_allclose(
+        y_pred.get_column("target").to_numpy(),
+        expected.get_column("target").to_numpy(),
+        rtol=1e-5,
+    )
+
+
+@pytest.fixture
+def m4_X(m4_dataset):
+    y_train, _, _, _ = m4_dataset
+    X_y = make_reduction(lags=12, y=y_train)
+    return X_y.select(X_y.columns[3:])
+
+
+@pytest.fixture
+def m5_X(m5_dataset):
+    _, X_train, _, _, _, _ = m5_dataset
+    X = X_train.collect()
+    return X.select(
+        pl.col(X.columns[2:]).to_physical().cast(pl.Float32).fill_null(strategy="mean")
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("to_ndarray", [df_to_ndarray, zarr_df_to_ndarray])
+def test_df_to_ndarray_on_m4(to_ndarray, m4_X, benchmark):
+    X = benchmark(to_ndarray, m4_X)
+    np.testing.assert_array_equal(X, m4_X.to_numpy().astype(np.float32))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("to_ndarray", [df_to_ndarray, zarr_df_to_ndarray])
+def test_df_to_ndarray_on_m5(to_ndarray, m5_X, benchmark):
+    X = benchmark(to_ndarray, m5_X)
+    np.testing.assert_array_equal(X, m5_X.to_numpy())
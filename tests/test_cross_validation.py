@@ -92,3 +92,32 @@ def test_sliding_window_split(test_size, n_splits, step_size, pl_y, benchmark):
             pl.col(time_col).count()
         )
         assert (test_lengths.select("time") == test_size).select(pl.all().all())[0, 0]
+
+
+def test_sliding_window_split_is_contiguous():
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 30 + ["b"] * 20,
+            "time": list(range(30)) + list(range(20)),
+            "value": list(range(50)),
+        }
+    ).sample(fraction=1.0, shuffle=True, seed=1)
+    cv = sliding_window_split(test_size=3, n_splits=2, step_size=2, window_size=5)
+    splits = cv(y)
+    for i, cutoff in enumerate([5, 3]):
+        y_train, y_test = pl.collect_all(splits[i])
+        ranges = (
+            pl.concat([y_train, y_test])
+            .groupby("entity")
+            .agg(pl.col("time").min().alias("start"), pl.count())
+            .sort("entity")
+        )
+        # Train windows end right before test windows, which end `cutoff` before the end
+        assert ranges.get_column("start").to_list() == [
+            30 - cutoff - 5,
+            20 - cutoff - 5,
+        ]
+        assert ranges.get_column("count").to_list() == [8, 8]
+        assert y_test.groupby("entity").agg(pl.col("time").max()).sort(
+            "entity"
+        ).get_column("time").to_list() == [30 - cutoff + 2, 20 - cutoff + 2]
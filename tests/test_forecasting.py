@@ -1,9 +1,13 @@
+from datetime import date
+
 import cloudpickle
 import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 from sklearnex import patch_sklearn
 
+from functime.base.model import EntityIndex
 from functime.forecasting import (  # ann,
     auto_elastic_net,
     auto_lightgbm,
@@ -13,9 +17,12 @@ from functime.forecasting import (  # ann,
     flaml_lightgbm,
     lightgbm,
     linear_model,
+    ridge,
+    sharded_model,
     xgboost,
     zero_inflated_model,
 )
+from functime.forecasting._reduction import make_direct_reduction, make_reduction
 from functime.metrics import rmsse, smape
 
 patch_sklearn()
@@ -29,7 +36,7 @@ ENSEMBLE_KWARGS = {"max_horizons": 28, "strategy": "ensemble"}
 # fmt: off
 FORECASTERS_TO_TEST = [
     # ("ann", lambda freq: ann(lags=DEFAULT_LAGS, freq=freq)),
-    ("catboost", lambda freq: catboost(lags=DEFAULT_LAGS, freq=freq, iterations=10)),
+    ("catboost", lambda freq: catboost(lags=DEFAULT_LAGS, freq=freq, iterations=10, allow_writing_files=False)),
     ("lgbm", lambda freq: lightgbm(lags=DEFAULT_LAGS, freq=freq, num_iterations=10)),
     ("flaml_lgbm", lambda freq: flaml_lightgbm(lags=DEFAULT_LAGS, freq=freq, custom_hp={"lgbm": {"num_iterations": {"domain": 10}}})),
     ("linear", lambda freq: linear_model(lags=DEFAULT_LAGS, freq=freq)),
@@ -104,6 +111,672 @@ def test_auto_cloudpickle():
     )
 
 
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize(
+    "model", [lightgbm, catboost, auto_elastic_net], ids=lambda m: m.__name__
+)
+def test_save_load(model, mmap, tmp_path):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 12 + ["b"] * 12,
+            "time": list(range(12)) + list(range(12)),
+            "target": [i + np.random.normal() for i in range(24)],
+        }
+    )
+    if model is lightgbm:
+        forecaster = model(freq="1i", lags=3, min_data_in_leaf=1).fit(y=y)
+    elif model is catboost:
+        forecaster = model(
+            freq="1i", lags=3, iterations=10, verbose=False, allow_writing_files=False
+        ).fit(y=y)
+    else:
+        forecaster = model(freq="1i", min_lags=3, max_lags=6).fit(y=y)
+    y_pred = forecaster.predict(fh=3)
+    forecaster.save(tmp_path)
+    loaded_forecaster = model.load(tmp_path, mmap=mmap)
+    assert_frame_equal(y_pred, loaded_forecaster.predict(fh=3))
+
+
+@pytest.mark.parametrize("cls_name", ["CatBoostRegressor", "CatBoostClassifier"])
+def test_save_load_catboost_subclass(cls_name, tmp_path):
+    import catboost as cb
+
+    from functime.base._persistence import load_model, save_model
+
+    X = np.random.rand(50, 3)
+    y = (np.random.rand(50) > 0.5).astype(int)
+    model = getattr(cb, cls_name)(
+        iterations=5, verbose=False, allow_writing_files=False
+    ).fit(X, y)
+    save_model({"model": model}, tmp_path)
+    loaded_model = load_model(tmp_path)["model"]
+    # Subclasses post-process raw predictions, e.g. into class labels
+    assert type(loaded_model) is type(model)
+    np.testing.assert_array_equal(loaded_model.predict(X), model.predict(X))
+
+
+def test_save_removes_stale_artifacts(tmp_path):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 12 + ["b"] * 12,
+            "time": list(range(12)) + list(range(12)),
+            "target": [i + np.random.normal() for i in range(24)],
+        }
+    )
+    params = {"freq": "1i", "lags": 3, "min_data_in_leaf": 1}
+    lightgbm(max_horizons=3, strategy="direct", **params).fit(y=y).save(tmp_path)
+    n_stale = len(list((tmp_path / "artifacts").iterdir()))
+    forecaster = lightgbm(**params).fit(y=y)
+    forecaster.save(tmp_path)
+    # Only the artifacts of the last saved model remain
+    assert len(list((tmp_path / "artifacts").iterdir())) < n_stale
+    loaded_forecaster = lightgbm.load(tmp_path)
+    assert_frame_equal(forecaster.predict(fh=3), loaded_forecaster.predict(fh=3))
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct", "ensemble"])
+def test_update_matches_fit(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 30 + ["b"] * 20,
+            "time": list(range(30)) + list(range(20)),
+            "target": np.random.normal(size=50),
+        }
+    )
+    params = {"freq": "1i", "lags": 3, "max_horizons": 2, "strategy": strategy}
+    forecaster = linear_model(**params).fit(y=y)
+    updated_forecaster = (
+        linear_model(**params)
+        .fit(y=y.filter(pl.col("time") < 17))
+        .update(y=y.filter(pl.col("time") >= 17))
+    )
+    artifacts = forecaster.state.artifacts
+    updated_artifacts = updated_forecaster.state.artifacts
+    assert_frame_equal(
+        artifacts["__cutoffs"].sort("entity"),
+        updated_artifacts["__cutoffs"].sort("entity"),
+    )
+    for key in ["recursive", "direct"] if strategy == "ensemble" else [None]:
+        expected = artifacts[key] if key else artifacts
+        result = updated_artifacts[key] if key else updated_artifacts
+        assert_frame_equal(
+            expected["y_lag"].sort("entity"), result["y_lag"].sort("entity")
+        )
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_update_monthly_dates(strategy):
+    # History is rebuilt from `y_lag` with timestamps stepped back by `freq`
+    time = pl.date_range(date(2020, 1, 1), date(2022, 6, 1), "1mo", eager=True)
+    y = pl.DataFrame(
+        {"entity": ["a"] * len(time), "time": time, "target": np.arange(len(time))}
+    ).with_columns(pl.col("target").cast(pl.Float64))
+    params = {"freq": "1mo", "lags": 3, "max_horizons": 2, "strategy": strategy}
+    forecaster = linear_model(**params).fit(y=y)
+    updated_forecaster = (
+        linear_model(**params)
+        .fit(y=y.filter(pl.col("time") < date(2021, 9, 1)))
+        .update(y=y.filter(pl.col("time") >= date(2021, 9, 1)))
+    )
+    assert_frame_equal(
+        forecaster.state.artifacts["y_lag"], updated_forecaster.state.artifacts["y_lag"]
+    )
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_y_lag_state(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 30 + ["b"] * 20,
+            "time": list(range(30)) + list(range(20)),
+            "target": np.random.normal(size=50),
+        }
+    )
+    params = {"freq": "1i", "lags": 3, "max_horizons": 2, "strategy": strategy}
+    forecaster = linear_model(**params).fit(y=y)
+    # History is keyed by entity codes
+    y_lag = forecaster.entity_index.decode(forecaster.state.artifacts["y_lag"])
+    width = 3 if strategy == "recursive" else 5
+    # One fixed-width history of the most recent target values per entity
+    expected = (
+        y.groupby("entity")
+        .agg([pl.col("time").last(), pl.col("target").tail(width).cast(pl.Float32)])
+        .sort("entity")
+    )
+    assert_frame_equal(y_lag.sort("entity"), expected)
+
+
+@pytest.mark.parametrize("dtype", [pl.Utf8, pl.Categorical])
+def test_entity_index(dtype):
+    y = pl.DataFrame(
+        {
+            "entity": ["c", "a", "b", "a"],
+            "time": [0, 0, 0, 1],
+            "target": [1.0, 2.0, 3.0, 4.0],
+        }
+    ).with_columns(pl.col("entity").cast(dtype))
+    entity_index = EntityIndex.from_df(y)
+    y_encoded = entity_index.encode(y)
+    # Codes are positions of the sorted unique entities
+    assert y_encoded.get_column("entity").to_list() == [2, 0, 1, 0]
+    y_decoded = entity_index.decode(y_encoded)
+    assert y_decoded.schema == y.schema
+    assert_frame_equal(
+        y_decoded.with_columns(pl.col("entity").cast(pl.Utf8)),
+        y.with_columns(pl.col("entity").cast(pl.Utf8)),
+    )
+    y_new = pl.DataFrame({"entity": ["a", "d"], "time": [2, 0], "target": [0.0, 0.0]})
+    assert entity_index.encode(y_new).get_column("entity").null_count() == 1
+    with pytest.raises(ValueError):
+        entity_index.encode(y_new.lazy(), unseen="raise")
+
+
+def test_update_warm_start():
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 30 + ["b"] * 20,
+            "time": list(range(30)) + list(range(20)),
+            "target": np.random.normal(size=50),
+        }
+    )
+    forecaster = lightgbm(freq="1i", lags=3, min_data_in_leaf=1).fit(
+        y=y.filter(pl.col("time") < 17)
+    )
+    n_trees = forecaster.state.artifacts["regressor"].regressor.num_trees()
+    forecaster.update(y=y.filter(pl.col("time") >= 17), warm_start=True)
+    assert forecaster.state.artifacts["regressor"].regressor.num_trees() > n_trees
+    assert forecaster.predict(fh=3).height == 6
+    with pytest.raises(ValueError):
+        forecaster.update(y=y.filter(pl.col("time") >= 17))
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_predict_unseen_entities(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 12 + ["b"] * 12,
+            "time": list(range(12)) + list(range(12)),
+            "target": np.random.normal(size=24),
+        }
+    )
+    X = y.select(["entity", "time", pl.col("target").alias("x")])
+    X_future = pl.DataFrame(
+        {
+            "entity": ["a"] * 3 + ["b"] * 3 + ["c"] * 3,
+            "time": [12, 13, 14] * 3,
+            "x": np.random.normal(size=9),
+        }
+    )
+    forecaster = linear_model(freq="1i", lags=3, max_horizons=3, strategy=strategy).fit(
+        y=y, X=X
+    )
+    # Rows of unseen entities in `X` are encoded as null and never forecasted
+    y_pred = forecaster.predict(fh=3, X=X_future)
+    expected = forecaster.predict(fh=3, X=X_future.filter(pl.col("entity") != "c"))
+    assert_frame_equal(y_pred, expected)
+    assert y_pred.get_column("entity").unique().sort().to_list() == ["a", "b"]
+    # Unseen entities cannot be updated
+    y_new = pl.DataFrame({"entity": ["c"], "time": [12], "target": [0.0]})
+    with pytest.raises(ValueError, match="unseen entities"):
+        forecaster.update(y=y_new)
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_predict_missing_exogenous_raises(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 12 + ["b"] * 12,
+            "time": list(range(12)) + list(range(12)),
+            "target": np.random.normal(size=24),
+        }
+    )
+    X = y.select(["entity", "time", pl.col("target").alias("x")])
+    X_future = pl.DataFrame(
+        {
+            "entity": ["a"] * 3 + ["b"] * 2,
+            "time": [12, 13, 14, 12, 13],
+            "x": np.random.normal(size=5),
+        }
+    )
+    forecaster = linear_model(freq="1i", lags=3, max_horizons=3, strategy=strategy).fit(
+        y=y, X=X
+    )
+    with pytest.raises(ValueError, match="forecast horizon step"):
+        forecaster.predict(fh=3, X=X_future)
+
+
+@pytest.mark.parametrize(
+    "forecaster, params",
+    [
+        (lightgbm, {"num_iterations": 10, "min_data_in_leaf": 1}),
+        (xgboost, {"num_boost_round": 10}),
+        (catboost, {"iterations": 10, "allow_writing_files": False}),
+    ],
+    ids=["lgbm", "xgboost", "catboost"],
+)
+def test_gbt_columnar_features(forecaster, params):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    weekday = ["mon", "tue", None, "thu"]
+    X = pl.DataFrame(
+        {
+            "entity": y.get_column("entity"),
+            "time": y.get_column("time"),
+            "x": [None if t % 5 == 0 else t * 0.5 for t in y.get_column("time")],
+            "weekday": [weekday[t % 4] for t in y.get_column("time")],
+        }
+    ).with_columns(pl.col("weekday").cast(pl.Categorical))
+    X_future = pl.DataFrame(
+        {
+            "entity": ["a"] * 3 + ["b"] * 3,
+            "time": [24, 25, 26] * 2,
+            "x": [None, 12.5, 13.0] * 2,
+            # "sun" is unseen in fit
+            "weekday": ["mon", "sun", None] * 2,
+        }
+    ).with_columns(pl.col("weekday").cast(pl.Categorical))
+    model = forecaster(freq="1i", lags=3, **params).fit(y=y, X=X)
+    regressor = model.state.artifacts["regressor"]
+    # Categoricals are passed to the booster as categories, not physical codes
+    assert set(regressor.categories["weekday"]) == {"mon", "tue", "thu"}
+    y_pred = model.predict(fh=3, X=X_future)
+    assert y_pred.height == 6
+    assert y_pred.get_column("target").is_not_null().all()
+
+
+@pytest.mark.parametrize("n_shards", [1, 3])
+def test_sharded_model(n_shards):
+    entities = [f"e{i}" for i in range(6)]
+    y = pl.DataFrame(
+        {
+            "entity": np.repeat(entities, 20),
+            "time": np.tile(np.arange(20), 6),
+            "target": np.random.normal(size=120),
+        }
+    )
+    forecaster = sharded_model(
+        freq="1i", lags=3, forecaster=linear_model, n_shards=n_shards, n_jobs=2
+    ).fit(y=y)
+    shards = forecaster.state.artifacts["shards"]
+    assert shards.get_column("shard").n_unique() == n_shards
+    y_pred = forecaster.predict(fh=3).sort(["entity", "time"])
+    assert y_pred.height == 18
+    # Shards are fit independently
+    for entities in shards.partition_by("shard"):
+        y_shard = y.join(
+            forecaster.entity_index.decode(entities), on="entity", how="semi"
+        )
+        y_pred_shard = linear_model(freq="1i", lags=3)(y=y_shard, fh=3)
+        assert_frame_equal(
+            y_pred.join(y_pred_shard.select("entity"), on="entity", how="semi"),
+            y_pred_shard.sort(["entity", "time"]),
+            atol=1e-4,
+        )
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_out_of_core_matches(strategy, tmp_path):
+    y = pl.DataFrame(
+        {
+            "entity": np.repeat([f"e{i}" for i in range(6)], 24),
+            "time": np.tile(np.arange(24), 6),
+            "target": np.random.normal(size=144),
+        }
+    )
+    y.write_parquet(tmp_path / "y.parquet")
+    kwargs = {"freq": "1i", "lags": 3, "max_horizons": 4, "strategy": strategy}
+    expected = ridge(**kwargs, alpha=0.5)(y=y, fh=4)
+    # Budget of a few entities' lagged features per batch
+    result = ridge(**kwargs, alpha=0.5, memory_budget=4096)(
+        y=pl.scan_parquet(tmp_path / "y.parquet"), fh=4
+    )
+    idx_cols = y.columns[:2]
+    assert_frame_equal(result.sort(idx_cols), expected.sort(idx_cols), atol=1e-4)
+
+
+@pytest.mark.parametrize("model", [lightgbm, xgboost], ids=lambda m: m.__name__)
+def test_out_of_core_boosting(model, tmp_path):
+    y = pl.DataFrame(
+        {
+            "entity": np.repeat([f"e{i}" for i in range(6)], 24),
+            "time": np.tile(np.arange(24), 6),
+            "target": np.random.normal(size=144),
+        }
+    )
+    y.write_parquet(tmp_path / "y.parquet")
+    forecaster = model(freq="1i", lags=3, memory_budget=4096).fit(
+        y=pl.scan_parquet(tmp_path / "y.parquet")
+    )
+    y_pred = forecaster.predict(fh=4)
+    assert y_pred.height == 24
+    assert y_pred.get_column("target").is_not_null().all()
+    with pytest.raises(ValueError, match="memory_budget"):
+        catboost(freq="1i", lags=3, memory_budget=4096)
+
+
+def test_xgboost_external_memory(tmp_path):
+    y = pl.DataFrame(
+        {
+            "entity": np.repeat([f"e{i}" for i in range(6)], 24),
+            "time": np.tile(np.arange(24), 6),
+            "target": np.random.normal(size=144),
+        }
+    )
+    cache_prefix = str(tmp_path / "cache")
+    forecaster = xgboost(
+        freq="1i", lags=3, memory_budget=4096, cache_prefix=cache_prefix
+    ).fit(y=y)
+    y_pred = forecaster.predict(fh=4)
+    assert y_pred.height == 24
+    assert y_pred.get_column("target").is_not_null().all()
+    with pytest.raises(ValueError, match="memory_budget"):
+        xgboost(freq="1i", lags=3, cache_prefix=cache_prefix).fit(y=y)
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [(lightgbm, {"num_iterations": 10}), (xgboost, {}), (linear_model, {})],
+    ids=["lgbm", "xgboost", "linear"],
+)
+def test_predict_numpy_matches(model, params):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    forecaster = model(freq="1i", lags=3, **params).fit(y=y)
+    regressor = forecaster.state.artifacts["regressor"]
+    X = make_reduction(lags=3, y=y.lazy()).drop("target")
+    X_arr = X.select(X.columns[2:]).to_numpy().astype(np.float32)
+    # The lag matrix of the numpy engine skips building a frame per step
+    np.testing.assert_allclose(
+        regressor.predict_numpy(X_arr, feature_names=X.columns[2:]),
+        regressor.predict(X),
+        rtol=1e-5,
+    )
+
+
+def test_predict_numpy_callable_dtype():
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    forecaster = lightgbm(freq="1i", lags=3, num_iterations=10).fit(y=y)
+    regressor = forecaster.state.artifacts["regressor"]
+    regressor.predict_dtype = lambda X: X.select(X.columns[2:]).to_pandas()
+    X = make_reduction(lags=3, y=y.lazy()).drop("target")
+    X_arr = X.select(X.columns[2:]).to_numpy()
+    # Callable dtypes fall back to predicting from a frame
+    np.testing.assert_allclose(
+        regressor.predict_numpy(
+            X_arr, feature_names=X.columns[2:], idx=X.select(X.columns[:2])
+        ),
+        regressor.predict(X),
+    )
+
+
+@pytest.mark.parametrize("exogenous", [False, True])
+@pytest.mark.parametrize("model", [lightgbm, linear_model], ids=lambda m: m.__name__)
+@pytest.mark.parametrize("strategy", ["recursive", "ensemble"])
+def test_recursive_engines_match(strategy, model, exogenous):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 28 + ["b"] * 28,
+            "time": list(range(28)) + list(range(28)),
+            "target": [i + np.random.normal() for i in range(56)],
+        }
+    ).with_columns(pl.col("target").cast(pl.Float32))
+    X = y.select(
+        ["entity", "time", (pl.col("time") % 7).alias("dow"), pl.col("target") * 2]
+    )
+    y_train = y.filter(pl.col("time") < 24)
+    X_train = X.filter(pl.col("time") < 24) if exogenous else None
+    X_future = X.filter(pl.col("time") >= 24) if exogenous else None
+    params = {"num_iterations": 10} if model is lightgbm else {}
+    forecaster = model(
+        freq="1i", lags=3, max_horizons=4, strategy=strategy, **params
+    ).fit(y=y_train, X=X_train)
+    forecaster.engine = "polars"
+    y_pred_polars = forecaster.predict(fh=4, X=X_future)
+    forecaster.engine = "numpy"
+    # Numeric exogenous features are copied into the lag matrix at every step
+    y_pred_numpy = forecaster.predict(fh=4, X=X_future)
+    idx_cols = y.columns[:2]
+    assert_frame_equal(y_pred_polars.sort(idx_cols), y_pred_numpy.sort(idx_cols))
+
+
+@pytest.mark.parametrize(
+    "estimator, params",
+    [
+        ("linear_model", {"alpha": 0.0}),
+        ("ridge", {"alpha": 0.5}),
+        ("lasso", {"alpha": 0.01, "l1_ratio": 1.0}),
+        ("elastic_net", {"alpha": 0.01, "l1_ratio": 0.5}),
+    ],
+)
+def test_direct_multi_output_matches(estimator, params):
+    from functime.forecasting import linear
+    from functime.forecasting._ar import fit_direct
+
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    ).lazy()
+    kwargs = {k: v for k, v in params.items() if k != "l1_ratio" and v > 0}
+    regress = getattr(linear, f"_{estimator}")(**kwargs)
+    fit_kwargs = {"regress": regress, "lags": 3, "max_horizons": 4, "y": y}
+    expected = fit_direct(**fit_kwargs, n_jobs=2)["regressors"]
+    result = fit_direct(
+        **fit_kwargs, regress_horizons=linear._linear_horizons(**params)
+    )["regressors"]
+    X = make_direct_reduction(lags=3, max_horizons=4, y=y)
+    for i in range(4):
+        X_i = X.select(
+            ["entity", "time", *[f"target__lag_{j}" for j in range(i + 1, i + 4)]]
+        )
+        np.testing.assert_allclose(
+            result[i].predict(X_i), expected[i].predict(X_i), rtol=1e-3
+        )
+
+
+@pytest.mark.parametrize("backend", ["lightgbm", "xgboost", "catboost"])
+def test_direct_coerced_horizons_match(backend):
+    from importlib import import_module
+
+    from functime.forecasting._ar import _horizon_cols, fit_direct
+
+    module = import_module(f"functime.forecasting.{backend}")
+    params = {
+        "lightgbm": {"num_iterations": 10, "min_data_in_leaf": 1},
+        "xgboost": {"max_depth": 3},
+        "catboost": {"iterations": 10, "allow_writing_files": False},
+    }[backend]
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    X = y.select(
+        [
+            "entity",
+            "time",
+            (pl.col("time") % 7).alias("dow"),
+            (pl.col("time") % 2).cast(pl.Utf8).cast(pl.Categorical).alias("parity"),
+        ]
+    )
+    regress = getattr(module, f"_{backend}")(**params)
+    fit_kwargs = {"regress": regress, "lags": 3, "max_horizons": 4, "y": y, "X": X}
+    expected = fit_direct(**fit_kwargs)["regressors"]
+    horizons = (
+        module._lightgbm_exogenous_horizons
+        if backend == "lightgbm"
+        else getattr(module, f"_{backend}_horizons")
+    )
+    # Every horizon is fitted on a column slice of one coerced reduction
+    result = fit_direct(**fit_kwargs, regress_horizons=horizons(n_jobs=2, **params))[
+        "regressors"
+    ]
+    X_y = make_direct_reduction(lags=3, max_horizons=4, y=y, X=X)
+    horizon_cols = _horizon_cols(
+        "target", lags=3, max_horizons=4, feature_cols=["dow", "parity"]
+    )
+    for i, cols in enumerate(horizon_cols):
+        X_i = X_y.select(["entity", "time", *cols])
+        np.testing.assert_allclose(result[i].predict(X_i), expected[i].predict(X_i))
+
+
+def test_lightgbm_shared_dataset():
+    from functime.forecasting._reduction import _SHARED_REDUCTION, shared_reduction
+
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    params = {"freq": "1i", "lags": 3, "num_iterations": 10, "min_data_in_leaf": 1}
+    expected = [
+        lightgbm(**params, num_leaves=num_leaves).fit(y=y).predict(fh=3)
+        for num_leaves in [2, 4]
+    ]
+    with shared_reduction(max_lags=3):
+        # Trials with different hyperparameters train on one binned dataset
+        result = [
+            lightgbm(**params, num_leaves=num_leaves).fit(y=y).predict(fh=3)
+            for num_leaves in [2, 4]
+        ]
+        assert len(_SHARED_REDUCTION.get()._artifacts) == 1
+    for y_pred_expected, y_pred in zip(expected, result):
+        assert_frame_equal(y_pred, y_pred_expected)
+
+
+def test_lightgbm_direct_horizons():
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    )
+    forecaster = lightgbm(
+        freq="1i", lags=3, max_horizons=4, strategy="direct", num_iterations=10
+    ).fit(y=y)
+    assert len(forecaster.state.artifacts["regressors"]) == 4
+    y_pred = forecaster.predict(fh=4)
+    assert y_pred.height == 8
+    assert y_pred.get_column("target").is_not_null().all()
+
+
+@pytest.fixture
+def ann_data():
+    rng = np.random.default_rng(0)
+    n_rows, n_dims = 512, 8
+    embs = rng.normal(size=(n_rows, n_dims)).astype(np.float32)
+    idx = {"entity": ["a"] * n_rows, "time": list(range(n_rows))}
+    X = pl.DataFrame({**idx, **{f"x{j}": embs[:, j] for j in range(n_dims)}})
+    y = pl.DataFrame({**idx, "target": rng.normal(size=n_rows).astype(np.float32)})
+    return X, y
+
+
+def _fit_ann(X, y, tmp_path, **kwargs):
+    from functime.forecasting.lance import ANNRegressor
+
+    # Exhaustive probes and refinement make search results (and distances) exact
+    params = {"num_partitions": 2, "num_sub_vectors": 1, "nprobes": 2}
+    params = {**params, "refine_factor": 100, **kwargs}
+    return ANNRegressor(uri=str(tmp_path / "knn.lance"), **params).fit(X=X, y=y)
+
+
+def test_ann_inverse_distance_weights(ann_data, tmp_path):
+    X, y = ann_data
+    regressor = _fit_ann(X, y, tmp_path, k=3)
+    embs = X.select(pl.all().exclude(["entity", "time"])).to_numpy()
+    labels = y.get_column("target").to_numpy()
+    queries = embs[:10] + 0.1
+    # Brute-force k nearest neighbors under (squared) L2 distance
+    distances = ((queries[:, None, :] - embs[None, :, :]) ** 2).sum(axis=-1)
+    nearest = np.argsort(distances, axis=1)[:, :3]
+    weights = 1 / np.take_along_axis(distances, nearest, axis=1)
+    expected = (labels[nearest] * weights).sum(axis=1) / weights.sum(axis=1)
+    X_new = X.head(10).with_columns(pl.col("^x.*$") + 0.1)
+    np.testing.assert_allclose(regressor.predict(X_new), expected, rtol=1e-4)
+
+
+def test_ann_exact_match(ann_data, tmp_path):
+    X, y = ann_data
+    # Duplicate the first embedding with its label shifted by one
+    X = pl.concat([X, X.head(1).with_columns(pl.col("time") + 512)])
+    y = pl.concat(
+        [y, y.head(1).with_columns([pl.col("time") + 512, pl.col("target") + 1])]
+    )
+    regressor = _fit_ann(X, y, tmp_path, k=3)
+    y_pred = regressor.predict(X.head(5))
+    # Exact matches take precedence over (infinitely weighted) neighbors
+    # and duplicates are averaged
+    expected = y.get_column("target").head(5).to_numpy().copy()
+    expected[0] += 0.5
+    np.testing.assert_allclose(y_pred, expected, rtol=1e-6)
+
+
+def test_ann_batches(ann_data, tmp_path):
+    X, y = ann_data
+    regressor = _fit_ann(X, y, tmp_path, k=2)
+    expected = regressor.predict(X)
+    # Blocks are concatenated in query order whatever their size and concurrency
+    for batch_size, n_jobs in [(7, 2), (1, 4), (1024, 1)]:
+        regressor.batch_size, regressor.n_jobs = batch_size, n_jobs
+        np.testing.assert_array_equal(regressor.predict(X), expected)
+    assert regressor.predict(X.head(0)).shape == (0,)
+
+
+def test_ann_pickle(ann_data, tmp_path):
+    X, y = ann_data
+    regressor = _fit_ann(X, y, tmp_path, k=2)
+    expected = regressor.predict(X.head(20))
+    unpickled = cloudpickle.loads(cloudpickle.dumps(regressor))
+    # Dataset handles are dropped from the pickle and reopened from `uri`
+    assert unpickled._dataset is None
+    np.testing.assert_array_equal(unpickled.predict(X.head(20)), expected)
+    assert unpickled._dataset is not None
+
+
+@pytest.mark.parametrize("lags", [1, 3, 6])
+def test_shared_reduction_matches(lags):
+    from functime.forecasting._reduction import make_reduction, shared_reduction
+
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 24 + ["b"] * 24,
+            "time": list(range(24)) + list(range(24)),
+            "target": [i + np.random.normal() for i in range(48)],
+        }
+    ).lazy()
+    X = y.select(["entity", "time", (pl.col("time") % 7).alias("dow")])
+    idx_cols = ["entity", "time"]
+    expected = make_reduction(lags=lags, y=y, X=X)
+    with shared_reduction(max_lags=6):
+        # Build shared lags with a larger lag count first
+        make_reduction(lags=6, y=y, X=X)
+        result = make_reduction(lags=lags, y=y, X=X)
+    assert_frame_equal(result.sort(idx_cols), expected.sort(idx_cols))
+
+
 def test_forecaster_on_m4(forecaster, m4_dataset, benchmark):
     """Run global models against the M4 competition datasets and check overall RMSE
     (i.e. averaged across all time-series) is less than 2.
@@ -164,6 +837,29 @@ def simple_classify(X: np.ndarray, y: np.ndarray):
     return estimator
 
 
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_censored_model_strategies(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 40 + ["b"] * 40,
+            "time": list(range(40)) + list(range(40)),
+            "target": np.abs(np.random.normal(size=80)) * 10,
+        }
+    )
+    y_pred = censored_model(
+        freq="1i",
+        lags=3,
+        max_horizons=3,
+        strategy=strategy,
+        threshold=5,
+        regress=simple_regress,
+        classify=simple_classify,
+    )(y=y, fh=3)
+    assert y_pred.columns == [*y.columns, "threshold_proba"]
+    assert y_pred.schema["threshold_proba"] == pl.Float32
+    assert y_pred.get_column("threshold_proba").is_between(0, 1).all()
+
+
 @pytest.mark.parametrize("threshold", [5, 10])
 def test_censored_model_on_m5(threshold, m5_dataset):
     y_train, X_train, y_test, X_test, fh, freq = m5_dataset
@@ -206,3 +902,28 @@ def test_zero_inflated_model_on_m5(m5_dataset):
         .mean()
     )
     assert score < 2
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct"])
+def test_parallel_backtest_matches(strategy):
+    y = pl.DataFrame(
+        {
+            "entity": ["a"] * 40 + ["b"] * 40,
+            "time": list(range(40)) + list(range(40)),
+            "target": [i + np.random.normal() for i in range(80)],
+        }
+    )
+    X = y.select(["entity", "time", (pl.col("time") % 7).cast(pl.Float64).alias("x")])
+    forecaster = linear_model(freq="1i", lags=3, max_horizons=3, strategy=strategy)
+    kwargs = {"y": y, "X": X, "test_size": 3, "n_splits": 3}
+    expected = forecaster.backtest(**kwargs)
+    result = forecaster.backtest(**kwargs, n_jobs=3)
+    for df, expected_df in zip(result, expected):
+        sort_cols = ["split", *df.columns[:2]]
+        # NOTE: Worker processes are not patched by sklearnex
+        assert_frame_equal(
+            df.sort(sort_cols),
+            expected_df.sort(sort_cols),
+            check_exact=False,
+            atol=1e-2,
+        )
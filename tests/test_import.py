@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Cold-start budget for importing a single lightweight forecaster
+IMPORT_BUDGET_SECONDS = 2.0
+HEAVY_MODULES = ["catboost", "flaml", "lance", "lightgbm", "sklearn", "xgboost"]
+
+
+def _run_cold(code: str):
+    # Fresh interpreter so that no backend is already imported
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.benchmark
+def test_linear_model_cold_import():
+    code = f"""
+import json, sys
+from timeit import default_timer
+start = default_timer()
+from functime.forecasting import linear_model
+elapsed = default_timer() - start
+imported = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "imported": imported}}))
+"""
+    result = _run_cold(code)
+    assert result["imported"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_forecasters_resolve_lazily():
+    code = """
+import json, sys
+import functime.forecasting as forecasting
+before = "lightgbm" in sys.modules
+forecaster = forecasting.lightgbm
+print(json.dumps({
+    "before": before,
+    "after": "lightgbm" in sys.modules,
+    "name": forecaster.__name__,
+    "all": all(hasattr(forecasting, name) for name in forecasting.__all__),
+}))
+"""
+    result = _run_cold(code)
+    assert result == {"before": False, "after": True, "name": "lightgbm", "all": True}
+
+
+def test_submodule_import_keeps_forecaster():
+    code = """
+import json, types
+import functime.forecasting as forecasting
+import functime.forecasting.lightgbm
+from functime.forecasting import lightgbm
+forecasting.custom = 1
+print(json.dumps({
+    "attr": isinstance(forecasting.lightgbm, types.ModuleType),
+    "imported": isinstance(lightgbm, types.ModuleType),
+    "custom": forecasting.custom,
+}))
+"""
+    # Binding the backend submodule must not shadow the forecaster of the same name
+    result = _run_cold(code)
+    assert result == {"attr": False, "imported": False, "custom": 1}
@@ -0,0 +1,124 @@
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from functime.metrics import (
+    mae,
+    mape,
+    mase,
+    mse,
+    overforecast,
+    rmse,
+    rmsse,
+    smape,
+    underforecast,
+)
+from functime.metrics.multi_objective import score_forecast
+from functime.metrics.point import score_point
+
+
+@pytest.fixture
+def y_splits():
+    rng = np.random.default_rng(42)
+    entities = [f"x{i}" for i in range(20)]
+    y_train = pl.DataFrame(
+        {
+            "series_id": [e for e in entities for _ in range(30)],
+            "time": list(range(30)) * len(entities),
+            "target": rng.normal(size=30 * len(entities)) + 5,
+        }
+    )
+    y_true = pl.DataFrame(
+        {
+            "series_id": [e for e in entities for _ in range(5)],
+            "time": list(range(30, 35)) * len(entities),
+            "target": rng.normal(size=5 * len(entities)) + 5,
+        }
+    )
+    y_pred = y_true.with_columns(pl.col("target") + rng.normal(size=y_true.height))
+    return y_train, y_true, y_pred
+
+
+def _reference_scores(y_train, y_true, y_pred, sp: int = 1) -> pl.DataFrame:
+    # Per-series metrics from their textbook formulas, independent of functime
+    entity_col = y_true.columns[0]
+    rows = []
+    for entity in sorted(y_true.get_column(entity_col).unique()):
+        actual, pred, train = [
+            df.filter(pl.col(entity_col) == entity).get_column("target").to_numpy()
+            for df in [y_true, y_pred, y_train]
+        ]
+        error = pred - actual
+        naive_error = train[sp:] - train[:-sp]
+        rows.append(
+            {
+                entity_col: entity,
+                "mae": np.mean(np.abs(error)),
+                "mape": np.mean(np.abs(error) / np.abs(actual)),
+                "mse": np.mean(error**2),
+                # NOTE: Totals over no forecasts are null, as Polars sums of empty groups
+                "overforecast": pred[pred > actual].sum()
+                if any(pred > actual)
+                else None,
+                "rmse": np.sqrt(np.mean(error**2)),
+                "smape": np.abs(error).sum() / (pred + actual).sum(),
+                "underforecast": pred[pred < actual].sum()
+                if any(pred < actual)
+                else None,
+                "mase": np.mean(np.abs(error)) / np.mean(np.abs(naive_error)),
+                "rmsse": np.sqrt(np.mean(error**2) / np.mean(naive_error**2)),
+            }
+        )
+    return pl.DataFrame(rows)
+
+
+def test_score_forecast_matches_reference(y_splits):
+    y_train, y_true, y_pred = y_splits
+    expected = _reference_scores(y_train, y_true, y_pred)
+    names = expected.columns[1:]
+    scores = score_forecast(y_true, y_pred, y_train=y_train, metrics=names)
+    assert scores.columns == ["series_id", *names]
+    assert_frame_equal(scores.sort("series_id"), expected, check_dtype=False)
+
+
+def test_metrics_match_reference(y_splits):
+    y_train, y_true, y_pred = y_splits
+    expected = _reference_scores(y_train, y_true, y_pred)
+    metrics = [mae, mape, mse, overforecast, rmse, smape, underforecast]
+    scores = [m(y_true, y_pred) for m in metrics] + [
+        m(y_true, y_pred, y_train=y_train) for m in [mase, rmsse]
+    ]
+    for name, score in zip(expected.columns[1:], scores):
+        assert_frame_equal(
+            score.sort("series_id"),
+            expected.select(["series_id", name]),
+            check_dtype=False,
+        )
+
+
+@pytest.mark.parametrize("sp", [2, 7])
+def test_scaled_metrics_seasonal_period(y_splits, sp):
+    y_train, y_true, y_pred = y_splits
+    expected = _reference_scores(y_train, y_true, y_pred, sp=sp)
+    for m in [mase, rmsse]:
+        assert_frame_equal(
+            m(y_true, y_pred, y_train=y_train, sp=sp).sort("series_id"),
+            expected.select(["series_id", m.__name__]),
+            check_dtype=False,
+        )
+
+
+def test_score_without_y_train(y_splits):
+    y_train, y_true, y_pred = y_splits
+    expected = _reference_scores(y_train, y_true, y_pred)
+    scores = score_point(y_true, y_pred, metrics=["mae", "rmse"], y_train=None)
+    assert_frame_equal(
+        scores.sort("series_id"),
+        expected.select(["series_id", "mae", "rmse"]),
+        check_dtype=False,
+    )
+    with pytest.raises(ValueError, match="y_train"):
+        score_point(y_true, y_pred, metrics=["mae", "mase"], y_train=None)
+    with pytest.raises(ValueError, match="y_train"):
+        score_forecast(y_true, y_pred, y_train=None)
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List, Tuple
 
 import numpy as np
@@ -10,7 +11,18 @@ from polars.testing import assert_frame_equal
 from sklearn.impute import SimpleImputer
 from sklearn.preprocessing import PowerTransformer
 
-from functime.preprocessing import boxcox, diff, impute, lag, roll
+from functime.base import Pipeline
+from functime.preprocessing import (
+    boxcox,
+    diff,
+    impute,
+    lag,
+    lag_matrix,
+    reindex,
+    roll,
+    scale,
+    yeojohnson,
+)
 
 
 @pytest.fixture
@@ -169,6 +181,49 @@ def test_lag(pd_X, lagged_pd_dataframe, benchmark):
     assert_frame_equal(result, pl.DataFrame(expected))
 
 
+def pl_lag_groupby(X: pl.LazyFrame, lags: List[int]) -> pl.LazyFrame:
+    """Lag values per entity with `over`, then drop the first `max(lags)`
+    rows per entity with groupby / slice / explode.
+    """
+    entity_col, time_col = X.columns[:2]
+    return (
+        X.sort(by=[entity_col, time_col])
+        .select(
+            pl.col(entity_col),
+            pl.col(time_col),
+            *[
+                pl.all()
+                .exclude([entity_col, time_col])
+                .shift(lag)
+                .over(entity_col)
+                .suffix(f"__lag_{lag}")
+                for lag in lags
+            ],
+        )
+        .groupby(entity_col)
+        .agg(pl.all().slice(max(lags)))
+        .explode(pl.all().exclude(entity_col))
+    )
+
+
+@pytest.mark.benchmark
+def test_pl_lag_groupby(pd_X, lags, benchmark):
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    benchmark(lambda: pl_lag_groupby(X, lags=lags).collect())
+
+
+def test_lag_matrix(pl_y, lags, benchmark):
+    X = pl_y.collect()
+    X_idx, X_lag = benchmark(lag_matrix, X, lags=lags)
+    expected = lag(lags=lags)(X=X.lazy()).collect()
+    assert X_lag.dtype == np.float32
+    assert_frame_equal(X_idx, expected.select(X.columns[:2]))
+    np.testing.assert_array_equal(
+        X_lag,
+        expected.select(pl.all().exclude(X.columns[:2]).cast(pl.Float32)).to_numpy(),
+    )
+
+
 def test_roll(pd_X, rolling_pd_dataframe, benchmark):
     X = pl.from_pandas(pd_X.reset_index()).lazy()
     window_sizes, stats, df = rolling_pd_dataframe
@@ -179,6 +234,58 @@ def test_roll(pd_X, rolling_pd_dataframe, benchmark):
     assert_frame_equal(result, pl.DataFrame(expected), check_exact=False, rtol=0.01)
 
 
+def test_roll_expanding_ewm(pd_X):
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    transform = roll(
+        window_sizes=[], stats=["mean", "std"], freq="1d", expanding=True, alphas=[0.5]
+    )
+    result = X.pipe(transform).collect()
+    gb = pd_X.groupby(level=0, group_keys=False)
+    expected = {
+        "expanding_mean": gb.apply(lambda x: x.expanding().mean().shift(1)),
+        "expanding_std": gb.apply(lambda x: x.expanding().std().shift(1)),
+        "ewm_mean_0.5": gb.apply(lambda x: x.shift(1).ewm(alpha=0.5).mean()),
+    }
+    for suffix, df in expected.items():
+        np.testing.assert_allclose(
+            result.select([f"{col}__{suffix}" for col in df.columns])
+            .to_numpy()
+            .astype(np.float64),
+            df.to_numpy(),
+            rtol=0.01,
+        )
+
+
+@pytest.mark.parametrize("freq", [None, "1d"])
+def test_reindex(freq):
+    dates = [date(2000, 1, day) for day in range(1, 7)]
+    X = pl.DataFrame(
+        {
+            "entity": ["a", "a", "a", "b", "b"],
+            "time": [dates[i] for i in [0, 2, 3, 2, 5]],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    if freq is None:
+        # Union of timestamps
+        index = [("a", dates[i]) for i in [0, 2, 3, 5]]
+        index += [("b", dates[i]) for i in [0, 2, 3, 5]]
+        values = [1.0, 2.0, 3.0, None, None, 4.0, None, 5.0]
+    else:
+        # Per-entity ranges
+        index = [("a", dates[i]) for i in range(4)]
+        index += [("b", dates[i]) for i in range(2, 6)]
+        values = [1.0, None, 2.0, 3.0, 4.0, None, None, 5.0]
+    expected = pl.DataFrame(
+        {
+            "entity": [entity for entity, _ in index],
+            "time": [time for _, time in index],
+            "value": values,
+        }
+    )
+    assert_frame_equal(reindex(X, freq=freq), expected)
+
+
 @pytest.mark.parametrize(
     "sklearn_method, functime_method, fill_value",
     [
@@ -264,6 +371,100 @@ def test_diff(pd_X, sp):
     )
 
 
+def _split_panel(X: pl.LazyFrame, test_size: int = 5):
+    idx_cols = X.columns[:2]
+    X = X.sort(idx_cols)
+    X_test = X.groupby(idx_cols[0]).tail(test_size)
+    X_train = X.join(X_test, on=idx_cols, how="anti")
+    return X_train, X_test
+
+
+@pytest.mark.parametrize("sp", [1, 2])
+def test_diff_transform_new(pd_X, sp):
+    entity_col, time_col = pd_X.index.names
+    idx_cols = [entity_col, time_col]
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    X_train, X_test = _split_panel(X)
+    transformer = diff(order=1, sp=sp).fit(X_train)
+    result = transformer.transform_new(X_test).sort(idx_cols).collect()
+    # Differencing new data continues from the end of the fitted series
+    expected = (
+        diff(order=1, sp=sp)(X)
+        .join(X_test.select(idx_cols), on=idx_cols, how="semi")
+        .sort(idx_cols)
+        .collect()
+    )
+    assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_scale_transform_new(pd_X):
+    entity_col, time_col = pd_X.index.names
+    idx_cols = [entity_col, time_col]
+    numeric_cols = pd_X.select_dtypes(include=["float"]).columns
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    X_train, X_test = _split_panel(X)
+    transformer = scale().fit(X_train)
+    result = transformer.transform_new(X_test).sort(idx_cols).collect()
+    # New data is scaled with training statistics
+    stats = X_train.groupby(entity_col).agg(
+        [pl.col(col).mean().alias(f"{col}_mean") for col in numeric_cols]
+        + [pl.col(col).std().alias(f"{col}_std") for col in numeric_cols]
+    )
+    expected = (
+        X_test.join(stats, on=entity_col, how="left")
+        .select(
+            idx_cols
+            + [
+                (pl.col(col) - pl.col(f"{col}_mean")) / pl.col(f"{col}_std")
+                for col in numeric_cols
+            ]
+        )
+        .sort(idx_cols)
+        .collect()
+    )
+    assert_frame_equal(result.select(expected.columns), expected)
+    X_original = transformer.invert(result)
+    assert_frame_equal(
+        X_original.select(expected.columns).sort(idx_cols).collect(),
+        X_test.select(expected.columns).sort(idx_cols).collect(),
+        check_dtype=False,
+    )
+
+
+def test_pipeline(pd_X):
+    entity_col, time_col = pd_X.index.names
+    idx_cols = [entity_col, time_col]
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    X = X.select(idx_cols + [pl.col(pl.Float64)])
+    transformers = [
+        lag(lags=[1, 2, 3]),
+        roll(window_sizes=[2, 3], stats=["mean", "std"], freq="1d"),
+    ]
+    pipeline = Pipeline(transformers)
+    result = pipeline(X).collect()
+    # Single sort at the start of the fused plan
+    assert pipeline.explain(X).count("SORT") == 1
+    expected = X.pipe(transformers[0]).pipe(transformers[1]).collect()
+    assert_frame_equal(result, expected)
+
+
+def test_pipeline_invert(pd_X):
+    entity_col, time_col = pd_X.index.names
+    numeric_cols = pd_X.select_dtypes(include=["float"]).columns
+    pd_X = pd_X.assign(**{col: pd_X[col].abs() for col in numeric_cols}).replace(0, 1)
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    X = X.select([entity_col, time_col, *numeric_cols])
+    pipeline = Pipeline([boxcox(), scale()])
+    X_new = pipeline.fit(X).transform_new(X)
+    X_original = pipeline.invert(X_new).sort([entity_col, time_col]).collect()
+    assert_frame_equal(
+        X_original,
+        X.sort([entity_col, time_col]).collect(),
+        check_dtype=False,
+        rtol=1e-4,
+    )
+
+
 def test_boxcox(pd_X):
     entity_col = pd_X.index.names[0]
     numeric_cols = pd_X.select_dtypes(include=["float"]).columns
@@ -281,3 +482,26 @@ def test_boxcox(pd_X):
     assert_frame_equal(X_new, pl.DataFrame(expected.reset_index()))
     X_original = X_new.pipe(transformer.invert)
     assert_frame_equal(X_original, X, check_dtype=False)
+
+
+def test_yeojohnson(pd_X):
+    entity_col = pd_X.index.names[0]
+    numeric_cols = pd_X.select_dtypes(include=["float"]).columns
+    model = PowerTransformer(method="yeo-johnson", standardize=False)
+    expected = pd_X.groupby(entity_col)[numeric_cols].transform(
+        lambda x: np.concatenate(model.fit_transform(x.values.reshape(-1, 1)))
+    )
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    transformer = yeojohnson(n_jobs=2)
+    X_new = X.pipe(transformer).collect()
+    assert_frame_equal(X_new, pl.DataFrame(expected.reset_index()), rtol=1e-4)
+    X_original = X_new.pipe(transformer.invert)
+    assert_frame_equal(X_original, X, check_dtype=False, rtol=1e-4)
+
+
+@pytest.mark.benchmark
+def test_boxcox_mle(pd_X, benchmark):
+    numeric_cols = pd_X.select_dtypes(include=["float"]).columns
+    pd_X = pd_X.assign(**{col: pd_X[col].abs() for col in numeric_cols}).replace(0, 1)
+    X = pl.from_pandas(pd_X.reset_index()).lazy()
+    benchmark(lambda: X.pipe(boxcox(method="mle")).collect())